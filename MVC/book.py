@@ -0,0 +1,209 @@
+import argparse
+import mmap
+import os
+import random
+import struct
+import numpy as np
+from MVC.model import Model
+from MVC.zobrist import zobrist_hash
+
+
+# Localização do livro de aberturas usado pelas IAs
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'opening_book.bin')
+
+# Cabeçalho: assinatura, versão e número de entradas
+_MAGIC = b'JCBK'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQ')
+
+
+def encode_move(move: tuple) -> int:
+    """Codifica uma jogada ((linha, coluna), (linha, coluna)) em 16 bits"""
+    (r1, c1), (r2, c2) = move
+    return (r1 * 6 + c1) * 64 + (r2 * 6 + c2)
+
+
+def decode_move(code: int) -> tuple:
+    """Descodifica uma jogada codificada por encode_move"""
+    start, end = divmod(int(code), 64)
+    return (divmod(start, 6), divmod(end, 6))
+
+
+class OpeningBook:
+    """Livro de aberturas em disco, consultado através de mmap
+
+    Formato: cabeçalho, seguido de três vetores com o mesmo comprimento: chaves de Zobrist
+    ordenadas (uint64), jogadas codificadas (uint16) e pesos (uint16). Uma posição com várias
+    jogadas ocupa entradas consecutivas com a mesma chave.
+    """
+
+    def __init__(self, path: str = DEFAULT_BOOK_PATH) -> None:
+        """Prepara o livro; o ficheiro só é aberto na primeira consulta
+
+        Args:
+            path (str): caminho do ficheiro do livro
+        """
+        self.path = path
+        self.rng = random.Random()
+        self._loaded = False
+        self._mmap = None
+        self.keys = None
+        self.moves = None
+        self.weights = None
+
+    def _load(self) -> None:
+        """Mapeia o ficheiro em memória (sem livro se o ficheiro não existir ou for inválido)"""
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Ficheiro vazio
+                return
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            print(f"Livro de aberturas inválido: {self.path}")
+            return
+        offset = _HEADER.size
+        self.keys = np.frombuffer(self._mmap, dtype='<u8', count=count, offset=offset)
+        offset += 8 * count
+        self.moves = np.frombuffer(self._mmap, dtype='<u2', count=count, offset=offset)
+        offset += 2 * count
+        self.weights = np.frombuffer(self._mmap, dtype='<u2', count=count, offset=offset)
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self._load()
+        return 0 if self.keys is None else len(self.keys)
+
+    def probe(self, board: np.ndarray, turn: int) -> list:
+        """Devolve as jogadas do livro para uma posição
+
+        Args:
+            board (ndarray): tabuleiro do jogo
+            turn (int): jogador a jogar
+
+        Returns:
+            list[tuple(tuple, int)]: pares (jogada, peso); lista vazia se a posição não está no livro
+        """
+        if not self._loaded:
+            self._load()
+        if self.keys is None:
+            return []
+        key = np.uint64(zobrist_hash(board, turn))
+        first = int(np.searchsorted(self.keys, key, side='left'))
+        last = int(np.searchsorted(self.keys, key, side='right'))
+        return [(decode_move(self.moves[i]), int(self.weights[i])) for i in range(first, last)]
+
+    def choose(self, model) -> tuple:
+        """Escolhe uma jogada do livro para a posição do modelo, sorteada pelo peso
+
+        Args:
+            model (Model): modelo do jogo
+
+        Returns:
+            tuple: jogada (start, end), ou None se a posição não estiver no livro
+        """
+        entries = []
+        for move, weight in self.probe(model.game_board, model.turn):
+            start, end = move
+            # Ignora jogadas ilegais (colisão de chaves) e o movimento proibido
+            if not model.is_valid_move(start, end) or (model.cycle_detected and move == model.forbidden_move):
+                continue
+            if (model.game_board[start[0], start[1]] > 0) != (model.turn == 0):
+                continue
+            entries.append((move, weight))
+        if not entries:
+            return None
+        moves, weights = zip(*entries)
+        return self.rng.choices(moves, weights=weights)[0]
+
+    @staticmethod
+    def write(path: str, positions: dict) -> int:
+        """Grava um livro de aberturas
+
+        Args:
+            path (str): caminho do ficheiro
+            positions (dict): chave de Zobrist -> lista de (jogada, peso)
+
+        Returns:
+            int: número de entradas gravadas
+        """
+        rows = sorted((key, encode_move(move), max(1, min(65535, int(weight))))
+                      for key, entries in positions.items() for move, weight in entries)
+        keys = np.array([row[0] for row in rows], dtype='<u8')
+        moves = np.array([row[1] for row in rows], dtype='<u2')
+        weights = np.array([row[2] for row in rows], dtype='<u2')
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(rows)))
+            f.write(keys.tobytes())
+            f.write(moves.tobytes())
+            f.write(weights.tobytes())
+        return len(rows)
+
+
+def build_book(plies: int = 6, depth: int = 5, multipv: int = 2, margin: float = 50.0, verbose: bool = True) -> dict:
+    """Constrói um livro de aberturas a partir de pesquisas profundas nas primeiras jogadas
+
+    Cada posição até plies meias-jogadas é pesquisada em modo multi-PV. As jogadas com
+    pontuação a menos de margin da melhor entram no livro, com peso decrescente com a
+    diferença, e as posições resultantes são expandidas.
+
+    Args:
+        plies (int): número de meias-jogadas cobertas pelo livro
+        depth (int): profundidade da pesquisa em cada posição
+        multipv (int): número máximo de jogadas por posição
+        margin (float): diferença máxima de pontuação para a melhor jogada
+        verbose (bool): imprime o progresso
+
+    Returns:
+        dict: chave de Zobrist -> lista de (jogada, peso)
+    """
+    from MVC.engine import NegamaxAI  # Importação local: o motor consulta este módulo
+
+    model = Model()
+    engine = NegamaxAI(model, depth)
+    engine.book = None  # O construtor não consulta o próprio livro
+    positions = {}
+
+    def expand(ply: int) -> None:
+        key = zobrist_hash(model.game_board, model.turn)
+        if ply >= plies or key in positions or model.is_win()[0]:
+            return
+        entries = engine.get_top_moves(multipv, depth)
+        if not entries:
+            return
+        best_score = entries[0]['score']
+        book_moves = []
+        for entry in entries:
+            loss = best_score - entry['score']
+            if loss <= margin:
+                book_moves.append((entry['move'], 1000 / (1 + loss / 10)))
+        positions[key] = book_moves
+        if verbose:
+            print(f"ply {ply}: {len(positions)} posições, {[move for move, _ in book_moves]}")
+
+        for (start, end), _ in book_moves:
+            captured = model.make_move(start, end)
+            model.turn = 1 - model.turn
+            expand(ply + 1)
+            model.turn = 1 - model.turn
+            model.unmake_move(start, end, captured)
+
+    expand(0)
+    return positions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Constrói o livro de aberturas')
+    parser.add_argument('--plies', type=int, default=6, help='meias-jogadas cobertas pelo livro')
+    parser.add_argument('--depth', type=int, default=5, help='profundidade da pesquisa por posição')
+    parser.add_argument('--multipv', type=int, default=2, help='jogadas por posição')
+    parser.add_argument('--margin', type=float, default=50.0, help='diferença máxima para a melhor jogada')
+    parser.add_argument('--output', default=DEFAULT_BOOK_PATH, help='ficheiro de saída')
+    args = parser.parse_args()
+
+    book = build_book(args.plies, args.depth, args.multipv, args.margin)
+    count = OpeningBook.write(args.output, book)
+    print(f"{len(book)} posições, {count} entradas gravadas em {args.output}")
@@ -0,0 +1,94 @@
+from array import array
+
+
+class EvaluationCache:
+    """Cache de avaliações de capacidade fixa, indexada por chaves de Zobrist de 64 bits
+
+    As entradas vivem em arrays contíguos, agrupadas em conjuntos de ways posições
+    escolhidos pelos bits baixos da chave; a chave completa é guardada e comparada em
+    cada consulta, por isso colisões de índice nunca devolvem a avaliação de outra
+    posição. Num conjunto cheio, a entrada a substituir é escolhida pelo algoritmo do
+    relógio: as entradas consultadas desde a última passagem têm uma segunda
+    oportunidade.
+
+    Args:
+        capacity (int): número máximo de entradas (arredondado para uma potência de 2)
+        ways (int): entradas por conjunto
+    """
+    EMPTY, USED, REFERENCED = 0, 1, 2
+
+    def __init__(self, capacity: int = 1 << 16, ways: int = 4):
+        capacity = max(capacity, ways)
+        self.ways = ways
+        self.sets = 1 << ((capacity // ways).bit_length() - 1)
+        self.capacity = self.sets * ways
+        self.keys = array('Q', bytes(8 * self.capacity))
+        self.values = array('d', bytes(8 * self.capacity))
+        self.state = bytearray(self.capacity)  # EMPTY, USED ou REFERENCED
+        self.hands = bytearray(self.sets)  # Ponteiro do relógio de cada conjunto
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: int):
+        """Devolve a avaliação guardada para key, ou None se não existir"""
+        base = (key & (self.sets - 1)) * self.ways
+        for slot in range(base, base + self.ways):
+            if self.state[slot] and self.keys[slot] == key:
+                self.state[slot] = self.REFERENCED
+                self.hits += 1
+                return self.values[slot]
+        self.misses += 1
+        return None
+
+    def put(self, key: int, value: float) -> None:
+        """Guarda a avaliação de key, substituindo uma entrada do conjunto se estiver cheio"""
+        index = key & (self.sets - 1)
+        base = index * self.ways
+        for slot in range(base, base + self.ways):
+            if not self.state[slot] or self.keys[slot] == key:
+                break
+        else:
+            # Relógio: limpa a marca das entradas referenciadas até encontrar uma que não o esteja
+            hand = self.hands[index]
+            while self.state[base + hand] == self.REFERENCED:
+                self.state[base + hand] = self.USED
+                hand = (hand + 1) % self.ways
+            slot = base + hand
+            self.hands[index] = (hand + 1) % self.ways
+            self.evictions += 1
+        self.keys[slot] = key
+        self.values[slot] = value
+        if not self.state[slot]:
+            self.state[slot] = self.USED
+
+    def clear(self) -> None:
+        """Esvazia a cache e as estatísticas (por exemplo, quando mudam os pesos da avaliação)"""
+        self.state = bytearray(self.capacity)
+        self.hands = bytearray(self.sets)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return self.capacity - self.state.count(self.EMPTY)
+
+    def memory(self) -> int:
+        """Memória ocupada pelos arrays da cache, em bytes"""
+        return (self.keys.itemsize * len(self.keys) + self.values.itemsize * len(self.values)
+                + len(self.state) + len(self.hands))
+
+    def stats(self) -> dict:
+        """Estatísticas de utilização
+
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'evictions', 'entries', 'capacity', 'memory'}
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self),
+                'capacity': self.capacity,
+                'memory': self.memory()}
@@ -1,48 +1,69 @@
-from MVC.model import Model, AI, RandomAI, NegamaxAI
+from MVC.session import GameSession
 from MVC.view import View
+import copy
 import time
 import pygame as pg
 from assets.consts import Consts
 from MVC.save_manager import SaveManager
+from MVC.scheduler import Scheduler
+from MVC.worker import EngineWorker
 import numpy as np
 
 
+# Velocidades do modo IAxIA: (nome, pausa entre jogadas em segundos, desenhar a cada N jogadas;
+# 0 desenha só no fim de cada jogo). Nas velocidades aceleradas as IAs jogam sem pausa e os jogos
+# recomeçam sozinhos; a 10x o tabuleiro é desenhado de 10 em 10 jogadas
+AIXAI_SPEEDS = [('1x', 0.5, 1), ('10x', 0.0, 10), ('Máx', 0.0, 0)]
+AIXAI_MAX_PLIES = 200  # Nas velocidades aceleradas, jogos mais longos contam como empate
+
+
 class Controller:
     def __init__(self, is_pve: bool, ai_type: str = "minimax", depth: int = 4, blue_ai: tuple = None, red_ai: tuple = None, start_loop: bool = True):
         """Inicia o componente Controlador
 
         Args:
             is_pve (bool): deve o jogo usar lógica PvE ou PvP
-            ai_type (str): tipo de IA a ser usada (default: "minimax")
-            depth (int): profundidade do algoritmo minimax (default: 4)
+            ai_type (str): tipo de IA a ser usada: "minimax", "negamax", "mcts" ou "random" (default: "minimax")
+            depth (int): profundidade do algoritmo minimax, ou número de simulações do MCTS (default: 4)
             blue_ai (tuple): configuração da IA para o jogador azul no modo IAxIA (default: None)
             red_ai (tuple): configuração da IA para o jogador vermelho no modo IAxIA (default: None)
             start_loop (bool): inicia o loop principal automaticamente (default: True)
         """
-        self.model = Model()
         self.view = View()
         self.is_pve = is_pve
         self.ai_type = ai_type
+        self.workers = []  # Processos onde as IAs pesquisam (ver MVC/worker.py)
+        self.scheduler = Scheduler()  # Ações adiadas: próxima jogada da IA, mensagens e mudanças de ecrã
+        self.message = None  # Mensagem temporária (texto, cor) desenhada sobre o tabuleiro
         
-        # Inicializa as IAs apropriadas
+        # A partida (modelo, IAs e regras) fica na GameSession; o controlador só desenha e lê eventos.
+        # As pesquisas correm em processos separados, com a mesma configuração das IAs da sessão,
+        # para a interface continuar a responder enquanto a IA pensa
         if blue_ai is not None and red_ai is not None:  # Modo IAxIA
-            self.blue_ai = self._create_ai(blue_ai)
-            self.red_ai = self._create_ai(red_ai)
+            self.session = GameSession(blue_ai, red_ai, seed=42, break_cycles=True)  # Semente fixa para reprodutibilidade
+            self.blue_ai, self.red_ai = self.session.ais
+            self.blue_worker = self._create_worker(self.blue_ai, seed=42)
+            self.red_worker = self._create_worker(self.red_ai, seed=42)
             self.is_aixai = True
             self.view.is_aixai = True  # Define a flag na View
-            # Adiciona controle de movimentos repetidos
-            self.last_moves = []  # Lista para armazenar os últimos movimentos
-            self.forbidden_move = None  # Movimento proibido após 3 repetições
+            # Velocidade (índice em AIXAI_SPEEDS) e estatísticas dos jogos
+            self.speed = 0
+            self.results = {'Azul': 0, 'Vermelho': 0, None: 0}  # Vitórias por jogador; None conta os empates
+            self.think_time = 0.0  # Tempo total das IAs a pensar, do pedido ao resultado
+            self.think_count = 0
+            self.aixai_start_time = time.perf_counter()
         elif is_pve:
-            if ai_type == "minimax":
-                self.ai = AI(self.model, depth)
-            elif ai_type == "negamax":
-                self.ai = NegamaxAI(self.model, depth)
-            else:  # random
-                self.ai = RandomAI(self.model)
+            self.session = GameSession(None, (ai_type, depth))
+            self.ai = self.session.ais[1]
+            self.worker = self._create_worker(self.ai)
+            self.ponder = True  # A IA pensa no tempo do humano, na resposta que prevê para ele
+            self.ponder_move = None  # Jogada do humano cuja resposta está a ser pesquisada
             self.is_aixai = False
         else:
+            self.session = GameSession()
             self.is_aixai = False
+        self.model = self.session.model
+        self.session.subscribe(self.on_session_event)
         
         pg.event.set_blocked([pg.MOUSEMOTION])
         
@@ -50,31 +71,77 @@ class Controller:
         if start_loop:
             self.main_loop()
     
-    def _create_ai(self, ai_config):
-        """Cria uma instância de IA baseada na configuração fornecida
+    def _create_worker(self, ai, seed: int = None) -> EngineWorker:
+        """Cria o processo de pesquisa de uma IA, com o mesmo tipo e nível
         
         Args:
-            ai_config (tuple/str): Configuração da IA ("random" ou (tipo, profundidade))
+            ai: Instância de Engine, MCTSAI ou RandomAI
+            seed (int, optional): semente da IA aleatória
             
         Returns:
-            AI/NegamaxAI/RandomAI: Instância da IA criada
+            EngineWorker: processo da IA
         """
-        if ai_config == "random":
-            return RandomAI(self.model, seed=42)  # Usa semente fixa 42 para reprodutibilidade
+        ai_type, level = SaveManager.describe_ai(ai)
+        worker = EngineWorker(ai_type, level, seed)
+        self.workers.append(worker)
+        return worker
+    
+    def on_session_event(self, event: str, data: dict):
+        """Acompanha os eventos da partida na interface
+
+        Args:
+            event (str): evento da GameSession
+            data (dict): dados do evento
+        """
+        if event == GameSession.TURN:
+            self.view.switch_turn(data['turn'])
+    
+    def start_pondering(self, ponder_move: tuple):
+        """Começa a pesquisar, no tempo do humano, a resposta à jogada que a IA prevê para ele
+
+        Se o humano fizer a jogada prevista, a pesquisa em curso continua e dá a resposta da IA;
+        se fizer outra, é cancelada.
+
+        Args:
+            ponder_move (tuple): jogada (start, end) prevista para o humano, ou None
+        """
+        if not self.ponder or ponder_move is None or not self.model.is_valid_move(*ponder_move):
+            return
+        predicted = copy.deepcopy(self.model)
+        predicted.perform_move(*ponder_move)
+        if predicted.is_win()[0]:
+            return
+        predicted.switch_turn()
+        self.worker.request(predicted)
+        self.ponder_move = ponder_move
+    
+    def request_ai_move(self):
+        """Pede à IA do jogador a jogar a jogada para a posição atual"""
+        self.request_time = time.perf_counter()
+        if self.is_aixai:
+            worker = self.blue_worker if self.model.turn == 0 else self.red_worker
         else:
-            ai_type, depth = ai_config
-            if ai_type == "minimax":
-                return AI(self.model, depth)
-            elif ai_type == "negamax":
-                return NegamaxAI(self.model, depth)
-            else:
-                # Fallback para RandomAI em caso de tipo desconhecido
-                return RandomAI(self.model, seed=42)
+            worker = self.worker
+        worker.request(self.model)
+    
+    def go_to_main_menu(self):
+        """Termina o jogo, cancelando as pesquisas e as ações agendadas, e volta ao menu principal"""
+        self.close_workers()
+        self.scheduler.clear()
+        pg.display.quit()
+        from screens.main_menu import MainMenu
+        main_menu = MainMenu()
+    
+    def close_workers(self):
+        """Cancela as pesquisas em curso e termina os processos das IAs"""
+        for worker in self.workers:
+            worker.close()
     
     def main_loop(self):
         """Loop principal do jogo
         """
         while True:
+            self.scheduler.update()  # Executa as ações agendadas que já venceram
             if self.is_aixai:  # Modo IAxIA
                 self.aixai_game_loop()   # Chama a lógica de jogo IAxIA
             elif self.is_pve:    # Deve usar lógica de jogo PvE ou PvP
@@ -94,6 +161,7 @@ class Controller:
         # Também desenha possíveis movimentos se uma peça já estiver selecionada
         if self.model.selected_game_piece is not None and self.model.moves:
             self.view.draw_possible_moves(self.model.moves)
+        self.draw_message()
         
         pg.display.flip()
 
@@ -111,44 +179,46 @@ class Controller:
                 self.handle(ev_type)    # Processa o evento
 
         elif turn == 1:
-            # turno para a IA
-            time.sleep(0.2)  # Pequena pausa para melhor experiência do utilizador
+            # turno para a IA: a pesquisa corre no processo da IA e o resultado é lido a cada frame
+            if self.ponder_move is not None:
+                # Se o humano jogou a jogada prevista, a pesquisa feita no tempo dele é a desta
+                # posição e continua; caso contrário é descartada
+                if self.model.last_move_coords != self.ponder_move:
+                    self.worker.cancel()
+                self.ponder_move = None
+            if not self.worker.searching and not self.scheduler.is_pending('ai_move') and not self.session.finished:
+                # Pequena pausa para melhor experiência do utilizador, sem bloquear a interface
+                self.scheduler.schedule(0.2, self.request_ai_move, 'ai_move')
             
-            # Atualiza o temporizador antes de começar o processamento da IA
-            self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-            pg.display.flip()
+            # Os botões e o fecho da janela continuam a responder enquanto a IA pensa
+            for event in pg.event.get():
+                self.handle(event.type)
             
-            # Obtém o melhor movimento da IA
-            best_move = self.ai.get_best_move()
+            result = self.worker.poll()
+            if result is None:
+                # Sem resultado ainda: o tabuleiro e o temporizador voltam a ser desenhados no frame seguinte
+                self.view.clock.tick(Consts.FPS)
+                return
+            ponder_move = result[2]
             
-            # Atualiza o temporizador após o processamento da IA
+            # A sessão aplica a jogada e as regras de fim de jogo; sem jogadas, a partida fica empatada
+            finished = self.session.apply_ai_result(result)
             self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-            pg.display.flip()
-            
-            if best_move:
-                start, end = best_move
-                self.model.perform_move(start, end)
+            if finished:
+                play_again_button, main_menu_button = self.view.draw_win_message(self.session.winner)
                 self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-                is_win = self.model.is_win()
-                if is_win[0]:
-                    play_again_button, main_menu_button = self.view.draw_win_message(is_win[1])
-                    self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-                    while True:
-                        for event in pg.event.get():
-                            if event.type == pg.MOUSEBUTTONDOWN:
-                                if play_again_button.is_over(pg.mouse.get_pos()):
-                                    self.reset_game()
-                                elif main_menu_button.is_over(pg.mouse.get_pos()):
-                                    pg.display.quit()
-                                    time.sleep(0.2)
-                                    from screens.main_menu import MainMenu
-                                    main_menu = MainMenu()
-                            if event == pg.QUIT:
-                                pg.quit()
-                                quit()
-                else:
-                    self.model.switch_turn()
-                    self.view.switch_turn(self.model.turn)
+                while True:
+                    for event in pg.event.get():
+                        if event.type == pg.MOUSEBUTTONDOWN:
+                            if play_again_button.is_over(pg.mouse.get_pos()):
+                                self.reset_game()
+                            elif main_menu_button.is_over(pg.mouse.get_pos()):
+                                self.go_to_main_menu()
+                        if event == pg.QUIT:
+                            pg.quit()
+                            quit()
+            else:
+                self.start_pondering(ponder_move)
         
         self.view.clock.tick(Consts.FPS)
 
@@ -159,6 +229,7 @@ class Controller:
             for event in pg.event.get():
                 ev_type = event.type    # Obtém o tipo de evento
                 self.view.draw_board(self.model.game_board, self.model.last_move_coords)    # Desenha o tabuleiro
+                self.draw_message()
                 self.handle(ev_type)    # Processa o evento
                 
         if turn == 1:
@@ -166,6 +237,7 @@ class Controller:
             for event in pg.event.get():
                 ev_type = event.type    # Obtém o tipo de evento
                 self.view.draw_board(self.model.game_board, self.model.last_move_coords)     # Desenha o tabuleiro
+                self.draw_message()
                 self.handle(ev_type)    # Processa o evento
 
     def turn_logic_human(self, row, col):
@@ -176,13 +248,13 @@ class Controller:
             col (int): coluna selecionada
         """
         if self.model.is_choosing_current_move((row, col)):     # Verifica se o movimento selecionado está na lista de movimentos atuais
-                        self.model.perform_move(self.model.selected_game_piece, (row, col))     # Executa o movimento no modelo
+                        # Executa o movimento na sessão, que verifica a vitória e muda o turno (de Azul para Vermelho e vice-versa)
+                        finished = self.session.apply_move(self.model.selected_game_piece, (row, col))
                         self.view.draw_board(self.model.game_board, self.model.last_move_coords)     # Desenha o tabuleiro atualizado no ecrã usando o componente view
                         self.model.moves = []       # Reinicia a lista de movimentos atuais
                         self.model.selected_game_piece = None       # Reinicia a peça selecionada
-                        is_win = self.model.is_win()        # Obtém dados da vitória
-                        if is_win[0]:       # Verifica se há vitória
-                            play_again_button, main_menu_button = self.view.draw_win_message(is_win[1])         # Desenha mensagem de vitória e obtém referências para ambos os botões
+                        if finished:       # Verifica se há vitória
+                            play_again_button, main_menu_button = self.view.draw_win_message(self.session.winner)         # Desenha mensagem de vitória e obtém referências para ambos os botões
                             self.view.draw_board(self.model.game_board, self.model.last_move_coords)         # Desenha o tabuleiro atualizado
                             while True:     # Cria novo listener de eventos para novos botões
                                 for event in pg.event.get():
@@ -191,16 +263,10 @@ class Controller:
                                             self.reset_game()
                                             
                                         elif main_menu_button.is_over(pg.mouse.get_pos()):
-                                            pg.display.quit()
-                                            time.sleep(0.2)
-                                            from screens.main_menu import MainMenu
-                                            main_menu = MainMenu()
+                                            self.go_to_main_menu()
                                     if event == pg.QUIT:
                                         pg.quit()
                                         quit()
-                        else:       # Se não houver vencedor
-                            self.model.switch_turn()        # Muda o turno, de Azul para Vermelho e vice-versa
-                            self.view.switch_turn(self.model.turn)      # Muda a mensagem de turno no componente view               
         else:       # Se estiver a escolher uma casa que não está na lista de movimentos atuais
             if self.model.is_selecting_valid_game_piece((row, col)):    # E estiver a escolher outra peça válida
                 self.model.moves = self.model.get_possible_moves((row, col))    # Atualiza a lista de movimentos atuais
@@ -216,17 +282,15 @@ class Controller:
         """
         if event is pg.QUIT:
             # Processa clique no botão de sair do SO
+            self.close_workers()
             pg.quit()
             quit()
         
         elif event == pg.MOUSEBUTTONDOWN:
             mouse_loc = pg.mouse.get_pos() # Obtém posição do rato
             if self.view.close_button.is_over(mouse_loc):
-                # Processa clique no botão de sair do jogo
-                pg.display.quit()
-                time.sleep(0.2)
-                from screens.main_menu import MainMenu
-                main_menu = MainMenu()
+                # Processa clique no botão de sair do jogo: volta ao menu no próximo frame
+                self.scheduler.schedule(0, self.go_to_main_menu, 'transition')
             elif self.view.save_button.is_over(mouse_loc):
                 # Processa clique no botão Guardar
                 game_state = SaveManager.prepare_game_state(self)
@@ -236,6 +300,9 @@ class Controller:
                 else:
                     # Exibe mensagem de erro temporária
                     self.show_save_message("Erro ao salvar o jogo!", error=True)
+            elif self.is_pve and self.model.turn == 1:
+                # Ignora cliques no tabuleiro enquanto a IA pensa
+                pass
             else:
                 # Processa clique no ecrã, não no botão de sair
                 col, row = self.view.mouse_to_board(mouse_loc) # Obtém linha e coluna selecionadas
@@ -255,23 +322,36 @@ class Controller:
         """
         # Define a cor da mensagem (verde para sucesso, vermelho para erro)
         color = (255, 0, 0) if error else (0, 128, 0)
-        
-        # Renderiza a mensagem
-        font = pg.font.Font(None, 36)
-        text = font.render(message, True, color)
-        text_rect = text.get_rect(center=(500, 500))
+        self.message = (message, color)
         
         # Desenha a mensagem na tela
-        self.view.display.blit(text, text_rect)
+        self.draw_message()
         pg.display.flip()
         
-        # Espera um segundo antes de continuar
-        pg.time.wait(1000)
+        # Apaga a mensagem ao fim de um segundo, sem parar o jogo
+        self.scheduler.schedule(1.0, self.clear_message, 'message')
+    
+    def draw_message(self):
+        """Desenha a mensagem temporária sobre o tabuleiro, se houver"""
+        if self.message is None:
+            return
+        message, color = self.message
+        
+        # Renderiza a mensagem com a fonte carregada uma vez em Consts (é redesenhada a cada frame)
+        text = Consts.text_font.render(message, True, color)
+        text_rect = text.get_rect(center=(500, 500))
+        self.view.display.blit(text, text_rect)
+    
+    def clear_message(self):
+        """Apaga a mensagem temporária, redesenhando o tabuleiro"""
+        self.message = None
+        self.view.draw_board(self.model.game_board, self.model.last_move_coords)
+        pg.display.flip()
 
     def reset_game(self):
         """Reinicia o jogo
         """
-        self.model.reset()
+        self.session.reset()
         self.view.start_time = pg.time.get_ticks()  # Reinicia o temporizador usando pygame.time.get_ticks()
         self.view.last_update = 0
         self.view.elapsed_time = 0
@@ -280,6 +360,11 @@ class Controller:
         # Armazena as configurações atuais para recriação
         is_aixai = self.is_aixai
         
+        # Cancela as pesquisas e as ações agendadas da posição anterior
+        self.close_workers()
+        self.scheduler.clear()
+        self.message = None
+        
         if is_aixai:
             # Se for modo IAxIA, armazena as configurações das IAs
             blue_ai_instance = self.blue_ai
@@ -287,35 +372,23 @@ class Controller:
             
             # Fecha a tela atual
             pg.display.quit()
-            time.sleep(0.2)
             
             # Cria um novo controlador com as mesmas IAs
-            if isinstance(blue_ai_instance, RandomAI):
-                blue_ai_config = "random"
-            elif isinstance(blue_ai_instance, AI):
-                blue_ai_config = ("minimax", blue_ai_instance.max_depth)
-            elif isinstance(blue_ai_instance, NegamaxAI):
-                blue_ai_config = ("negamax", blue_ai_instance.max_depth)
-                
-            if isinstance(red_ai_instance, RandomAI):
-                red_ai_config = "random"
-            elif isinstance(red_ai_instance, AI):
-                red_ai_config = ("minimax", red_ai_instance.max_depth)
-            elif isinstance(red_ai_instance, NegamaxAI):
-                red_ai_config = ("negamax", red_ai_instance.max_depth)
+            blue_ai_config = SaveManager.ai_config(blue_ai_instance)
+            red_ai_config = SaveManager.ai_config(red_ai_instance)
                 
             # Cria um novo jogo com as mesmas configurações
             from MVC.controller import Controller
             new_controller = Controller(True, "aixai", blue_ai=blue_ai_config, red_ai=red_ai_config)
         else:
             # Para outros modos, apenas reseta o jogo
-            self.model.reset()
             self.view.reset()
+            if self.is_pve:
+                self.ponder_move = None
             
             # Inicializa os contadores para detecção de ciclos
             self.model.last_moves = []
             self.model.forbidden_move = None
-            self.model.move_history = []
             self.model.cycle_detected = False
             
             # Retorna ao início do loop principal
@@ -324,142 +397,119 @@ class Controller:
     def aixai_game_loop(self):
         """Loop principal do jogo IAxIA"""
         while True:
+            self.scheduler.update()  # Executa as ações agendadas que já venceram
+            
             # Processa eventos do pygame
             for event in pg.event.get():
                 if event.type == pg.QUIT:
+                    self.close_workers()
                     pg.quit()
                     quit()
                 elif event.type == pg.MOUSEBUTTONDOWN:
                     mouse_loc = pg.mouse.get_pos()
                     if self.view.close_button.is_over(mouse_loc):
-                        pg.display.quit()
-                        time.sleep(0.2)
-                        from screens.main_menu import MainMenu
-                        main_menu = MainMenu()
+                        # Volta ao menu no próximo frame
+                        self.scheduler.schedule(0, self.go_to_main_menu, 'transition')
                     elif self.view.stop_button.is_over(mouse_loc) and not self.view.is_paused:
                         self.view.is_paused = True
                         self.view.show_resume_button = True  # Mostra o botão resume quando pausa
+                        # Cancela a pesquisa em curso e a jogada agendada; ao retomar, a IA volta a pesquisar a posição
+                        self.scheduler.cancel('ai_move')
+                        self.blue_worker.cancel()
+                        self.red_worker.cancel()
                     elif self.view.resume_button.is_over(mouse_loc) and self.view.is_paused:
                         self.view.is_paused = False
                         self.view.show_resume_button = False  # Esconde o botão resume quando resume
+                    elif self.view.speed_button.is_over(mouse_loc):
+                        # Passa à velocidade seguinte
+                        self.speed = (self.speed + 1) % len(AIXAI_SPEEDS)
+                        self.view.speed_button.text = AIXAI_SPEEDS[self.speed][0]
             
             # Se o jogo estiver pausado, continua o loop sem fazer movimentos
             if self.view.is_paused:
-                self.view.draw_board(self.model.game_board, self.model.last_move_coords)
+                self.draw_aixai()
                 self.view.clock.tick(Consts.FPS)
                 continue
             
-            # Seleciona a IA apropriada baseada no turno
-            current_ai = self.blue_ai if self.model.turn == 0 else self.red_ai
+            # Seleciona a IA apropriada baseada no turno e pede-lhe a jogada, se ainda não o fez
+            _, move_delay, render_interval = AIXAI_SPEEDS[self.speed]
+            self.session.max_plies = AIXAI_MAX_PLIES if self.speed > 0 else None
+            current_worker = self.blue_worker if self.model.turn == 0 else self.red_worker
+            if not current_worker.searching and not self.scheduler.is_pending('ai_move'):
+                self.request_ai_move()
             
-            # Atualiza o temporizador antes de começar o processamento da IA
-            self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-            pg.display.flip()
+            # Lê o resultado da pesquisa. A velocidade normal desenha e espera pelo frame seguinte;
+            # nas aceleradas, sem desenhar, espera pelo resultado até à duração de um frame
+            if render_interval == 1:
+                self.draw_aixai()  # Atualiza o temporizador enquanto a IA pensa
+                result = current_worker.poll()
+            else:
+                result = current_worker.poll(1 / Consts.FPS)
+            if result is None:
+                if render_interval == 1:
+                    self.view.clock.tick(Consts.FPS)
+                continue
+            self.think_time += time.perf_counter() - self.request_time
+            self.think_count += 1
             
-            # Obtém e executa o melhor movimento
-            best_move = current_ai.get_best_move()
+            # A sessão troca o movimento proibido por repetição e, num ciclo entre os dois
+            # jogadores, força a jogada alternativa; sem jogada permitida, a partida é empate
+            if self.session.apply_ai_result(result):
+                if self.speed > 0:
+                    # Nas velocidades aceleradas regista o resultado e começa logo o jogo seguinte
+                    # (os jogos que chegam a AIXAI_MAX_PLIES meias-jogadas são empates)
+                    self.finish_aixai_game(self.session.winner)
+                    continue
+                self.view.draw_board(self.model.game_board, self.model.last_move_coords)
+                play_again_button, main_menu_button = self.view.draw_win_message(self.session.winner)
+                self.view.draw_board(self.model.game_board, self.model.last_move_coords)
+                while True:
+                    for event in pg.event.get():
+                        if event.type == pg.MOUSEBUTTONDOWN:
+                            if play_again_button.is_over(pg.mouse.get_pos()):
+                                self.reset_game()
+                            elif main_menu_button.is_over(pg.mouse.get_pos()):
+                                self.go_to_main_menu()
+                        if event == pg.QUIT:
+                            pg.quit()
+                            quit()
             
-            # Atualiza o temporizador após o processamento da IA
-            self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-            pg.display.flip()
+            if render_interval > 1 and self.session.plies % render_interval == 0:
+                self.draw_aixai()
             
-            if best_move:
-                start, end = best_move
-                
-                # Verifica se o movimento está proibido devido a repetição do mesmo jogador
-                if self.model.forbidden_move and (start, end) == self.model.forbidden_move:
-                    # Se estiver proibido, tenta obter outro movimento
-                    best_move = current_ai.get_alternative_move()
-                    if best_move:
-                        start, end = best_move
-                    else:
-                        # Se não houver alternativa, o jogo termina
-                        break
-                
-                # Verifica se foi detectado um ciclo entre os dois jogadores
-                if self.model.cycle_detected:
-                    # Se um ciclo foi detectado, força um movimento alternativo
-                    alternative_move = current_ai.get_alternative_move()
-                    if alternative_move:
-                        start, end = alternative_move
-                        # Reseta o estado de detecção de ciclo após forçar um movimento alternativo
-                        self.model.cycle_detected = False
-                        self.model.move_history = []
-                    else:
-                        # Se não houver alternativa, o jogo termina
-                        break
-                
-                # Verifica se é um movimento vitorioso
-                if self.model.is_winning_move(start, end):
-                    self.model.perform_move(start, end)
-                    self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-                    is_win = self.model.is_win()
-                    if is_win[0]:
-                        play_again_button, main_menu_button = self.view.draw_win_message(is_win[1])
-                        self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-                        while True:
-                            for event in pg.event.get():
-                                if event.type == pg.MOUSEBUTTONDOWN:
-                                    if play_again_button.is_over(pg.mouse.get_pos()):
-                                        self.reset_game()
-                                    elif main_menu_button.is_over(pg.mouse.get_pos()):
-                                        pg.display.quit()
-                                        time.sleep(0.2)
-                                        from screens.main_menu import MainMenu
-                                        main_menu = MainMenu()
-                                if event == pg.QUIT:
-                                    pg.quit()
-                                    quit()
-                        break
-                
-                # Executa o movimento
-                self.model.perform_move(start, end)
-                self.view.draw_board(self.model.game_board, self.model.last_move_coords)
-                
-                # Atualiza o controle de movimentos repetidos do mesmo jogador
-                self.model.last_moves.append((start, end))
-                if len(self.model.last_moves) > 3:
-                    self.model.last_moves.pop(0)
-                
-                # Verifica se houve 3 movimentos iguais do mesmo jogador
-                if len(self.model.last_moves) == 3 and all(move == self.model.last_moves[0] for move in self.model.last_moves):
-                    self.model.forbidden_move = self.model.last_moves[0]
-                    # Limpa a lista de movimentos após proibir um movimento
-                    self.model.last_moves = []
-                
-                # Atualiza o histórico de movimentos para detecção de ciclos entre jogadores
-                self.model.move_history.append((self.model.turn, start, end))
-                
-                # Detecta ciclos de 3 movimentos por jogador (6 movimentos no total)
-                if len(self.model.move_history) >= 6:
-                    # Verifica se há um padrão repetitivo com os últimos 6 movimentos
-                    # O padrão deve ser: jogador1-jogada1, jogador2-jogada2, jogador1-jogada1, jogador2-jogada2, jogador1-jogada1, jogador2-jogada2
-                    last_6_moves = self.model.move_history[-6:]
-                    
-                    # Verifica se os turnos alternam corretamente
-                    turns_alternate = all(last_6_moves[i][0] != last_6_moves[i+1][0] for i in range(5))
-                    
-                    # Verifica se os mesmos movimentos estão sendo repetidos
-                    player1_moves_same = (last_6_moves[0][1:] == last_6_moves[2][1:] == last_6_moves[4][1:])
-                    player2_moves_same = (last_6_moves[1][1:] == last_6_moves[3][1:] == last_6_moves[5][1:])
-                    
-                    if turns_alternate and player1_moves_same and player2_moves_same:
-                        # Ciclo detectado - marca para forçar um movimento diferente no próximo turno
-                        self.model.cycle_detected = True
-                        # Limita o tamanho do histórico para evitar crescimento excessivo
-                        self.model.move_history = self.model.move_history[-6:]
-                    
-                    # Limita o tamanho do histórico para evitar crescimento excessivo
-                    if len(self.model.move_history) > 10:
-                        self.model.move_history = self.model.move_history[-10:]
-                
-                self.model.switch_turn()
-                time.sleep(0.5)  # Pequena pausa para visualização
-            else:
-                # Se não houver movimentos possíveis, o jogo termina
-                break
-                
-            self.view.clock.tick(Consts.FPS)
+            # Pausa para visualização antes de pedir a jogada seguinte, sem bloquear a interface;
+            # sem pausa, a jogada seguinte é pedida logo na próxima iteração
+            if move_delay > 0:
+                self.scheduler.schedule(move_delay, self.request_ai_move, 'ai_move')
+            
+            if render_interval == 1:
+                self.view.clock.tick(Consts.FPS)
+    
+    def finish_aixai_game(self, winner: str):
+        """Regista o resultado de um jogo IAxIA acelerado e começa o seguinte
+
+        Args:
+            winner (str): 'Azul', 'Vermelho' ou None para um empate
+        """
+        self.results[winner] += 1
+        self.draw_aixai()  # Mostra sempre a posição final
+        self.session.reset()
+        self.view.switch_turn(self.model.turn)
+        self.scheduler.cancel('ai_move')
+    
+    def draw_aixai(self):
+        """Desenha o tabuleiro do modo IAxIA com a velocidade e as estatísticas dos jogos"""
+        self.view.draw_board(self.model.game_board, self.model.last_move_coords)
+        games = sum(self.results.values())
+        minutes = (time.perf_counter() - self.aixai_start_time) / 60
+        average_think = self.think_time / self.think_count if self.think_count else 0.0
+        self.view.draw_aixai_stats([f"Jogos: {games}",
+                                    f"Vitórias azuis: {self.results['Azul']}",
+                                    f"Vitórias vermelhas: {self.results['Vermelho']}",
+                                    f"Empates: {self.results[None]}",
+                                    f"Jogos por minuto: {games / minutes if minutes > 0 else 0.0:.1f}",
+                                    f"Tempo médio por jogada: {average_think * 1000:.0f} ms"])
+        pg.display.flip()
 
     @staticmethod
     def load_saved_game():
@@ -493,16 +543,25 @@ class Controller:
             controller = Controller(False, start_loop=False)
         
         # Atualiza o estado do jogo na nova instância
-        controller.model.game_board = np.array(game_state['game_board'], dtype=int)
+        controller.model.set_board(np.array(game_state['game_board'], dtype=int))
         controller.model.turn = game_state['turn']
         controller.model.selected_game_piece = game_state['selected_game_piece']
         controller.model.moves = game_state['moves']
         controller.model.last_move_coords = game_state['last_move_coords']
         controller.model.last_moves = game_state['last_moves']
         controller.model.forbidden_move = game_state['forbidden_move']
-        controller.model.move_history = game_state['move_history']
         controller.model.cycle_detected = game_state['cycle_detected']
         
+        # Reconstrói o histórico de posições usado nas regras de repetição
+        controller.model.repetitions.clear()
+        if 'repetitions' in game_state:
+            for key in game_state['repetitions']:
+                controller.model.repetitions.push(key)
+        else:
+            # Jogos salvos sem o histórico: as repetições e os ciclos deixam de se referir a ele
+            controller.model.forbidden_move = None
+            controller.model.cycle_detected = False
+        
         # Atualiza o tempo de jogo
         controller.view.elapsed_time = game_state['elapsed_time']
         controller.view.game_time = game_state['game_time']
@@ -0,0 +1,116 @@
+from collections import deque
+import numpy as np
+
+
+# Classes de movimento: o rato anda em terra e no rio, o leão salta o rio e as restantes peças só andam em terra
+RAT, WALKER, JUMPER = 0, 1, 2
+CLASS_OF_RANK = (WALKER, RAT, WALKER, WALKER, WALKER, WALKER, WALKER, JUMPER, WALKER)  # Índice: rank
+
+# Toca a atingir e toca própria (intransponível) de cada jogador: 0 Azul, 1 Vermelho
+TARGET_DENS = ((0, 3), (6, 2))
+OWN_DENS = ((6, 2), (0, 3))
+
+# Casas do rio; um rato em cada uma delas corta os saltos que passam por ela
+RIVER_SQUARES = ((2, 1), (3, 1), (4, 1), (2, 4), (3, 4), (4, 4))
+
+UNREACHABLE = 99
+
+
+def _jumps(mask: int) -> list:
+    """Saltos do leão sobre o rio possíveis com os ratos indicados em mask (bit k: rato em RIVER_SQUARES[k])"""
+    jumps = []
+    for k, (row, col) in enumerate(RIVER_SQUARES):
+        # Saltos horizontais: atravessam uma única casa do rio
+        if not mask & (1 << k):
+            jumps.append(((row, col - 1), (row, col + 1)))
+    for offset, col in ((0, 1), (3, 4)):
+        # Saltos verticais: atravessam as três casas da coluna
+        if not mask & (0b111 << offset):
+            jumps.append(((5, col), (1, col)))
+    return jumps
+
+
+def _distance_map(side: int, piece_class: int, mask: int) -> np.ndarray:
+    """Distância em jogadas de cada casa até à toca adversária, num tabuleiro sem outras peças
+
+    Args:
+        side (int): 0 (Azul) ou 1 (Vermelho)
+        piece_class (int): RAT, WALKER ou JUMPER
+        mask (int): ratos no rio (só afeta JUMPER)
+
+    Returns:
+        ndarray: mapa 7x6 de distâncias (UNREACHABLE onde a peça não pode estar)
+    """
+    neighbours = {}
+    for i in range(7):
+        for j in range(6):
+            neighbours[(i, j)] = []
+            for di, dj in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                if 0 <= i + di < 7 and 0 <= j + dj < 6:
+                    neighbours[(i, j)].append((i + di, j + dj))
+    if piece_class == JUMPER:
+        for a, b in _jumps(mask):
+            neighbours[a].append(b)
+            neighbours[b].append(a)
+
+    def passable(pos):
+        if pos == OWN_DENS[side]:
+            return False
+        return piece_class == RAT or pos not in RIVER_SQUARES
+
+    # As jogadas são simétricas: pesquisa em largura a partir da toca
+    distances = np.full((7, 6), UNREACHABLE, dtype=np.int16)
+    target = TARGET_DENS[side]
+    distances[target] = 0
+    queue = deque([target])
+    while queue:
+        pos = queue.popleft()
+        for nxt in neighbours[pos]:
+            if distances[nxt] == UNREACHABLE and passable(nxt):
+                distances[nxt] = distances[pos] + 1
+                queue.append(nxt)
+    return distances
+
+
+# Mapas pré-calculados: [jogador, ratos no rio, classe, linha, coluna]
+DISTANCE_MAPS = np.array([[[_distance_map(side, piece_class, mask) for piece_class in (RAT, WALKER, JUMPER)]
+                           for mask in range(1 << len(RIVER_SQUARES))]
+                          for side in (0, 1)], dtype=np.int16)
+
+
+def river_mask(board: np.ndarray) -> int:
+    """Máscara dos ratos (de qualquer jogador) nas casas do rio"""
+    mask = 0
+    for k, (row, col) in enumerate(RIVER_SQUARES):
+        if abs(board[row, col]) == 1:
+            mask |= 1 << k
+    return mask
+
+
+def den_distance_maps(board: np.ndarray) -> np.ndarray:
+    """Mapas de distância às tocas válidos para o tabuleiro dado
+
+    Só os saltos do leão dependem das peças, por isso basta escolher os mapas da máscara
+    dos ratos no rio.
+
+    Args:
+        board (ndarray): tabuleiro do jogo
+
+    Returns:
+        ndarray: mapas [jogador, classe, linha, coluna]
+    """
+    return DISTANCE_MAPS[:, river_mask(board)]
+
+
+def den_distance(maps: np.ndarray, piece: int, pos: tuple) -> int:
+    """Distância de uma peça até à toca adversária
+
+    Args:
+        maps (ndarray): mapas devolvidos por den_distance_maps
+        piece (int): peça (positiva para o azul, negativa para o vermelho)
+        pos (tuple): posição (linha, coluna)
+
+    Returns:
+        int: número mínimo de jogadas até à toca, ignorando as outras peças
+    """
+    return int(maps[0 if piece > 0 else 1, CLASS_OF_RANK[abs(piece)], pos[0], pos[1]])
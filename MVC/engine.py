@@ -0,0 +1,1018 @@
+import math
+import time
+import numpy as np
+from assets.board import BoardConsts
+from MVC.model import Model, RandomAI
+from MVC.mcts import MCTSAI
+from MVC.solver import ProofNumberSolver, is_den_race
+from MVC.book import OpeningBook
+from MVC.cache import EvaluationCache
+from MVC.tablebase import Tablebase
+from MVC.distance import den_distance, den_distance_maps
+from MVC.evaluation import IncrementalEvaluation, PieceSquareEvaluation, load_weights
+from MVC.nnue import NetworkEvaluation
+from MVC.exchange import static_exchange
+from MVC.material import MATERIAL_BITS, MaterialTable
+from MVC.ordering import score_moves
+from MVC.zobrist import zobrist_move
+
+
+class SearchStrategy:
+    """Algoritmo de pesquisa usado pelo motor
+
+    O motor trata da geração e ordenação das jogadas, da avaliação, das tabelas e das
+    estatísticas; a estratégia só decide como percorrer a árvore. Os valores são sempre
+    devolvidos do ponto de vista de quem joga no nó pesquisado.
+    """
+    name = None
+
+    def search(self, engine, depth: int, alpha: float, beta: float, red_to_move: bool) -> tuple:
+        """Pesquisa a posição atual do modelo do motor
+
+        Args:
+            engine (Engine): motor que fornece as jogadas, a avaliação e as tabelas
+            depth (int): profundidade restante
+            alpha (float): limite inferior da janela, do ponto de vista de quem joga
+            beta (float): limite superior da janela, do ponto de vista de quem joga
+            red_to_move (bool): se é o vermelho a jogar
+
+        Returns:
+            tuple: (valor do ponto de vista de quem joga, melhor jogada)
+        """
+        raise NotImplementedError
+
+
+class MinimaxStrategy(SearchStrategy):
+    """Minimax com cortes alfa-beta: o vermelho maximiza e o azul minimiza"""
+    name = 'minimax'
+
+    def search(self, engine, depth: int, alpha: float, beta: float, red_to_move: bool) -> tuple:
+        if red_to_move:
+            return self.minimax(engine, depth, alpha, beta, True)
+        value, move = self.minimax(engine, depth, -beta, -alpha, False)
+        return -value, move
+
+    def minimax(self, engine, depth: int, alpha: float, beta: float, is_maximizing: bool) -> tuple:
+        """Implementa o algoritmo Minimax com cortes alfa-beta"""
+        engine.nodes += 1
+        if depth == 0 or engine.model.is_win()[0] or engine.is_known_outcome():
+            return engine.evaluate_board(), None
+        
+        moves = engine.get_all_possible_moves(is_maximizing)
+        if not moves:  # Se não houver movimentos possíveis
+            return engine.evaluate_board(), None
+        
+        # Experimenta primeiro a melhor jogada guardada na tabela de transposição
+        node_key = (engine.model.game_board.tobytes(), is_maximizing)
+        tt_move = engine.transposition_table.get(node_key)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        
+        # Na fronteira, as posições filhas são avaliadas todas de uma vez
+        if depth == 1 and engine.batch_frontier:
+            scored = engine.evaluate_frontier(moves, depth)
+            best_eval, best_move = (max if is_maximizing else min)(scored, key=lambda entry: entry[0])
+            engine.transposition_table[node_key] = best_move
+            return best_eval, best_move
+            
+        if is_maximizing:
+            max_eval = float('-inf')
+            best_move = moves[0] if moves else None
+            
+            for start, end in moves:
+                # Capturas claramente perdedoras perto das folhas não são pesquisadas
+                if max_eval > float('-inf') and engine.is_losing_capture((start, end), depth):
+                    continue
+                
+                # Faz a jogada; uma posição repetida vale um empate
+                undo = engine.make_search_move(start, end)
+                if engine.is_repetition():
+                    eval = engine.draw_score(True)
+                else:
+                    eval, _ = self.minimax(engine, depth - 1, alpha, beta, False)
+                engine.undo_search_move(start, end, undo)
+                
+                if eval > max_eval:
+                    max_eval = eval
+                    best_move = (start, end)
+                alpha = max(alpha, eval)
+                if beta <= alpha:
+                    break
+            
+            engine.transposition_table[node_key] = best_move
+            return max_eval, best_move
+        else:
+            min_eval = float('inf')
+            best_move = moves[0] if moves else None
+            
+            for start, end in moves:
+                # Capturas claramente perdedoras perto das folhas não são pesquisadas
+                if min_eval < float('inf') and engine.is_losing_capture((start, end), depth):
+                    continue
+                
+                # Faz a jogada; uma posição repetida vale um empate
+                undo = engine.make_search_move(start, end)
+                if engine.is_repetition():
+                    eval = engine.draw_score(True)
+                else:
+                    eval, _ = self.minimax(engine, depth - 1, alpha, beta, True)
+                engine.undo_search_move(start, end, undo)
+                
+                if eval < min_eval:
+                    min_eval = eval
+                    best_move = (start, end)
+                beta = min(beta, eval)
+                if beta <= alpha:
+                    break
+            
+            engine.transposition_table[node_key] = best_move
+            return min_eval, best_move
+
+
+class NegamaxStrategy(SearchStrategy):
+    """Negamax com cortes alfa-beta: cada nó maximiza o valor do ponto de vista de quem joga"""
+    name = 'negamax'
+
+    def search(self, engine, depth: int, alpha: float, beta: float, red_to_move: bool) -> tuple:
+        return self.negamax(engine, depth, alpha, beta, 1 if red_to_move else -1)
+
+    def negamax(self, engine, depth: int, alpha: float, beta: float, color: int) -> tuple:
+        """Implementa o algoritmo Negamax com cortes alfa-beta"""
+        engine.nodes += 1
+        if depth == 0 or engine.model.is_win()[0] or engine.is_known_outcome():
+            return color * engine.evaluate_board(), None
+        
+        moves = engine.get_all_possible_moves(color > 0)
+        if not moves:
+            return color * engine.evaluate_board(), None
+        
+        # Experimenta primeiro a melhor jogada guardada na tabela de transposição
+        node_key = (engine.model.game_board.tobytes(), color > 0)
+        tt_move = engine.transposition_table.get(node_key)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        
+        # Na fronteira, as posições filhas são avaliadas todas de uma vez
+        if depth == 1 and engine.batch_frontier:
+            scored = engine.evaluate_frontier(moves, depth)
+            best_value, best_move = max(((color * value, move) for value, move in scored), key=lambda entry: entry[0])
+            engine.transposition_table[node_key] = best_move
+            return best_value, best_move
+            
+        best_value = float('-inf')
+        best_move = moves[0] if moves else None
+        
+        for start, end in moves:
+            # Capturas claramente perdedoras perto das folhas não são pesquisadas
+            if best_value > float('-inf') and engine.is_losing_capture((start, end), depth):
+                continue
+            
+            # Faz a jogada; uma posição repetida vale um empate
+            undo = engine.make_search_move(start, end)
+            if engine.is_repetition():
+                value = engine.draw_score(color > 0)
+            else:
+                value, _ = self.negamax(engine, depth - 1, -beta, -alpha, -color)
+                value = -value
+            engine.undo_search_move(start, end, undo)
+            
+            if value > best_value:
+                best_value = value
+                best_move = (start, end)
+            
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        
+        engine.transposition_table[node_key] = best_move
+        return best_value, best_move
+
+
+class Engine:
+    """Núcleo comum dos motores de pesquisa alfa-beta
+
+    Trata da geração e ordenação das jogadas, da avaliação, das tabelas (transposição,
+    livro, finais) e das estatísticas; a travessia da árvore fica a cargo da estratégia.
+
+    Args:
+        model (Model): modelo do jogo
+        depth (int): profundidade da pesquisa
+        strategy (str/SearchStrategy): estratégia ou o seu nome em STRATEGIES
+    """
+    def __init__(self, model: Model, depth: int = 4, strategy='minimax'):
+        self.model = model
+        self.max_depth = depth  # Profundidade configurável
+        self.strategy = STRATEGIES[strategy]() if isinstance(strategy, str) else strategy
+        
+        # Cache de avaliações de posição, de tamanho fixo e mantida entre jogadas
+        self.evaluation_cache = EvaluationCache()
+        
+        # Pesos da avaliação (os afinados em assets/eval_weights.json, se existirem), com as tabelas
+        # por peça e casa e as somas incrementais sincronizadas na raiz de cada pesquisa
+        self.network = None  # Rede de avaliação (MVC/nnue.py) usada em vez dos pesos, se definida
+        self.set_weights(load_weights())
+        self.check_evaluation = False  # Compara a avaliação incremental com a completa
+        
+        # Avalia as posições filhas dos nós de profundidade 1 numa só passagem (evaluate_many).
+        # Desligado por omissão: perde os cortes alfa-beta na fronteira e, com a geração de
+        # jogadas em Python a dominar, fica cerca de 10% mais lento às profundidades 4 e 5
+        self.batch_frontier = False
+        
+        # Posições das armadilhas
+        self.traps = [
+            (0, 2), (0, 4), (1, 3),  # Armadilhas vermelhas
+            (6, 1), (6, 3), (5, 2)   # Armadilhas azuis
+        ]
+        
+        # Posições das tocas
+        self.dens = [(0, 3), (6, 2)]  # (vermelho, azul)
+        
+        # Limite de movimentos para poda
+        self.move_limit = 20  # Limita o número de movimentos avaliados por nó
+        
+        # Tabela de transposição: melhor jogada conhecida por posição (ordenação e PV)
+        self.transposition_table = {}
+        
+        # Multi-PV: número de jogadas da raiz com pontuação exata por pesquisa
+        self.multipv = 1
+        self.root_moves = []  # Resultado da última pesquisa na raiz
+        self.root_key = None  # Posição a que root_moves se refere
+        self.nodes = 0  # Nós visitados desde o início da pesquisa atual
+        self.position_key = 0  # Chave de Zobrist do nó atual da pesquisa
+        self.search_path = []  # Chaves dos antecessores do nó atual na linha pesquisada
+        
+        # Empates por repetição: valor para o jogador da raiz (contempt positivo evita os empates)
+        self.contempt = 5
+        self.root_red_to_move = False
+        
+        # Solver exato para corridas ao covil, usado na raiz quando uma peça está perto de uma toca
+        self.solver = ProofNumberSolver(model)
+        self.solver_trigger_distance = 2
+        
+        # Livro de aberturas consultado antes da pesquisa (None desativa)
+        self.book = OpeningBook()
+        
+        # Tabelas de finais para posições com poucas peças (None desativa)
+        self.tablebase = Tablebase()
+        
+        # Conhecimento por material (assets/material.json, se existir): escala da avaliação e
+        # resultados que as peças em jogo já decidem, onde a pesquisa pára (None desativa)
+        self.material_table = MaterialTable()
+        self.known_win_bonus = 1000
+        
+        # Troca estática (SEE): bónus das capturas ganhadoras e poda das perdedoras perto das folhas
+        self.winning_capture_bonus = 300
+        self.see_prune_depth = 1
+        self.see_prune_margin = 2
+        
+    def set_weights(self, weights: dict) -> None:
+        """Troca os pesos da avaliação, reconstruindo as tabelas e esvaziando a cache
+
+        Args:
+            weights (dict): pesos com as chaves de DEFAULT_WEIGHTS
+        """
+        self.weights = weights
+        self.piece_values = weights['piece_values']
+        self.piece_square = PieceSquareEvaluation(weights)
+        if self.network is None:
+            self.evaluation = IncrementalEvaluation(self.piece_square)
+            self.evaluation_cache.clear()
+
+    def use_network(self, network) -> None:
+        """Passa a avaliar as posições com uma rede (MVC/nnue.py), com o acumulador da primeira
+        camada atualizado incrementalmente durante a pesquisa
+
+        Args:
+            network (Network): rede treinada, por exemplo de load_network(). None volta aos pesos
+        """
+        self.network = network
+        self.evaluation = IncrementalEvaluation(self.piece_square) if network is None else NetworkEvaluation(network)
+        self.evaluation_cache.clear()
+    
+    def evaluate_board(self) -> float:
+        """Avalia o estado atual do tabuleiro
+
+        Durante a pesquisa usa as somas incrementais (IncrementalEvaluation, ou o acumulador
+        de NetworkEvaluation com use_network); fora dela,
+        ou com check_evaluation ativo, recalcula o tabuleiro completo. Os resultados ficam
+        na cache de avaliações, indexada pela chave de Zobrist, e são ajustados pela tabela
+        de material (apply_material_knowledge).
+        """
+        # Verifica se o jogo terminou
+        is_win, winner = self.model.is_win()
+        if is_win:
+            if winner == 'Vermelho':
+                return float('inf')
+            else:
+                return float('-inf')
+        
+        # Verifica cache (pela chave de Zobrist, mantida pela pesquisa ou calculada fora dela)
+        key = self.position_key if self.evaluation.active else self.model.position_key()
+        score = self.evaluation_cache.get(key)
+        if score is not None:
+            # A cache guarda a avaliação sem o ajuste da tabela de material, aplicado aqui como numa falha
+            return self.apply_material_knowledge(score, self.model.material)
+        
+        if self.evaluation.active:
+            score = self.evaluation.score()
+            if self.check_evaluation:
+                full_score = self.evaluation.evaluate(self.model.game_board)
+                # Com pesos não inteiros, as somas acumuladas podem diferir por arredondamentos
+                assert math.isclose(score, full_score, abs_tol=1e-6), f"Avaliação incremental {score} difere da completa {full_score}"
+        else:
+            score = self.evaluation.evaluate(self.model.game_board)
+        
+        # Armazena em cache e retorna
+        self.evaluation_cache.put(key, score)
+        return self.apply_material_knowledge(score, self.model.material)
+    
+    def apply_material_knowledge(self, score: float, material: int) -> float:
+        """Ajusta uma avaliação com o conhecimento da tabela de material
+
+        Um empate conhecido vale um empate, uma vitória conhecida soma known_win_bonus a favor
+        do vencedor (a avaliação continua a guiar o progresso) e nas restantes assinaturas
+        com entrada a avaliação é multiplicada pela escala.
+
+        Args:
+            score (float): avaliação do ponto de vista do vermelho
+            material (int): chave de material da posição (Model.material)
+
+        Returns:
+            float: avaliação ajustada
+        """
+        entry = self.material_table.get(material) if self.material_table is not None else None
+        if entry is None:
+            return score
+        scale, outcome = entry
+        if outcome is None:
+            return score * scale
+        if outcome == MaterialTable.DRAW:
+            return self.draw_score(True)
+        return score + MaterialTable.OUTCOME_SIGNS[outcome] * self.known_win_bonus
+    
+    def is_known_outcome(self) -> bool:
+        """Verifica se o material em jogo já decide o resultado, caso em que a pesquisa não continua"""
+        return self.material_table is not None and self.material_table.outcome(self.model.material) is not None
+    
+    def evaluate_frontier(self, moves: list, depth: int) -> list:
+        """Avalia numa só passagem as posições filhas de um nó de profundidade 1
+
+        As posições filhas são construídas diretamente num array (N, 7, 6) e avaliadas com
+        evaluate_many; as que repetem uma posição do jogo ou da linha pesquisada valem um
+        empate. As capturas perdedoras são podadas como na pesquisa normal.
+
+        Args:
+            moves (list): jogadas do nó, pela ordem de pesquisa
+            depth (int): profundidade restante do nó
+
+        Returns:
+            list: pares (valor do ponto de vista do vermelho, jogada) das jogadas avaliadas
+        """
+        moves = moves[:1] + [move for move in moves[1:] if not self.is_losing_capture(move, depth)]
+        board = self.model.game_board
+        starts = np.array([start for start, _ in moves])
+        ends = np.array([end for _, end in moves])
+        
+        # Tabuleiros filhos: cópias do atual com a peça movida
+        children = np.repeat(board[None], len(moves), axis=0)
+        index = np.arange(len(moves))
+        children[index, ends[:, 0], ends[:, 1]] = board[starts[:, 0], starts[:, 1]]
+        children[index, starts[:, 0], starts[:, 1]] = 0
+        values = self.evaluation.evaluate_many(children).tolist()
+        self.nodes += len(moves)
+        
+        for k, (start, end) in enumerate(moves):
+            key = zobrist_move(self.position_key, board, start, end)
+            if key in self.model.repetitions or key in self.search_path:
+                values[k] = self.draw_score(True)
+            elif abs(values[k]) != float('inf'):
+                material = self.model.material ^ MATERIAL_BITS[board[end[0], end[1]] + 8]
+                values[k] = self.apply_material_knowledge(values[k], material)
+        return list(zip(values, moves))
+    
+    def get_all_possible_moves(self, is_ai_turn: bool) -> list:
+        """Retorna todas as possíveis jogadas para o jogador atual (otimizada)"""
+        moves = []
+        for i in range(7):
+            for j in range(6):
+                piece = self.model.game_board[i, j]
+                # Verifica se a peça pertence ao jogador atual
+                if (is_ai_turn and piece < 0) or (not is_ai_turn and piece > 0):
+                    possible_moves = self.model.get_possible_moves((i, j))
+                    if possible_moves:
+                        moves.extend(((i, j), move) for move in possible_moves)
+        
+        # Ordena e limita o número de movimentos
+        # score_moves usa o turno do modelo (o jogador da raiz, que a pesquisa não muda), como evaluate_move;
+        # nos nós do adversário a toca e as armadilhas consideradas continuam a ser as desse jogador
+        scores = score_moves(self.model, moves, self.piece_values, self.winning_capture_bonus)
+        order = np.argsort(-scores, kind='stable')[:self.move_limit]  # Estável: empates mantêm a ordem de geração
+        return [moves[k] for k in order.tolist()]  # Retorna apenas os melhores movimentos
+    
+    def is_losing_capture(self, move: tuple, depth: int) -> bool:
+        """Verifica se uma captura perde material de forma clara, segundo a troca estática
+
+        Só se aplica a nós perto das folhas (depth <= see_prune_depth), onde a recaptura
+        já não seria vista pela pesquisa.
+
+        Args:
+            move (tuple): jogada (start, end)
+            depth (int): profundidade restante do nó
+
+        Returns:
+            bool: True se a captura pode ser podada
+        """
+        end = move[1]
+        if depth > self.see_prune_depth or self.model.game_board[end[0], end[1]] == 0:
+            return False
+        return static_exchange(self.model, move, self.piece_values) < -self.see_prune_margin
+    
+    def make_search_move(self, start: tuple, end: tuple) -> tuple:
+        """Faz uma jogada durante a pesquisa, atualizando a chave de Zobrist e a linha atual
+
+        Returns:
+            tuple: (peça capturada, chave do nó pai), a passar a undo_search_move
+        """
+        parent_key = self.position_key
+        self.search_path.append(parent_key)
+        self.position_key = zobrist_move(parent_key, self.model.game_board, start, end)
+        self.evaluation.push(self.model.game_board, start, end)
+        return self.model.make_move(start, end), parent_key
+    
+    def undo_search_move(self, start: tuple, end: tuple, undo: tuple) -> None:
+        """Desfaz uma jogada feita com make_search_move"""
+        captured, parent_key = undo
+        self.model.unmake_move(start, end, captured)
+        self.evaluation.pop()
+        self.position_key = parent_key
+        self.search_path.pop()
+    
+    def is_repetition(self) -> bool:
+        """Verifica se a posição do nó atual já ocorreu no jogo ou na linha pesquisada"""
+        return self.position_key in self.model.repetitions or self.position_key in self.search_path
+    
+    def draw_score(self, red_to_move: bool) -> float:
+        """Valor de um empate por repetição do ponto de vista de um jogador
+
+        Com contempt positivo, o jogador da raiz prefere continuar o jogo a repetir posições.
+
+        Args:
+            red_to_move (bool): True para o ponto de vista do vermelho
+
+        Returns:
+            float: -contempt para o jogador da raiz, contempt para o adversário
+        """
+        return -self.contempt if red_to_move == self.root_red_to_move else self.contempt
+    
+    def get_best_move(self) -> tuple:
+        """Retorna a melhor jogada para a IA"""
+        # Nas primeiras jogadas usa o livro de aberturas, se a posição lá estiver
+        if self.book is not None:
+            book_move = self.book.choose(self.model)
+            if book_move is not None:
+                return book_move
+        
+        # Verifica primeiro se há um movimento vitorioso direto
+        all_moves = self.get_all_possible_moves(self.model.turn == 1)
+        
+        # Remove o movimento proibido da lista, se existir
+        if self.model.forbidden_move and self.model.cycle_detected:
+            all_moves = [move for move in all_moves if move != self.model.forbidden_move]
+        
+        # Se depois de remover o movimento proibido não sobrar nenhum movimento, 
+        # retornamos todos os movimentos novamente
+        if not all_moves:
+            all_moves = self.get_all_possible_moves(self.model.turn == 1)
+        
+        for start, end in all_moves:
+            # Verifica se pode entrar no covil adversário
+            if (self.model.turn == 0 and end == (0, 3)) or (self.model.turn == 1 and end == (6, 2)):
+                return (start, end)
+            
+            # Ou verifica se o movimento é vitorioso usando o método is_winning_move
+            if self.model.is_winning_move(start, end):
+                return (start, end)
+        
+        # Com poucas peças, joga a jogada exata das tabelas de finais
+        if self.tablebase is not None:
+            excluded = self.model.forbidden_move if self.model.cycle_detected else None
+            tablebase_move = self.tablebase.best_move(self.model, excluded)
+            if tablebase_move is not None:
+                return tablebase_move
+        
+        # Numa corrida para o covil, tenta resolver a posição de forma exata antes de pesquisar
+        if self.solver is not None and is_den_race(self.model.game_board, self.solver_trigger_distance):
+            result, move = self.solver.solve()
+            if result == ProofNumberSolver.WIN and move in all_moves:
+                return move
+            # Numa derrota provada a pesquisa normal continua, para escolher a defesa que mais resiste
+                
+        # Se não houver movimento vitorioso, continua com a lógica normal
+        self.transposition_table.clear()
+        
+        # Com um ciclo detetado, guarda pelo menos duas jogadas para a alternativa
+        multipv = max(self.multipv, 2) if self.model.cycle_detected else self.multipv
+        self.root_moves = self.search_root(self.max_depth, multipv)
+        self.root_key = (self.model.game_board.tobytes(), self.model.turn)
+        best_move = self.root_moves[0]['move'] if self.root_moves else None
+        
+        # Se o melhor movimento for o movimento proibido, escolhe um alternativo
+        if self.model.forbidden_move and best_move == self.model.forbidden_move and self.model.cycle_detected:
+            return self.get_alternative_move()
+            
+        return best_move
+    
+    def get_ponder_move(self, move: tuple) -> tuple:
+        """Resposta prevista do adversário a uma jogada escolhida pela última pesquisa
+
+        É a segunda jogada da variante principal, se a pesquisa foi feita na posição atual
+        e move é a jogada que encabeça essa variante (não o é nas jogadas do livro, das
+        tabelas de finais ou do solver).
+
+        Args:
+            move (tuple): jogada escolhida por get_best_move
+
+        Returns:
+            tuple: jogada (start, end) do adversário, ou None se não houver previsão
+        """
+        if not self.root_moves or self.root_key != (self.model.game_board.tobytes(), self.model.turn):
+            return None
+        pv = self.root_moves[0]['pv']
+        return pv[1] if len(pv) >= 2 and pv[0] == move else None
+    
+    def get_top_moves(self, k: int = 3, depth: int = None) -> list:
+        """Pesquisa a posição atual e devolve as K melhores jogadas com pontuação e variante principal
+
+        Args:
+            k (int): número de jogadas a devolver
+            depth (int, optional): profundidade da pesquisa. Por omissão usa max_depth
+
+        Returns:
+            list[dict]: entradas {'move', 'score', 'pv'} ordenadas da melhor para a pior
+        """
+        self.transposition_table.clear()
+        self.root_moves = self.search_root(depth or self.max_depth, k)
+        self.root_key = (self.model.game_board.tobytes(), self.model.turn)
+        return self.root_moves
+    
+    def search_root(self, depth: int, multipv: int = 1) -> list:
+        """Pesquisa multi-PV na raiz: as multipv melhores jogadas recebem pontuação exata
+
+        A janela de cada jogada usa a K-ésima melhor pontuação encontrada até ao momento
+        como limite, por isso as restantes jogadas continuam a ser cortadas normalmente.
+        As pontuações são devolvidas do ponto de vista do jogador a jogar. Posições já
+        ocorridas no jogo ou na linha pesquisada valem um empate (ver draw_score), e o
+        movimento proibido por um ciclo só é excluído aqui, na raiz.
+
+        Args:
+            depth (int): profundidade da pesquisa
+            multipv (int): número de jogadas com pontuação exata
+
+        Returns:
+            list[dict]: entradas {'move', 'score', 'pv'} ordenadas da melhor para a pior
+        """
+        steps = self.search_root_steps(depth, multipv)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as result:
+                return result.value
+    
+    def search_root_steps(self, depth: int, multipv: int = 1):
+        """Versão incremental de search_root: cede o controlo depois de cada jogada da raiz
+
+        Entre cedências o tabuleiro está sempre reposto na posição da raiz.
+
+        Yields:
+            int: número de jogadas da raiz já pesquisadas
+
+        Returns:
+            list[dict]: o mesmo resultado que search_root
+        """
+        red_to_move = self.model.turn == 1
+        self.root_red_to_move = red_to_move
+        moves = self.get_all_possible_moves(red_to_move)
+        
+        # Remove o movimento proibido da lista, exceto se for a única jogada
+        if self.model.forbidden_move and self.model.cycle_detected:
+            allowed = [move for move in moves if move != self.model.forbidden_move]
+            moves = allowed or moves
+        if not moves:
+            return []
+        
+        # Começa pela melhor jogada da iteração anterior, se existir
+        root_key = (self.model.game_board.tobytes(), red_to_move)
+        tt_move = self.transposition_table.get(root_key)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        
+        # Chave de Zobrist da posição, atualizada jogada a jogada durante a pesquisa
+        self.position_key = self.model.position_key()
+        self.search_path = []
+        
+        # Somas da avaliação incremental, válidas enquanto a pesquisa decorre
+        self.evaluation.reset(self.model.game_board)
+        
+        scored = []  # Lista de (pontuação do ponto de vista de quem joga, jogada)
+        try:
+            for start, end in moves:
+                # Limite da janela: K-ésima melhor pontuação até agora
+                ranked = sorted((score for score, _ in scored), reverse=True)
+                alpha = ranked[multipv - 1] if len(ranked) >= multipv else float('-inf')
+                
+                # Faz a jogada; uma posição repetida vale um empate
+                undo = self.make_search_move(start, end)
+                if self.is_repetition():
+                    value = self.draw_score(red_to_move)
+                else:
+                    value, _ = self.strategy.search(self, depth - 1, float('-inf'), -alpha, not red_to_move)
+                    value = -value
+                self.undo_search_move(start, end, undo)
+                
+                scored.append((value, (start, end)))
+                yield len(scored)
+        finally:
+            self.evaluation.active = False
+        
+        scored.sort(key=lambda x: x[0], reverse=True)
+        self.transposition_table[root_key] = scored[0][1]
+        
+        return [{'move': move, 'score': score, 'pv': self.extract_pv(move, red_to_move, depth)}
+                for score, move in scored[:multipv]]
+    
+    def iterate_search(self, max_depth: int = None, time_limit: float = None, multipv: int = 1):
+        """Pesquisa por aprofundamento iterativo exposta como gerador
+
+        Cede um retrato do progresso depois de cada jogada da raiz e no fim de cada
+        profundidade. O gerador pode ser retomado mais tarde ou cancelado com close()
+        entre cedências, porque o tabuleiro está sempre reposto nesses pontos. O
+        tabuleiro não deve ser alterado enquanto a pesquisa estiver suspensa.
+
+        Args:
+            max_depth (int, optional): profundidade máxima. Por omissão usa max_depth
+            time_limit (float, optional): tempo máximo em segundos, verificado entre cedências
+            multipv (int): número de jogadas da raiz com pontuação exata
+
+        Yields:
+            dict: {'depth', 'completed', 'move', 'score', 'pv', 'multipv', 'nodes', 'elapsed', 'cache'}.
+                  Num retrato parcial, move/score/pv são os da última profundidade completa
+        """
+        max_depth = max_depth or self.max_depth
+        start_time = time.perf_counter()
+        self.nodes = 0
+        self.transposition_table.clear()
+        
+        best = []
+        for depth in range(1, max_depth + 1):
+            steps = self.search_root_steps(depth, multipv)
+            while True:
+                try:
+                    next(steps)
+                except StopIteration as result:
+                    best = result.value
+                    break
+                yield self._search_snapshot(depth, False, best, start_time)
+                if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+                    return
+            
+            self.root_moves = best
+            self.root_key = (self.model.game_board.tobytes(), self.model.turn)
+            yield self._search_snapshot(depth, True, best, start_time)
+            if not best or (time_limit is not None and time.perf_counter() - start_time >= time_limit):
+                return
+    
+    def _search_snapshot(self, depth: int, completed: bool, entries: list, start_time: float) -> dict:
+        """Constrói o retrato de progresso cedido por iterate_search"""
+        top = entries[0] if entries else {'move': None, 'score': None, 'pv': []}
+        return {'depth': depth,
+                'completed': completed,
+                'move': top['move'],
+                'score': top['score'],
+                'pv': top['pv'],
+                'multipv': entries,
+                'nodes': self.nodes,
+                'elapsed': time.perf_counter() - start_time,
+                'cache': self.evaluation_cache.stats()}
+    
+    def extract_pv(self, move: tuple, red_to_move: bool, max_length: int) -> list:
+        """Reconstrói a variante principal seguindo a tabela de transposição
+
+        Args:
+            move (tuple): primeira jogada da variante
+            red_to_move (bool): se move é jogada pelo vermelho
+            max_length (int): comprimento máximo da variante
+
+        Returns:
+            list[tuple]: sequência de jogadas (start, end)
+        """
+        pv = []
+        undo = []
+        while move is not None and len(pv) < max_length:
+            start, end = move
+            # A jogada tem de pertencer ao jogador certo e ser legal nesta posição
+            if (self.model.game_board[start[0], start[1]] < 0) != red_to_move or not self.model.is_valid_move(start, end):
+                break
+            
+            pv.append(move)
+            undo.append((start, end, self.model.make_move(start, end)))
+            if self.model.is_win()[0]:
+                break
+            
+            red_to_move = not red_to_move
+            move = self.transposition_table.get((self.model.game_board.tobytes(), red_to_move))
+        
+        # Repõe o tabuleiro
+        for start, end, piece_value in reversed(undo):
+            self.model.unmake_move(start, end, piece_value)
+        
+        return pv
+    
+    def evaluate_move(self, move: tuple) -> float:
+        """Avalia um movimento específico para ordenação (otimizada)
+
+        Versão jogada a jogada de score_moves (MVC/ordering.py), que a pesquisa usa para
+        pontuar todas as jogadas de um nó de uma vez; as duas dão as mesmas pontuações.
+        """
+        start, end = move
+        score = 0
+        piece = self.model.game_board[start[0], start[1]]
+        
+        # Movimento para o covil adversário - prioridade máxima absoluta para ambos os jogadores
+        if (self.model.turn == 0 and end == (0, 3)) or (self.model.turn == 1 and end == (6, 2)):
+            return float('inf')  # Prioridade igual para ambos
+        
+        # Movimento para uma célula adjacente ao covil adversário - equalizado para ambos jogadores
+        if self.model.turn == 0:  # Jogador azul
+            if end in [(0, 2), (0, 4), (1, 3)]:  # Células adjacentes ao covil vermelho
+                # Simula o movimento
+                temp_board = self.model.game_board.copy()
+                temp_board[end[0], end[1]] = temp_board[start[0], start[1]]
+                temp_board[start[0], start[1]] = 0
+                
+                # Verifica se a peça estaria segura nesta posição
+                is_safe = True
+                
+                # Como estamos em uma armadilha adversária, verificamos se há peças inimigas adjacentes
+                for dr, dc in BoardConsts.DIRECTIONS:
+                    nr, nc = end[0] + dr, end[1] + dc
+                    if 0 <= nr < 7 and 0 <= nc < 6 and temp_board[nr, nc] < 0:  # Peça inimiga
+                        # Verifica se a peça inimiga pode capturar nossa peça
+                        if self.model.is_self_rank_higher(temp_board[nr, nc], temp_board[end[0], end[1]]):
+                            is_safe = False
+                            break
+                
+                if is_safe:
+                    return float('inf') * 0.995  # Prioridade extremamente alta
+                else:
+                    # Mesmo valor para ambos jogadores
+                    score += 50
+        else:  # Jogador vermelho
+            if end in [(6, 1), (6, 3), (5, 2)]:  # Células adjacentes ao covil azul
+                # Simula o movimento
+                temp_board = self.model.game_board.copy()
+                temp_board[end[0], end[1]] = temp_board[start[0], start[1]]
+                temp_board[start[0], start[1]] = 0
+                
+                # Verifica se a peça estaria segura nesta posição
+                is_safe = True
+                
+                # Como estamos em uma armadilha adversária, verificamos se há peças inimigas adjacentes
+                for dr, dc in BoardConsts.DIRECTIONS:
+                    nr, nc = end[0] + dr, end[1] + dc
+                    if 0 <= nr < 7 and 0 <= nc < 6 and temp_board[nr, nc] > 0:  # Peça inimiga
+                        # Verifica se a peça inimiga pode capturar nossa peça
+                        if self.model.is_self_rank_higher(temp_board[nr, nc], temp_board[end[0], end[1]]):
+                            is_safe = False
+                            break
+                
+                if is_safe:
+                    return float('inf') * 0.995  # Prioridade extremamente alta
+                else:
+                    # Mesmo valor para ambos jogadores
+                    score += 50
+        
+        # Células a duas casas de distância do covil - equilibrado para ambos jogadores
+        covil_vermelho_proximidade2 = [(0, 1), (0, 5), (1, 2), (1, 4), (2, 3)]
+        covil_azul_proximidade2 = [(6, 0), (6, 4), (5, 1), (5, 3), (4, 2)]
+        
+        if self.model.turn == 0 and end in covil_vermelho_proximidade2:  # Jogador azul perto do covil vermelho
+            # Verifica se há um caminho livre até uma célula adjacente ao covil
+            has_path_to_den = False
+            for dr, dc in BoardConsts.DIRECTIONS:
+                nr, nc = end[0] + dr, end[1] + dc
+                if (nr, nc) in [(0, 2), (0, 4), (1, 3)] and self.model.is_valid_move(end, (nr, nc)):
+                    has_path_to_den = True
+                    break
+            
+            if has_path_to_den:
+                score += 500  # Mesmo valor para ambos jogadores
+        elif self.model.turn == 1 and end in covil_azul_proximidade2:  # Jogador vermelho perto do covil azul
+            # Verifica se há um caminho livre até uma célula adjacente ao covil
+            has_path_to_den = False
+            for dr, dc in BoardConsts.DIRECTIONS:
+                nr, nc = end[0] + dr, end[1] + dc
+                if (nr, nc) in [(6, 1), (6, 3), (5, 2)] and self.model.is_valid_move(end, (nr, nc)):
+                    has_path_to_den = True
+                    break
+            
+            if has_path_to_den:
+                score += 500  # Mesmo valor para ambos jogadores
+        
+        # Captura de peça - avaliada pela troca completa na casa de destino (SEE)
+        if self.model.game_board[end[0], end[1]] != 0:
+            exchange = static_exchange(self.model, move, self.piece_values)
+            if exchange > 0:
+                score += self.winning_capture_bonus + exchange * 2.0  # Capturas ganhadoras primeiro
+            else:
+                score += exchange * 2.0
+        
+        # Movimento em direção à toca adversária - equilibrado para ambos jogadores
+        distance_maps = den_distance_maps(self.model.game_board)
+        if piece < 0:  # Peças vermelhas
+            dist_before = den_distance(distance_maps, piece, start)
+            dist_after = den_distance(distance_maps, piece, end)
+            if dist_after < dist_before:
+                score += 60 * (dist_before - dist_after)
+                # Bônus progressivo baseado na proximidade ao covil
+                score += (7 - dist_after) * 25
+                # Bônus extra para movimentos que aproximam a peça para 2 ou 3 células de distância do covil
+                if dist_after == 1:
+                    score += 250
+                elif dist_after == 2:
+                    score += 150
+                elif dist_after == 3:
+                    score += 100
+                elif dist_after == 4:
+                    score += 70
+            # Penalidade para movimentos que se afastam do covil
+            elif dist_after > dist_before:
+                score -= 50 * (dist_after - dist_before)
+        else:  # Peças azuis - valores iguais ao vermelho
+            dist_before = den_distance(distance_maps, piece, start)
+            dist_after = den_distance(distance_maps, piece, end)
+            if dist_after < dist_before:
+                score += 60 * (dist_before - dist_after)  # Mesmo valor que o vermelho
+                # Bônus progressivo baseado na proximidade ao covil
+                score += (7 - dist_after) * 25  # Mesmo valor que o vermelho
+                # Bônus extra para movimentos que aproximam a peça para 2 ou 3 células de distância do covil
+                if dist_after == 1:
+                    score += 250  # Mesmo valor que o vermelho
+                elif dist_after == 2:
+                    score += 150  # Mesmo valor que o vermelho
+                elif dist_after == 3:
+                    score += 100  # Mesmo valor que o vermelho
+                elif dist_after == 4:
+                    score += 70  # Mesmo valor que o vermelho
+            # Penalidade para movimentos que se afastam do covil
+            elif dist_after > dist_before:
+                score -= 50 * (dist_after - dist_before)  # Mesmo valor que o vermelho
+        
+        # Movimento para o centro (novo)
+        center_positions = [(3, 2), (3, 3)]
+        if end in center_positions:
+            score += 4  # Ligeiro Aumento
+        
+        # Movimento que protege peças valiosas (novo)
+        if abs(piece) >= 6:  # Tigre, Leão e Elefante
+            if self.model.is_piece_safe_in_trap(end, piece):
+                if abs(piece) == 8:  # Se for o Elefante
+                    score += 20  # Bônus muito maior para proteger o elefante
+                else:
+                    score += 7  # Mantém o bônus original para outras peças valiosas
+            
+            # Verifica se há aliados próximos para proteção
+            allies_nearby = 0
+            for dr, dc in BoardConsts.DIRECTIONS:
+                nr, nc = end[0] + dr, end[1] + dc
+                if (0 <= nr < 7 and 0 <= nc < 6):
+                    nearby_piece = self.model.game_board[nr, nc]
+                    if (piece < 0 and nearby_piece < 0) or (piece > 0 and nearby_piece > 0):  # Se for aliado
+                        allies_nearby += 1
+            
+            if abs(piece) == 8:  # Se for o Elefante
+                score += allies_nearby * 15  # Bônus significativo por ter aliados próximos
+            else:
+                score += allies_nearby * 5  # Bônus menor para outras peças valiosas
+            
+            # Penalidade extra para mover o elefante para posições perigosas
+            if abs(piece) == 8:
+                enemies_nearby = 0
+                for dr, dc in BoardConsts.DIRECTIONS:
+                    nr, nc = end[0] + dr, end[1] + dc
+                    if (0 <= nr < 7 and 0 <= nc < 6):
+                        nearby_piece = self.model.game_board[nr, nc]
+                        if (piece < 0 and nearby_piece > 0) or (piece > 0 and nearby_piece < 0):  # Se for inimigo
+                            if abs(nearby_piece) == 1:  # Se for um rato
+                                enemies_nearby += 3  # Penalidade extra por ratos próximos
+                            else:
+                                enemies_nearby += 1
+                
+                if enemies_nearby > allies_nearby:
+                    score -= (enemies_nearby - allies_nearby) * 25  # Penalidade significativa por ter mais inimigos que aliados
+        
+        # Movimento que ameaça peças valiosas (novo)
+        for dir in BoardConsts.DIRECTIONS:
+            threat_pos = (end[0] + dir[0], end[1] + dir[1])
+            if (0 <= threat_pos[0] < 7 and 0 <= threat_pos[1] < 6):
+                threat_piece = self.model.game_board[threat_pos[0], threat_pos[1]]
+                if threat_piece != 0 and abs(threat_piece) >= 6:
+                    if (piece < 0 and threat_piece > 0) or (piece > 0 and threat_piece < 0):
+                        if self.model.is_self_rank_higher(piece, threat_piece):
+                            score += 8  # Ligeiro Aumento
+        
+        return score
+
+    def get_alternative_move(self) -> tuple:
+        """Retorna um movimento alternativo quando o melhor movimento está proibido, priorizando movimentos em direção ao covil"""
+        # Reaproveita a última pesquisa multi-PV se foi feita nesta posição
+        if self.root_moves and self.root_key == (self.model.game_board.tobytes(), self.model.turn):
+            for entry in self.root_moves:
+                if entry['move'] != self.model.forbidden_move:
+                    return entry['move']
+        
+        # Obtém todas as jogadas possíveis
+        possible_moves = []
+        for i in range(7):
+            for j in range(6):
+                piece = self.model.game_board[i, j]
+                if (piece < 0 and self.model.turn == 1) or (piece > 0 and self.model.turn == 0):
+                    moves = self.model.get_possible_moves((i, j))
+                    if moves:
+                        for move in moves:
+                            possible_moves.append(((i, j), move))
+        
+        # Remove o movimento proibido da lista
+        if self.model.forbidden_move:
+            if self.model.forbidden_move in possible_moves:
+                possible_moves.remove(self.model.forbidden_move)
+        
+        # Se não houver movimentos alternativos, retorna None
+        if not possible_moves:
+            return None
+        
+        # Verifica se algum movimento leva diretamente ao covil
+        for start, end in possible_moves:
+            if (self.model.turn == 0 and end == (0, 3)) or (self.model.turn == 1 and end == (6, 2)):
+                return (start, end)
+        
+        # Avalia e ordena os movimentos
+        scores = score_moves(self.model, possible_moves, self.piece_values, self.winning_capture_bonus)
+        scored_moves = sorted(zip(scores.tolist(), possible_moves), reverse=True)  # Ordena por pontuação, do maior para o menor
+        
+        # Retorna o melhor movimento alternativo
+        return scored_moves[0][1]
+
+
+class AI(Engine):
+    """Motor com pesquisa Minimax"""
+    def __init__(self, model: Model, depth: int = 4):
+        super().__init__(model, depth, 'minimax')
+
+
+class NegamaxAI(Engine):
+    """Motor com pesquisa Negamax"""
+    def __init__(self, model: Model, depth: int = 4):
+        super().__init__(model, depth, 'negamax')
+
+
+# Estratégias de pesquisa disponíveis, pelo nome usado nos menus e nos jogos salvos
+STRATEGIES = {
+    'minimax': MinimaxStrategy,
+    'negamax': NegamaxStrategy,
+}
+
+# Nível de cada dificuldade: profundidade nos motores alfa-beta, número de simulações no MCTS
+DIFFICULTIES = {
+    'minimax': {'facil': 3, 'medio': 4, 'dificil': 5},
+    'negamax': {'facil': 3, 'medio': 4, 'dificil': 5},
+    'mcts': {'facil': 300, 'medio': 1000, 'dificil': 3000},
+}
+
+
+def create_engine(model: Model, engine_type: str, level=None, seed: int = None):
+    """Cria uma IA a partir da sua configuração
+
+    Args:
+        model (Model): modelo do jogo
+        engine_type (str): "minimax", "negamax", "mcts" ou "random"; tipos desconhecidos dão a aleatória
+        level (int/str, optional): profundidade ou número de simulações, ou uma dificuldade de DIFFICULTIES.
+                                   Por omissão usa a dificuldade média
+        seed (int, optional): semente da IA aleatória
+
+    Returns:
+        Engine/MCTSAI/RandomAI: instância da IA
+    """
+    if engine_type not in DIFFICULTIES:
+        return RandomAI(model, seed=seed)
+    
+    if level is None:
+        level = 'medio'
+    if isinstance(level, str):
+        level = DIFFICULTIES[engine_type][level]
+    
+    if engine_type == 'mcts':
+        return MCTSAI(model, level)
+    return Engine(model, level, engine_type)
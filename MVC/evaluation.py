@@ -0,0 +1,301 @@
+import copy
+import json
+import os
+import numpy as np
+from MVC.distance import CLASS_OF_RANK, DISTANCE_MAPS, JUMPER, RIVER_SQUARES, den_distance, den_distance_maps, river_mask
+
+
+# Ficheiro de pesos afinados (python -m MVC.tuning), lido pelas IAs ao arrancar se existir
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'eval_weights.json')
+
+# Pesos da avaliação (pontuação do ponto de vista do vermelho)
+DEFAULT_WEIGHTS = {
+    'piece_values': {
+        1: 6,   # Rato
+        2: 3,   # Gato
+        3: 4,   # Cão
+        4: 5,   # Lobo
+        5: 6,   # Leopardo
+        6: 7,   # Tigre
+        7: 8,   # Leão
+        8: 15   # Elefante - Valor aumentado significativamente
+    },
+    'proximity': 6.0,  # Por cada jogada a menos de 8 até à toca adversária
+    'den_bonuses': [500, 200, 120, 80],  # Bónus para peças a DEN_BONUS_LIMITS jogadas da toca
+    'race': 80,  # Por cada jogada de vantagem da peça mais próxima de cada jogador
+}
+DEN_BONUS_LIMITS = (1, 2, 3, 4)  # Distância máxima de cada bónus de toca
+
+
+def load_weights(path: str = DEFAULT_WEIGHTS_PATH) -> dict:
+    """Lê os pesos da avaliação; sem ficheiro, devolve uma cópia dos pesos por omissão
+
+    Args:
+        path (str): ficheiro JSON escrito por save_weights
+
+    Returns:
+        dict: pesos com as chaves de DEFAULT_WEIGHTS
+    """
+    weights = copy.deepcopy(DEFAULT_WEIGHTS)
+    if path is not None and os.path.exists(path):
+        with open(path) as f:
+            saved = json.load(f)
+        weights.update({key: value for key, value in saved.items() if key in weights})
+        weights['piece_values'] = {int(rank): value for rank, value in weights['piece_values'].items()}
+    return weights
+
+
+def save_weights(path: str, weights: dict) -> None:
+    """Grava os pesos da avaliação em JSON"""
+    with open(path, 'w') as f:
+        json.dump(weights, f, indent=4)
+
+
+def den_bonus(distance: int, bonuses: list) -> float:
+    """Bónus de uma peça a distance jogadas da toca adversária"""
+    for limit, bonus in zip(DEN_BONUS_LIMITS, bonuses):
+        if distance <= limit:
+            return bonus
+    return 0
+
+
+def race_score(closest_red: float, closest_blue: float, weight: float) -> float:
+    """Vantagem na corrida para os covis, a partir da peça mais próxima de cada jogador"""
+    if closest_red < closest_blue:
+        return (closest_blue - closest_red) * weight
+    if closest_blue < closest_red:
+        return -(closest_red - closest_blue) * weight
+    return 0
+
+
+def evaluate_position(board, weights: dict) -> float:
+    """Avaliação completa do tabuleiro, percorrendo todas as casas
+
+    É a referência da avaliação incremental (IncrementalEvaluation), que tem de dar
+    exatamente o mesmo valor. Não trata posições terminais.
+
+    Args:
+        board (ndarray): tabuleiro do jogo
+        weights (dict): pesos da avaliação (ver DEFAULT_WEIGHTS)
+
+    Returns:
+        float: pontuação do ponto de vista do vermelho
+    """
+    piece_values = weights['piece_values']
+    score = 0
+
+    # 1. Avaliação de material (pesos iguais para ambos jogadores)
+    for i in range(7):
+        for j in range(6):
+            piece = board[i, j]
+            if piece != 0:
+                value = piece_values[abs(piece)]
+                if piece < 0:  # Peça vermelha
+                    score += value
+                else:  # Peça azul
+                    score -= value
+
+    # 2. Avaliação de posição (equilibrada para ambos os jogadores)
+    closest_red_to_blue_den = float('inf')  # Distância da peça vermelha mais próxima ao covil azul
+    closest_blue_to_red_den = float('inf')  # Distância da peça azul mais próxima ao covil vermelho
+
+    # Distâncias reais às tocas (rio, saltos do leão e toca própria), em vez da distância de Manhattan
+    distance_maps = den_distance_maps(board)
+
+    for i in range(7):
+        for j in range(6):
+            piece = board[i, j]
+            if piece != 0:
+                dist_to_den = den_distance(distance_maps, piece, (i, j))
+                # Pontuação progressiva baseada na proximidade, com bónus para peças muito próximas ao covil
+                term = (8 - dist_to_den) * weights['proximity'] + den_bonus(dist_to_den, weights['den_bonuses'])
+                if piece < 0:  # Peça vermelha
+                    closest_red_to_blue_den = min(closest_red_to_blue_den, dist_to_den)
+                    score += term
+                else:  # Peça azul
+                    closest_blue_to_red_den = min(closest_blue_to_red_den, dist_to_den)
+                    score -= term
+
+    # Bônus para vantagem na corrida para os covis
+    return score + race_score(closest_red_to_blue_den, closest_blue_to_red_den, weights['race'])
+
+
+NO_PIECE = 1000  # Distância nas tabelas para casas sem peça do jogador
+_RIVER_ROWS = np.array([row for row, _ in RIVER_SQUARES])
+_RIVER_COLS = np.array([col for _, col in RIVER_SQUARES])
+_RIVER_BITS = 1 << np.arange(len(RIVER_SQUARES))
+_ROWS = np.arange(7)[None, :, None]
+_COLS = np.arange(6)[None, None, :]
+
+
+def mark_terminal(boards: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """Substitui as pontuações das posições terminais por infinito, pela mesma ordem que
+    Model.is_win (a vitória vermelha prevalece)
+
+    Args:
+        boards (ndarray): tabuleiros empilhados, forma (N, 7, 6)
+        scores (ndarray): N pontuações do ponto de vista do vermelho, alteradas no lugar
+
+    Returns:
+        ndarray: scores
+    """
+    blue_wins = (boards[:, 0, 3] > 0) | ~(boards < 0).any(axis=(1, 2))
+    red_wins = (boards[:, 6, 2] < 0) | ~(boards > 0).any(axis=(1, 2))
+    scores[blue_wins] = float('-inf')
+    scores[red_wins] = float('inf')
+    return scores
+
+
+class PieceSquareEvaluation:
+    """A avaliação expressa como tabelas por peça e casa
+
+    Para cada máscara de ratos no rio e cada peça (índice peça + 8), guarda o termo da peça
+    em cada casa (material, proximidade à toca e bónus, com sinal do ponto de vista do
+    vermelho) e a sua distância à toca adversária, usada na corrida. A avaliação de um
+    tabuleiro é a soma dos termos mais a corrida, igual à de evaluate_position.
+
+    Args:
+        weights (dict): pesos da avaliação (ver DEFAULT_WEIGHTS)
+    """
+    def __init__(self, weights: dict):
+        self.weights = weights
+        self.race_weight = weights['race']
+        self.terms = np.zeros((len(DISTANCE_MAPS[0]), 17, 7, 6))  # [máscara, peça + 8, linha, coluna]
+        self.distances = np.full((2, len(DISTANCE_MAPS[0]), 17, 7, 6), NO_PIECE)  # [jogador, máscara, ...]
+        for piece in range(-8, 9):
+            if piece == 0:
+                continue
+            side = 0 if piece > 0 else 1
+            distance = DISTANCE_MAPS[side, :, CLASS_OF_RANK[abs(piece)]].astype(np.int64)
+            bonus = np.select([distance <= limit for limit in DEN_BONUS_LIMITS], weights['den_bonuses'], 0)
+            term = weights['piece_values'][abs(piece)] + (8 - distance) * weights['proximity'] + bonus
+            self.terms[:, piece + 8] = term if piece < 0 else -term
+            self.distances[side, :, piece + 8] = distance
+
+        # Cópias em listas para consultas casa a casa (mais rápidas do que indexar o numpy)
+        self.term_rows = self.terms.tolist()
+        self.distance_rows = self.distances.tolist()
+
+    def evaluate_many(self, boards: np.ndarray) -> np.ndarray:
+        """Avalia vários tabuleiros numa só passagem
+
+        Args:
+            boards (ndarray): tabuleiros empilhados, forma (N, 7, 6)
+
+        Returns:
+            ndarray: N pontuações do ponto de vista do vermelho (infinitas nas posições terminais)
+        """
+        boards = np.asarray(boards)
+        masks = (np.abs(boards[:, _RIVER_ROWS, _RIVER_COLS]) == 1) @ _RIVER_BITS
+        index = (masks[:, None, None], boards.astype(np.intp) + 8, _ROWS, _COLS)
+        scores = self.terms[index].sum(axis=(1, 2))
+
+        # Corrida: diferença entre as peças de cada jogador mais próximas da toca adversária
+        closest_blue = self.distances[0][index].min(axis=(1, 2))
+        closest_red = self.distances[1][index].min(axis=(1, 2))
+        scores += (closest_blue - closest_red) * self.race_weight
+        return mark_terminal(boards, scores)
+
+
+class IncrementalEvaluation:
+    """Avaliação mantida como somas acumuladas, atualizadas jogada a jogada
+
+    Guarda o material e a proximidade às tocas (com os bónus) de cada jogador, e um
+    multiconjunto das distâncias das peças de cada jogador para obter a mais próxima
+    na corrida. Cada jogada só altera os termos da peça movida e da capturada; quando
+    muda a máscara dos ratos no rio, os termos dos leões são recalculados.
+
+    Args:
+        tables (PieceSquareEvaluation): tabelas de onde vêm os termos de cada peça
+    """
+    def __init__(self, tables: PieceSquareEvaluation):
+        self.tables = tables
+        self.active = False  # Se as somas correspondem ao tabuleiro do modelo
+        self.score_sum = 0  # Material e proximidade, do ponto de vista do vermelho
+        self.distance_counts = ([0] * (NO_PIECE + 1), [0] * (NO_PIECE + 1))  # [jogador][distância]
+        self.jumpers = {}  # Posição -> peça, para as peças cujas distâncias dependem do rio
+        self.mask = 0
+        self.stack = []  # (start, end, peça, capturada, máscara anterior) de cada jogada
+
+    def reset(self, board) -> None:
+        """Recalcula todas as somas a partir do tabuleiro"""
+        self.score_sum = 0
+        for counts in self.distance_counts:
+            counts[:] = [0] * len(counts)
+        self.jumpers = {}
+        self.mask = river_mask(board)
+        self.stack = []
+        for i in range(7):
+            for j in range(6):
+                piece = int(board[i, j])
+                if piece != 0:
+                    self._add(piece, (i, j))
+        self.active = True
+
+    def _add(self, piece: int, pos: tuple, sign: int = 1) -> None:
+        """Soma (sign=1) ou retira (sign=-1) os termos de uma peça"""
+        side = 0 if piece > 0 else 1
+        self.score_sum += sign * self.tables.term_rows[self.mask][piece + 8][pos[0]][pos[1]]
+        self.distance_counts[side][self.tables.distance_rows[side][self.mask][piece + 8][pos[0]][pos[1]]] += sign
+        if CLASS_OF_RANK[abs(piece)] == JUMPER:
+            if sign > 0:
+                self.jumpers[pos] = piece
+            else:
+                del self.jumpers[pos]
+
+    def _remap(self, mask: int) -> None:
+        """Troca os mapas de distância quando mudam os ratos no rio"""
+        jumpers = list(self.jumpers.items())
+        for pos, piece in jumpers:
+            self._add(piece, pos, -1)
+        self.mask = mask
+        for pos, piece in jumpers:
+            self._add(piece, pos)
+
+    def push(self, board, start: tuple, end: tuple) -> None:
+        """Atualiza as somas para uma jogada; deve ser chamado antes de a fazer no tabuleiro"""
+        piece = int(board[start[0], start[1]])
+        captured = int(board[end[0], end[1]])
+        self.stack.append((start, end, piece, captured, self.mask))
+
+        self._add(piece, start, -1)
+        if captured != 0:
+            self._add(captured, end, -1)
+
+        # Só um rato pode entrar, sair ou ser capturado no rio
+        mask = self.mask
+        if abs(piece) == 1 or abs(captured) == 1:
+            for k, square in enumerate(RIVER_SQUARES):
+                if square == start or square == end:
+                    mask &= ~(1 << k)
+                if square == end and abs(piece) == 1:
+                    mask |= 1 << k
+        if mask != self.mask:
+            self._remap(mask)
+
+        self._add(piece, end)
+
+    def pop(self) -> None:
+        """Desfaz a última jogada registada com push"""
+        start, end, piece, captured, mask = self.stack.pop()
+        self._add(piece, end, -1)
+        if mask != self.mask:
+            self._remap(mask)
+        if captured != 0:
+            self._add(captured, end)
+        self._add(piece, start)
+
+    def evaluate(self, board) -> float:
+        """Avaliação completa de um tabuleiro com os mesmos pesos, sem usar as somas"""
+        return evaluate_position(board, self.tables.weights)
+
+    def evaluate_many(self, boards: np.ndarray) -> np.ndarray:
+        """Avalia vários tabuleiros numa só passagem (PieceSquareEvaluation.evaluate_many)"""
+        return self.tables.evaluate_many(boards)
+
+    def score(self) -> float:
+        """Pontuação do ponto de vista do vermelho, igual à de evaluate_position"""
+        blue_counts, red_counts = self.distance_counts
+        closest_blue = next((d for d, n in enumerate(blue_counts) if n), float('inf'))
+        closest_red = next((d for d, n in enumerate(red_counts) if n), float('inf'))
+        return self.score_sum + race_score(closest_red, closest_blue, self.tables.race_weight)
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def _least_valuable_attacker(model, target: tuple, side: int, piece_values: dict):
+    """Procura a peça menos valiosa do jogador side que pode capturar em target
+
+    Os candidatos são as peças adjacentes e o leão (que pode chegar por um salto sobre o rio);
+    a legalidade é confirmada pelas regras do modelo, incluindo armadilhas e o rio.
+    """
+    board = model.game_board
+    candidates = []
+    for di, dj in _DIRECTIONS:
+        i, j = target[0] + di, target[1] + dj
+        if 0 <= i < 7 and 0 <= j < 6:
+            candidates.append((i, j))
+    lion = np.argwhere(board == (7 if side == 0 else -7))
+    if len(lion):
+        candidates.append((int(lion[0][0]), int(lion[0][1])))
+
+    best = None
+    for pos in candidates:
+        piece = board[pos[0], pos[1]]
+        if piece == 0 or (piece > 0) != (side == 0):
+            continue
+        if best is not None and piece_values[abs(piece)] >= piece_values[abs(board[best[0], best[1]])]:
+            continue
+        if model.is_valid_move(pos, target):
+            best = pos
+    return best
+
+
+def static_exchange(model, move: tuple, piece_values: dict) -> float:
+    """Avaliação estática da troca iniciada por uma captura (SEE)
+
+    Joga a sequência de capturas na casa de destino, usando sempre a peça menos valiosa
+    disponível, e devolve o saldo de material para quem faz a jogada, sabendo que cada
+    jogador pode parar a sequência quando continuar não lhe convém. O tabuleiro é reposto.
+
+    Args:
+        model (Model): modelo do jogo
+        move (tuple): jogada (start, end); sem peça em end o saldo é 0
+        piece_values (dict): valor de cada rank
+
+    Returns:
+        float: ganho de material esperado para quem joga
+    """
+    board = model.game_board
+    start, target = move
+    victim = board[target[0], target[1]]
+    if victim == 0:
+        return 0
+
+    side = 0 if board[start[0], start[1]] > 0 else 1
+    gains = [piece_values[abs(victim)]]
+    undo = [(start, model.make_move(start, target))]
+
+    side = 1 - side
+    while True:
+        attacker = _least_valuable_attacker(model, target, side, piece_values)
+        if attacker is None:
+            break
+        gains.append(piece_values[abs(board[target[0], target[1]])] - gains[-1])
+        undo.append((attacker, model.make_move(attacker, target)))
+        side = 1 - side
+
+    for pos, captured in reversed(undo):
+        model.unmake_move(pos, target, captured)
+
+    # Cada jogador só continua a troca se isso não o prejudicar
+    for k in range(len(gains) - 1, 0, -1):
+        gains[k - 1] = -max(-gains[k - 1], gains[k])
+    return gains[0]
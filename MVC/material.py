@@ -0,0 +1,257 @@
+import argparse
+import json
+import os
+import random
+import time
+import numpy as np
+
+
+# Tabela de conhecimento por material lida pelas IAs (python -m MVC.material build)
+DEFAULT_MATERIAL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'material.json')
+
+# Bit de cada peça na chave de material (índice: peça + 8): ranks azuis nos bits 0-7, vermelhos nos 8-15.
+# Cada jogador tem no máximo uma peça de cada rank, por isso a chave identifica a assinatura de material
+MATERIAL_BITS = [1 << (abs(piece) + 7) if piece < 0 else (1 << (piece - 1) if piece > 0 else 0) for piece in range(-8, 9)]
+
+
+def material_key(board: np.ndarray) -> int:
+    """Chave de material de um tabuleiro (mantida de forma incremental por Model.material)"""
+    key = 0
+    for piece in board[board != 0].tolist():
+        key |= MATERIAL_BITS[piece + 8]
+    return key
+
+
+def key_of_signature(blue: tuple, red: tuple) -> int:
+    """Chave de material de uma assinatura (ranks azuis, ranks vermelhos)"""
+    key = 0
+    for rank in blue:
+        key |= MATERIAL_BITS[rank + 8]
+    for rank in red:
+        key |= MATERIAL_BITS[8 - rank]
+    return key
+
+
+def signature_of_key(key: int) -> tuple:
+    """Assinatura (ranks azuis, ranks vermelhos, por ordem decrescente) de uma chave de material"""
+    blue = tuple(rank for rank in range(8, 0, -1) if key & (1 << (rank - 1)))
+    red = tuple(rank for rank in range(8, 0, -1) if key & (1 << (rank + 7)))
+    return (blue, red)
+
+
+def parse_signature(name: str) -> tuple:
+    """Lê uma assinatura no formato de signature_name, por exemplo '87v1'"""
+    blue, red = name.split('v')
+    return (tuple(int(rank) for rank in blue), tuple(int(rank) for rank in red))
+
+
+class MaterialTable:
+    """Conhecimento sobre o resultado do jogo que só depende das peças em jogo
+
+    Cada entrada, indexada pela chave de material, tem um fator de escala da avaliação (menor
+    quando o material tende para o empate) e, quando o material decide o jogo, o resultado
+    conhecido: DRAW, BLUE_WINS ou RED_WINS. Só as entradas vindas das tabelas de finais, que
+    são exatas, têm resultado (e fazem a pesquisa parar); as obtidas por amostragem de jogos
+    são estimativas e dão apenas a escala.
+
+    Args:
+        path (str, optional): ficheiro JSON escrito por save. Sem ficheiro, a tabela fica vazia
+    """
+    DRAW = 'draw'
+    BLUE_WINS = 'blue'
+    RED_WINS = 'red'
+
+    # Sinal do resultado do ponto de vista do vermelho, como a avaliação
+    OUTCOME_SIGNS = {DRAW: 0, BLUE_WINS: -1, RED_WINS: 1}
+
+    def __init__(self, path: str = DEFAULT_MATERIAL_PATH) -> None:
+        self.entries = {}  # Chave de material -> (escala, resultado ou None)
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            for name, entry in saved.items():
+                self.entries[key_of_signature(*parse_signature(name))] = (float(entry['scale']), entry.get('outcome'))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: int):
+        """Devolve (escala, resultado) da chave de material, ou None se não houver conhecimento"""
+        return self.entries.get(key)
+
+    def outcome(self, key: int):
+        """Resultado que o material decide (DRAW, BLUE_WINS ou RED_WINS), ou None"""
+        entry = self.entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def update(self, entries: dict) -> None:
+        """Acrescenta entradas {chave de material: (escala, resultado)}, substituindo as existentes"""
+        self.entries.update(entries)
+
+    def save(self, path: str) -> None:
+        """Grava a tabela em JSON, com as assinaturas legíveis (por exemplo '87v1')"""
+        from MVC.tablebase import signature_name  # MVC.tablebase importa o modelo, que importa este módulo
+        saved = {}
+        for key in sorted(self.entries):
+            scale, outcome = self.entries[key]
+            saved[signature_name(*signature_of_key(key))] = {'scale': round(scale, 4), 'outcome': outcome}
+        with open(path, 'w') as f:
+            json.dump(saved, f, indent=4)
+
+
+def _summarize(draws: int, blue_wins: int, red_wins: int, exact: bool = True) -> tuple:
+    """Entrada da tabela a partir da contagem de resultados: escala pela taxa de empates e,
+    com contagens exatas, resultado conhecido quando todos os resultados coincidem"""
+    total = draws + blue_wins + red_wins
+    if total == 0:
+        return None
+    outcome = None  # Em amostras o resultado não fica conhecido, por mais que coincidam
+    if exact:
+        if draws == total:
+            outcome = MaterialTable.DRAW
+        elif blue_wins == total:
+            outcome = MaterialTable.BLUE_WINS
+        elif red_wins == total:
+            outcome = MaterialTable.RED_WINS
+    return (1.0 - draws / total, outcome)
+
+
+def from_tablebases(directory: str, verbose: bool = True) -> dict:
+    """Entradas exatas para as assinaturas com tabela de finais
+
+    As posições já terminadas são ignoradas (a pesquisa deteta-as antes da avaliação); as
+    restantes contam para a taxa de empates, com os dois jogadores a jogar.
+
+    Args:
+        directory (str): diretório das tabelas (ver MVC.tablebase)
+        verbose (bool): imprime cada assinatura
+
+    Returns:
+        dict: {chave de material: (escala, resultado)}
+    """
+    from MVC.tablebase import DRAW, INVALID, _HEADER  # MVC.tablebase importa o modelo, que importa este módulo
+    entries = {}
+    if not os.path.isdir(directory):
+        return entries
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.tb'):
+            continue
+        blue, red = parse_signature(filename[:-3])
+        values = np.fromfile(os.path.join(directory, filename), dtype=np.uint8, offset=_HEADER.size)
+        half = len(values) // 2
+        counts = {'draws': 0, 'blue': 0, 'red': 0}
+        for turn, part in ((0, values[:half]), (1, values[half:])):
+            part = part[(part != INVALID) & (part != 1)]  # 1: posição já perdida para quem joga
+            counts['draws'] += int((part == DRAW).sum())
+            mover_wins = int(((part != DRAW) & ((part - 1) % 2 == 1)).sum())
+            mover_losses = int(((part != DRAW) & ((part - 1) % 2 == 0)).sum())
+            counts['blue' if turn == 0 else 'red'] += mover_wins
+            counts['red' if turn == 0 else 'blue'] += mover_losses
+        entry = _summarize(counts['draws'], counts['blue'], counts['red'])
+        if entry is not None:
+            entries[key_of_signature(blue, red)] = entry
+            if verbose:
+                print(f"{filename[:-3]}: escala {entry[0]:.3f}, resultado {entry[1]}")
+    return entries
+
+
+def random_position(blue: tuple, red: tuple, rng: random.Random) -> np.ndarray:
+    """Coloca as peças de uma assinatura em casas aleatórias válidas (fora das tocas próprias e,
+    exceto os ratos, fora do rio), repetindo até a posição não estar terminada"""
+    river = {(i, j) for i in (2, 3, 4) for j in (1, 4)}
+    squares = [(i, j) for i in range(7) for j in range(6)]
+    while True:
+        board = np.zeros((7, 6), dtype=int)
+        free = squares.copy()
+        rng.shuffle(free)
+        for piece in list(blue) + [-rank for rank in red]:
+            own_den = (6, 2) if piece > 0 else (0, 3)
+            pos = next(pos for pos in free if pos != own_den and (abs(piece) == 1 or pos not in river))
+            free.remove(pos)
+            board[pos] = piece
+        if board[0, 3] <= 0 and board[6, 2] >= 0:
+            return board
+
+
+def sample_signature(blue: tuple, red: tuple, samples: int = 32, depth: int = 2, max_plies: int = 60,
+                     seed: int = None) -> tuple:
+    """Estima a entrada de uma assinatura jogando partidas entre as IAs a partir de posições aleatórias
+
+    As partidas que chegam a max_plies contam como empate. A entrada dá só a escala: uma
+    amostra pequena de partidas pouco profundas não chega para decidir o resultado e parar
+    a pesquisa nessas posições.
+
+    Returns:
+        tuple: (escala, None)
+    """
+    from MVC.engine import AI  # MVC.engine importa o modelo, que importa este módulo
+    from MVC.model import Model
+    rng = random.Random(seed)
+    model = Model()
+    engine = AI(model, depth)
+    engine.book = None
+    engine.tablebase = None
+    engine.material_table = None  # A estimativa não pode depender da própria tabela
+    counts = {'draws': 0, 'blue': 0, 'red': 0}
+    for _ in range(samples):
+        model.reset()
+        model.set_board(random_position(blue, red, rng))
+        model.turn = rng.randrange(2)
+        result = 'draws'
+        for _ in range(max_plies):
+            move = engine.get_best_move()
+            if move is None:
+                break
+            model.perform_move(*move)
+            is_win, winner = model.is_win()
+            if is_win:
+                result = 'red' if winner == 'Vermelho' else 'blue'
+                break
+            model.switch_turn()
+        counts[result] += 1
+    return _summarize(counts['draws'], counts['blue'], counts['red'], exact=False)
+
+
+def build(tablebase_dir: str = None, sample_names: list = (), samples: int = 32, depth: int = 2,
+          path: str = DEFAULT_MATERIAL_PATH, seed: int = None, verbose: bool = True) -> MaterialTable:
+    """Constrói a tabela: entradas exatas das tabelas de finais e estimativas por amostragem
+
+    Args:
+        tablebase_dir (str, optional): diretório das tabelas de finais
+        sample_names (list[str]): assinaturas a estimar por amostragem, por exemplo ['87v1']
+        samples (int): partidas por assinatura amostrada
+        depth (int): profundidade das IAs nas partidas
+        path (str): tabela existente a completar (as entradas novas substituem as antigas)
+        seed (int, optional): semente das posições aleatórias
+        verbose (bool): imprime o progresso
+
+    Returns:
+        MaterialTable: tabela construída
+    """
+    table = MaterialTable(path)
+    if tablebase_dir is not None:
+        table.update(from_tablebases(tablebase_dir, verbose))
+    for name in sample_names:
+        blue, red = parse_signature(name)
+        entry = sample_signature(blue, red, samples, depth, seed=seed)
+        if entry is not None:
+            table.update({key_of_signature(blue, red): entry})
+            if verbose:
+                print(f"{name}: escala {entry[0]:.3f}, resultado {entry[1]} ({samples} partidas)")
+    return table
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Constrói a tabela de conhecimento por material')
+    parser.add_argument('--tablebases', default=None, help='diretório das tabelas de finais a resumir')
+    parser.add_argument('--sample', nargs='*', default=[], help='assinaturas a estimar por amostragem (ex.: 87v1)')
+    parser.add_argument('--samples', type=int, default=32, help='partidas por assinatura amostrada')
+    parser.add_argument('--depth', type=int, default=2, help='profundidade das IAs nas partidas')
+    parser.add_argument('--seed', type=int, default=None, help='semente das posições aleatórias')
+    parser.add_argument('--output', default=DEFAULT_MATERIAL_PATH, help='ficheiro da tabela')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    built = build(args.tablebases, args.sample, args.samples, args.depth, args.output, args.seed)
+    built.save(args.output)
+    print(f"{len(built)} assinaturas gravadas em {args.output} em {time.perf_counter() - start:.1f} s")
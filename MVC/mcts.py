@@ -0,0 +1,360 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from MVC.model import Model
+from MVC.book import OpeningBook
+from MVC.tablebase import Tablebase
+
+
+# Valores das peças usados pela política de simulação e pela avaliação no fim da simulação
+PIECE_VALUES = {1: 6, 2: 3, 3: 4, 4: 5, 5: 6, 6: 7, 7: 8, 8: 15}
+
+# Tocas de destino de cada jogador: o azul (0) ataca (0, 3), o vermelho (1) ataca (6, 2)
+TARGET_DENS = {0: (0, 3), 1: (6, 2)}
+
+
+class _MCTSNode:
+    """Nó da árvore de Monte Carlo"""
+    __slots__ = ('move', 'parent', 'children', 'untried', 'visits', 'wins', 'side', 'winner')
+
+    def __init__(self, move, parent, side: int) -> None:
+        self.move = move        # Jogada que levou a este nó
+        self.parent = parent
+        self.children = []
+        self.untried = None     # Jogadas ainda por expandir (geradas na primeira visita)
+        self.visits = 0
+        self.wins = 0.0         # Vitórias do ponto de vista de quem fez a jogada
+        self.side = side        # Jogador que fez a jogada (0 Azul, 1 Vermelho)
+        self.winner = None      # Vencedor se a posição for terminal
+
+
+class MCTSAI:
+    def __init__(self, model: Model, iterations: int = 1000, time_limit: float = None,
+                 processes: int = 1, exploration: float = 1.4, rollout_limit: int = 16, seed: int = None):
+        """Inicia a IA de pesquisa em árvore de Monte Carlo (UCT)
+
+        Args:
+            model (Model): modelo do jogo
+            iterations (int): número de simulações por jogada
+            time_limit (float, optional): tempo máximo em segundos por jogada; substitui iterations
+            processes (int): processos para o modo paralelo na raiz (1 desativa)
+            exploration (float): constante de exploração do UCT
+            rollout_limit (int): número máximo de meias-jogadas por simulação
+            seed (int, optional): semente para reprodutibilidade
+        """
+        self.model = model
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.processes = processes
+        self.exploration = exploration
+        self.rollout_limit = rollout_limit
+        self.rng = random.Random(seed)
+
+        # Reutilização da árvore entre jogadas
+        self.root = None
+        self.root_board = None  # Tabuleiro da raiz guardada
+        self.last_move = None   # Jogada escolhida a partir da raiz guardada
+        self.simulations = 0    # Simulações feitas na última pesquisa
+
+        # Livro de aberturas e tabelas de finais consultados antes das simulações (None desativa)
+        self.book = OpeningBook()
+        self.tablebase = Tablebase()
+
+    def get_best_move(self) -> tuple:
+        """Retorna a jogada com mais visitas depois das simulações"""
+        if self.book is not None:
+            book_move = self.book.choose(self.model)
+            if book_move is not None:
+                return book_move
+
+        moves = self._generate_moves(self.model.turn)
+        if not moves:
+            return None
+
+        # Entrada direta no covil adversário
+        for start, end in moves:
+            if end == TARGET_DENS[self.model.turn]:
+                return (start, end)
+
+        # Com poucas peças, joga a jogada exata das tabelas de finais
+        if self.tablebase is not None:
+            excluded = self.model.forbidden_move if self.model.cycle_detected else None
+            tablebase_move = self.tablebase.best_move(self.model, excluded)
+            if tablebase_move is not None:
+                return tablebase_move
+
+        if self.processes > 1:
+            stats = self._search_parallel()
+        else:
+            stats = self._search()
+
+        ranked = sorted(stats.items(), key=lambda item: item[1][0], reverse=True)
+        if not ranked:
+            return None
+        self.last_move = ranked[0][0]
+        return self.last_move
+
+    def get_alternative_move(self) -> tuple:
+        """Retorna a jogada mais visitada diferente do movimento proibido"""
+        if self.root is not None and self.root_board is not None and np.array_equal(self.root_board, self.model.game_board):
+            for child in sorted(self.root.children, key=lambda node: node.visits, reverse=True):
+                if child.move != self.model.forbidden_move:
+                    return child.move
+
+        moves = [move for move in self._generate_moves(self.model.turn) if move != self.model.forbidden_move]
+        return self.rng.choice(moves) if moves else None
+
+    def get_ponder_move(self, move: tuple) -> tuple:
+        """Resposta prevista do adversário a uma jogada: a mais visitada abaixo dela na árvore
+
+        Args:
+            move (tuple): jogada escolhida por get_best_move
+
+        Returns:
+            tuple: jogada (start, end) do adversário, ou None se a árvore não a tiver explorado
+        """
+        if self.root is None or self.root_board is None or not np.array_equal(self.root_board, self.model.game_board):
+            return None
+        for child in self.root.children:
+            if child.move == move and child.children:
+                return max(child.children, key=lambda node: node.visits).move
+        return None
+
+    def root_statistics(self) -> dict:
+        """Estatísticas das jogadas da raiz da última pesquisa
+
+        Returns:
+            dict: jogada -> (visitas, vitórias)
+        """
+        if self.root is None:
+            return {}
+        return {child.move: (child.visits, child.wins) for child in self.root.children}
+
+    def _search(self) -> dict:
+        """Executa as simulações num único processo, reaproveitando a árvore anterior se possível"""
+        root = self._find_reusable_root()
+        if root is None:
+            root = _MCTSNode(None, None, 1 - self.model.turn)
+        else:
+            self._restrict_root(root)
+        self.root = root
+        self.root_board = self.model.game_board.copy()
+
+        deadline = time.perf_counter() + self.time_limit if self.time_limit else None
+        self.simulations = 0
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    break
+            elif self.simulations >= self.iterations:
+                break
+            self._iterate(root)
+            self.simulations += 1
+
+        return self.root_statistics()
+
+    def _search_parallel(self) -> dict:
+        """Paralelismo na raiz: cada processo constrói uma árvore independente e as visitas são somadas"""
+        board = self.model.game_board.copy()
+        forbidden = self.model.forbidden_move if self.model.cycle_detected else None
+        iterations = max(1, self.iterations // self.processes)
+        jobs = [(board, self.model.turn, forbidden, iterations, self.time_limit,
+                 self.exploration, self.rollout_limit, self.rng.randrange(2 ** 31))
+                for _ in range(self.processes)]
+
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            results = list(executor.map(_parallel_worker, jobs))
+
+        stats = {}
+        for result in results:
+            for move, (visits, wins) in result.items():
+                total_visits, total_wins = stats.get(move, (0, 0.0))
+                stats[move] = (total_visits + visits, total_wins + wins)
+
+        # Sem árvore local: a reutilização fica desativada neste modo
+        self.root = None
+        self.root_board = None
+        self.simulations = sum(visits for visits, _ in stats.values())
+        return stats
+
+    def _find_reusable_root(self):
+        """Procura na árvore anterior o nó que corresponde à posição atual (a nossa jogada e a resposta)"""
+        if self.root is None or self.root_board is None or self.last_move is None:
+            return None
+
+        for child in self.root.children:
+            if child.move != self.last_move:
+                continue
+            for grandchild in child.children:
+                board = self.root_board.copy()
+                for start, end in (child.move, grandchild.move):
+                    board[end[0], end[1]] = board[start[0], start[1]]
+                    board[start[0], start[1]] = 0
+                if np.array_equal(board, self.model.game_board):
+                    grandchild.parent = None
+                    grandchild.move = None
+                    return grandchild
+        return None
+
+    def _restrict_root(self, root: _MCTSNode) -> None:
+        """Limita um nó reaproveitado como raiz às jogadas de _root_moves
+
+        O nó foi expandido como neto da raiz anterior, com todas as jogadas; o movimento
+        proibido da posição atual é retirado dos filhos e das jogadas por expandir.
+        """
+        allowed = set(self._root_moves())
+        root.children = [child for child in root.children if child.move in allowed]
+        if root.untried is not None:
+            root.untried = [move for move in root.untried if move in allowed]
+
+    def _iterate(self, root: _MCTSNode) -> None:
+        """Uma simulação: seleção, expansão, simulação aleatória guiada e retropropagação"""
+        board = self.model.game_board
+        path = []   # Jogadas feitas no tabuleiro, para desfazer no fim
+        node = root
+        side = self.model.turn  # Jogador a jogar na posição do nó atual
+
+        # Seleção
+        while node.winner is None and node.untried is not None and not node.untried and node.children:
+            node = self._select_child(node)
+            path.append(self._make(node.move))
+            side = 1 - side
+
+        # Expansão
+        if node.winner is None:
+            if node.untried is None:
+                node.untried = self._root_moves() if node is root else self._generate_moves(side)
+                self.rng.shuffle(node.untried)
+            if node.untried:
+                move = node.untried.pop()
+                child = _MCTSNode(move, node, side)
+                node.children.append(child)
+                path.append(self._make(move))
+                side = 1 - side
+                is_win, winner = self.model.is_win()
+                if is_win:
+                    child.winner = 0 if winner == 'Azul' else 1
+                node = child
+
+        # Simulação: probabilidade de vitória do azul
+        if node.winner is not None:
+            blue_result = 1.0 if node.winner == 0 else 0.0
+        else:
+            blue_result = self._rollout(side)
+
+        # Retropropagação
+        while node is not None:
+            node.visits += 1
+            node.wins += blue_result if node.side == 0 else 1.0 - blue_result
+            node = node.parent
+
+        for start, end, captured in reversed(path):
+            self.model.unmake_move(start, end, captured)
+
+    def _select_child(self, node: _MCTSNode) -> _MCTSNode:
+        """Escolhe o filho com maior valor UCT"""
+        log_visits = math.log(node.visits)
+        return max(node.children,
+                   key=lambda child: child.wins / child.visits + self.exploration * math.sqrt(log_visits / child.visits))
+
+    def _rollout(self, side: int) -> float:
+        """Simula a partida com uma política barata e devolve a probabilidade de vitória do azul"""
+        board = self.model.game_board
+        played = []
+        result = None
+        for _ in range(self.rollout_limit):
+            moves = self._generate_moves(side)
+            if not moves:
+                break
+            move = self._policy(moves, side)
+            played.append(self._make(move))
+            is_win, winner = self.model.is_win()
+            if is_win:
+                result = 1.0 if winner == 'Azul' else 0.0
+                break
+            side = 1 - side
+
+        if result is None:
+            result = self._heuristic_result()
+
+        for start, end, captured in reversed(played):
+            self.model.unmake_move(start, end, captured)
+        return result
+
+    def _policy(self, moves: list, side: int) -> tuple:
+        """Escolhe uma jogada ao acaso, com peso maior para capturas e aproximações ao covil"""
+        board = self.model.game_board
+        den = TARGET_DENS[side]
+        weights = []
+        for start, end in moves:
+            if end == den:
+                return (start, end)
+            weight = 1.0
+            captured = board[end[0], end[1]]
+            if captured != 0:
+                weight += PIECE_VALUES[abs(captured)]
+            dist_before = abs(start[0] - den[0]) + abs(start[1] - den[1])
+            dist_after = abs(end[0] - den[0]) + abs(end[1] - den[1])
+            if dist_after < dist_before:
+                weight += 2.0
+            weights.append(weight)
+        return self.rng.choices(moves, weights=weights)[0]
+
+    def _heuristic_result(self) -> float:
+        """Avaliação barata no fim da simulação: material e corrida ao covil, convertidos em probabilidade"""
+        board = self.model.game_board
+        score = 0.0  # Positivo favorece o azul
+        closest = {0: 99, 1: 99}
+        for i in range(7):
+            for j in range(6):
+                piece = board[i, j]
+                if piece == 0:
+                    continue
+                side = 0 if piece > 0 else 1
+                value = PIECE_VALUES[abs(piece)]
+                score += value if side == 0 else -value
+                den = TARGET_DENS[side]
+                closest[side] = min(closest[side], abs(i - den[0]) + abs(j - den[1]))
+        score += (closest[1] - closest[0]) * 3
+        return 1.0 / (1.0 + math.exp(-score / 10.0))
+
+    def _root_moves(self) -> list:
+        """Jogadas da raiz, sem o movimento proibido quando há um ciclo"""
+        moves = self._generate_moves(self.model.turn)
+        if self.model.forbidden_move and self.model.cycle_detected:
+            allowed = [move for move in moves if move != self.model.forbidden_move]
+            moves = allowed or moves
+        return moves
+
+    def _generate_moves(self, side: int) -> list:
+        """Gera todas as jogadas legais do jogador indicado"""
+        moves = []
+        board = self.model.game_board
+        for i in range(7):
+            for j in range(6):
+                piece = board[i, j]
+                if (side == 0 and piece > 0) or (side == 1 and piece < 0):
+                    possible_moves = self.model.get_possible_moves((i, j))
+                    if possible_moves:
+                        moves.extend(((i, j), move) for move in possible_moves)
+        return moves
+
+    def _make(self, move: tuple) -> tuple:
+        """Executa uma jogada no tabuleiro e devolve o necessário para a desfazer"""
+        start, end = move
+        return (start, end, self.model.make_move(start, end))
+
+
+def _parallel_worker(job: tuple) -> dict:
+    """Executa uma pesquisa MCTS independente num processo filho (modo paralelo na raiz)"""
+    board, turn, forbidden, iterations, time_limit, exploration, rollout_limit, seed = job
+    model = Model()
+    model.set_board(board)
+    model.turn = turn
+    model.forbidden_move = forbidden
+    model.cycle_detected = forbidden is not None
+    ai = MCTSAI(model, iterations, time_limit, 1, exploration, rollout_limit, seed)
+    ai.book = None
+    return ai._search()
@@ -0,0 +1,240 @@
+import argparse
+import os
+import time
+import numpy as np
+from MVC.evaluation import mark_terminal
+
+
+# Rede treinada lida pelas IAs que a usam (python -m MVC.nnue train)
+DEFAULT_NETWORK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'nnue.npz')
+
+# Entradas: uma por tipo de peça (8 azuis, 8 vermelhas) e casa
+SQUARES = 42
+INPUTS = 16 * SQUARES
+
+# A saída da rede é a vantagem do vermelho em unidades logísticas; a avaliação usa a escala do motor
+EVAL_SCALE = 100.0
+
+
+def feature_index(piece: int, row: int, col: int) -> int:
+    """Índice da entrada ativa para uma peça numa casa"""
+    kind = abs(piece) - 1 if piece > 0 else abs(piece) + 7
+    return kind * SQUARES + row * 6 + col
+
+
+def active_features(boards: np.ndarray) -> tuple:
+    """Entradas ativas de vários tabuleiros
+
+    Args:
+        boards (ndarray): tabuleiros empilhados, forma (N, 7, 6)
+
+    Returns:
+        tuple(ndarray, ndarray): índice do tabuleiro e índice da entrada de cada peça
+    """
+    boards = np.asarray(boards, dtype=np.intp)
+    board_index, rows, cols = np.nonzero(boards)
+    pieces = boards[board_index, rows, cols]
+    kinds = np.where(pieces > 0, np.abs(pieces) - 1, np.abs(pieces) + 7)
+    return board_index, kinds * SQUARES + rows * 6 + cols
+
+
+class Network:
+    """Rede com uma camada escondida: entradas por peça e casa, ReLU limitada e saída escalar
+
+    Args:
+        hidden (int): neurónios da camada escondida
+        seed (int, optional): semente da inicialização
+    """
+    def __init__(self, hidden: int = 32, seed: int = None):
+        rng = np.random.default_rng(seed)
+        self.w1 = rng.normal(0, 0.05, (INPUTS, hidden))
+        self.b1 = np.zeros(hidden)
+        self.w2 = rng.normal(0, 0.05, hidden)
+        self.b2 = 0.0
+
+    @property
+    def hidden(self) -> int:
+        return len(self.b1)
+
+    def accumulate(self, board) -> np.ndarray:
+        """Acumulador da primeira camada (antes da ativação) para um tabuleiro"""
+        _, features = active_features(np.asarray(board)[None])
+        return self.b1 + self.w1[features].sum(axis=0)
+
+    def output(self, accumulator: np.ndarray) -> float:
+        """Avaliação a partir do acumulador, na escala do motor e do ponto de vista do vermelho"""
+        return float(np.clip(accumulator, 0, 1) @ self.w2 + self.b2) * EVAL_SCALE
+
+    def evaluate(self, board) -> float:
+        """Avaliação completa de um tabuleiro"""
+        return self.output(self.accumulate(board))
+
+    def evaluate_many(self, boards: np.ndarray) -> np.ndarray:
+        """Avalia vários tabuleiros numa só passagem (infinito nas posições terminais)"""
+        boards = np.asarray(boards)
+        hidden = self.forward(boards)[2]
+        scores = (hidden @ self.w2 + self.b2) * EVAL_SCALE
+        return mark_terminal(boards, scores)
+
+    def forward(self, boards: np.ndarray) -> tuple:
+        """Passagem em lote, devolvendo também os valores intermédios usados no treino
+
+        Returns:
+            tuple: (entradas densas, pré-ativações, ativações, saídas em unidades logísticas)
+        """
+        board_index, features = active_features(boards)
+        inputs = np.zeros((len(boards), INPUTS))
+        inputs[board_index, features] = 1
+        pre = inputs @ self.w1 + self.b1
+        hidden = np.clip(pre, 0, 1)
+        return inputs, pre, hidden, hidden @ self.w2 + self.b2
+
+    def save(self, path: str) -> None:
+        """Grava os pesos num ficheiro .npz"""
+        np.savez(path, w1=self.w1, b1=self.b1, w2=self.w2, b2=self.b2)
+
+    @classmethod
+    def load(cls, path: str):
+        """Lê uma rede gravada com save"""
+        with np.load(path) as data:
+            network = cls(len(data['b1']))
+            network.w1 = data['w1'].astype(np.float64)
+            network.b1 = data['b1'].astype(np.float64)
+            network.w2 = data['w2'].astype(np.float64)
+            network.b2 = float(data['b2'])
+        return network
+
+
+def load_network(path: str = DEFAULT_NETWORK_PATH):
+    """Lê a rede treinada, ou devolve None se o ficheiro não existir"""
+    if path is None or not os.path.exists(path):
+        return None
+    return Network.load(path)
+
+
+class NetworkEvaluation:
+    """Avaliação pela rede com o acumulador da primeira camada atualizado jogada a jogada
+
+    Cada jogada retira do acumulador as colunas da peça que sai da casa de partida e da
+    peça capturada, e soma a da peça que chega; avaliar custa só a camada de saída.
+    Tem a mesma interface que IncrementalEvaluation.
+
+    Args:
+        network (Network): rede a usar
+    """
+    def __init__(self, network: Network):
+        self.network = network
+        self.active = False  # Se o acumulador corresponde ao tabuleiro do modelo
+        self.accumulator = network.b1.copy()
+        self.stack = []  # Acumuladores anteriores, repostos por pop
+
+    def reset(self, board) -> None:
+        """Recalcula o acumulador a partir do tabuleiro"""
+        self.accumulator = self.network.accumulate(board)
+        self.stack = []
+        self.active = True
+
+    def push(self, board, start: tuple, end: tuple) -> None:
+        """Atualiza o acumulador para uma jogada; deve ser chamado antes de a fazer no tabuleiro"""
+        w1 = self.network.w1
+        piece = int(board[start[0], start[1]])
+        captured = int(board[end[0], end[1]])
+        self.stack.append(self.accumulator)
+        accumulator = self.accumulator - w1[feature_index(piece, start[0], start[1])]
+        if captured != 0:
+            accumulator -= w1[feature_index(captured, end[0], end[1])]
+        accumulator += w1[feature_index(piece, end[0], end[1])]
+        self.accumulator = accumulator
+
+    def pop(self) -> None:
+        """Desfaz a última jogada registada com push"""
+        self.accumulator = self.stack.pop()
+
+    def evaluate(self, board) -> float:
+        """Avaliação completa de um tabuleiro, sem usar o acumulador"""
+        return self.network.evaluate(board)
+
+    def evaluate_many(self, boards: np.ndarray) -> np.ndarray:
+        """Avalia vários tabuleiros numa só passagem (Network.evaluate_many)"""
+        return self.network.evaluate_many(boards)
+
+    def score(self) -> float:
+        """Pontuação do ponto de vista do vermelho"""
+        return self.network.output(self.accumulator)
+
+
+def train(paths: list, network: Network = None, hidden: int = 32, epochs: int = 10, chunk_size: int = 4096,
+          learning_rate: float = 1e-3, seed: int = None, verbose: bool = True) -> Network:
+    """Treina a rede a prever o resultado dos jogos a partir das posições
+
+    Lê os ficheiros de jogos (MVC.tuning.generate_games) aos blocos; cada bloco dá um passo
+    de Adam na entropia cruzada entre a previsão logística e o resultado.
+
+    Args:
+        paths (list[str]): ficheiros de jogos
+        network (Network, optional): rede a continuar a treinar. Por omissão cria uma nova
+        hidden (int): neurónios da camada escondida de uma rede nova
+        epochs (int): passagens completas pelos dados
+        chunk_size (int): posições por passo
+        learning_rate (float): passo de Adam
+        seed (int, optional): semente da inicialização
+        verbose (bool): imprime o erro de cada época
+
+    Returns:
+        Network: rede treinada
+    """
+    from MVC.tuning import iterate_chunks  # MVC.tuning importa o motor, que importa este módulo
+    network = network or Network(hidden, seed)
+    names = ('w1', 'b1', 'w2', 'b2')
+    first_moment = {name: np.zeros_like(getattr(network, name)) for name in names}
+    second_moment = {name: np.zeros_like(getattr(network, name)) for name in names}
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-8
+    step = 0
+    for epoch in range(epochs):
+        total_loss = 0.0
+        count = 0
+        for boards, results in iterate_chunks(paths, chunk_size):
+            inputs, pre, hidden_out, outputs = network.forward(boards)
+            predictions = 1 / (1 + np.exp(-np.clip(outputs, -50, 50)))
+            clipped = np.clip(predictions, 1e-7, 1 - 1e-7)
+            loss = -np.mean(results * np.log(clipped) + (1 - results) * np.log(1 - clipped))
+
+            # Retropropagação da entropia cruzada
+            delta = (predictions - results) / len(results)
+            hidden_delta = np.outer(delta, network.w2) * ((pre > 0) & (pre < 1))
+            gradients = {'w1': inputs.T @ hidden_delta,
+                         'b1': hidden_delta.sum(axis=0),
+                         'w2': hidden_out.T @ delta,
+                         'b2': delta.sum()}
+
+            step += 1
+            for name in names:
+                first_moment[name] = beta1 * first_moment[name] + (1 - beta1) * gradients[name]
+                second_moment[name] = beta2 * second_moment[name] + (1 - beta2) * gradients[name] ** 2
+                corrected_first = first_moment[name] / (1 - beta1 ** step)
+                corrected_second = second_moment[name] / (1 - beta2 ** step)
+                update = learning_rate * corrected_first / (np.sqrt(corrected_second) + epsilon)
+                setattr(network, name, getattr(network, name) - update)
+            total_loss += float(loss) * len(results)
+            count += len(results)
+        if verbose and count:
+            print(f"época {epoch + 1}/{epochs}: erro {total_loss / count:.5f}")
+    return network
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Treina a rede de avaliação com jogos entre as IAs')
+    parser.add_argument('inputs', nargs='+', help='ficheiros de jogos (python -m MVC.tuning generate)')
+    parser.add_argument('--hidden', type=int, default=32, help='neurónios da camada escondida')
+    parser.add_argument('--epochs', type=int, default=10, help='passagens pelos dados')
+    parser.add_argument('--chunk', type=int, default=4096, help='posições por passo')
+    parser.add_argument('--learning-rate', type=float, default=1e-3, help='passo de Adam')
+    parser.add_argument('--resume', action='store_true', help='continua a treinar a rede em --output')
+    parser.add_argument('--output', default=DEFAULT_NETWORK_PATH, help='ficheiro da rede')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    initial = load_network(args.output) if args.resume else None
+    trained = train(args.inputs, initial, args.hidden, args.epochs, args.chunk, args.learning_rate)
+    trained.save(args.output)
+    print(f"rede gravada em {args.output} em {time.perf_counter() - start:.1f} s")
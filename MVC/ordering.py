@@ -0,0 +1,186 @@
+import numpy as np
+from MVC.distance import CLASS_OF_RANK, DISTANCE_MAPS, RIVER_SQUARES
+from MVC.exchange import static_exchange
+
+
+_DIRECTIONS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])
+
+# Casas (índice linha * 6 + coluna; 42 representa fora do tabuleiro) usadas pela ordenação
+_SQUARES = 42
+_OFF_BOARD = _SQUARES
+
+
+def _square_flags(squares: list) -> np.ndarray:
+    """Máscara booleana das casas indicadas, com uma entrada extra para fora do tabuleiro"""
+    flags = np.zeros(_SQUARES + 1, dtype=bool)
+    flags[[row * 6 + col for row, col in squares]] = True
+    return flags
+
+
+# Para cada turno (0 Azul, 1 Vermelho): toca adversária, armadilhas à sua volta e casas a duas jogadas dela
+_TARGET_DEN = (3, 38)
+_DEN_NEIGHBOUR_POSITIONS = (((0, 2), (0, 4), (1, 3)), ((6, 1), (6, 3), (5, 2)))
+_DEN_NEIGHBOURS = tuple(_square_flags(squares) for squares in _DEN_NEIGHBOUR_POSITIONS)
+_DEN_RING = (_square_flags([(0, 1), (0, 5), (1, 2), (1, 4), (2, 3)]),
+             _square_flags([(6, 0), (6, 4), (5, 1), (5, 3), (4, 2)]))
+_CENTER = _square_flags([(3, 2), (3, 3)])
+
+# Peças valiosas (tigre, leão e elefante): bónus por ficar a salvo e por aliado vizinho (índice: rank)
+_SAFE_BONUS = np.array([0, 0, 0, 0, 0, 0, 7, 7, 20])
+_ALLY_BONUS = np.array([0, 0, 0, 0, 0, 0, 5, 5, 15])
+# Peso de cada peça vizinha do elefante na contagem de inimigos: os ratos contam a triplicar (índice: peça + 8)
+_ENEMY_WEIGHT = np.array([3 if abs(value) == 1 else 1 for value in range(-8, 9)])
+_ENEMY_WEIGHT[8] = 0
+_VALUABLE = np.abs(np.arange(-8, 9)) >= 6  # Índice: peça + 8
+
+# Casas vizinhas de cada casa, pela ordem de _DIRECTIONS
+_NEIGHBOURS = np.full((_SQUARES + 1, 4), _OFF_BOARD)
+for _square in range(_SQUARES):
+    for _k, (_dr, _dc) in enumerate(_DIRECTIONS.tolist()):
+        _row, _col = _square // 6 + _dr, _square % 6 + _dc
+        if 0 <= _row < 7 and 0 <= _col < 6:
+            _NEIGHBOURS[_square, _k] = _row * 6 + _col
+
+_RIVER_ROWS = np.array([row for row, _ in RIVER_SQUARES])
+_RIVER_COLS = np.array([col for _, col in RIVER_SQUARES])
+_RIVER_BITS = 1 << np.arange(len(RIVER_SQUARES))
+# Mapa de distâncias de cada peça (jogador * 3 + classe; índice: peça + 8)
+_MAP_OF_PIECE = np.array([(1 if value < 0 else 0) * 3 + CLASS_OF_RANK[abs(value)] for value in range(-8, 9)])
+
+
+def _distance_scores() -> np.ndarray:
+    """Pontuação de cada jogada pela variação da distância à toca adversária, mais o bónus do centro
+
+    Returns:
+        ndarray: matriz indexada por [ratos no rio, mapa da peça (_MAP_OF_PIECE), casa de partida, casa de chegada]
+    """
+    distances = DISTANCE_MAPS.reshape(2, -1, 3, _SQUARES).transpose(1, 0, 2, 3).reshape(-1, 6, _SQUARES).astype(np.int32)
+    before = distances[..., :, None]
+    after = distances[..., None, :]
+    bonus = np.array([0, 250, 150, 100, 70, 0])[np.minimum(after, 5)]  # Chegar a 1, 2, 3 ou 4 jogadas da toca
+    closer = 60 * (before - after) + (7 - after) * 25 + bonus
+    scores = np.where(after < before, closer, np.where(after > before, 50 * (before - after), 0))
+    return (scores + 4 * _CENTER[None, None, None, :_SQUARES]).astype(np.int16)
+
+
+_DISTANCE_SCORES = _distance_scores()
+
+
+def _capture_rules() -> np.ndarray:
+    """Resultado de Model.is_self_rank_higher para cada par de peças em cada par de casas
+
+    Returns:
+        ndarray: matriz booleana indexada por [peça que come + 8, casa dela, peça comida + 8, casa dela]
+    """
+    # Regras por rank fora das armadilhas: [rank que come, rank comido]
+    base = np.zeros((9, 9), dtype=bool)
+    base[1, [0, 1, 8]] = True
+    for rank in range(2, 8):
+        base[rank, :rank + 1] = True
+    base[8, [0, 2, 3, 4, 5, 6, 7, 8]] = True
+
+    values = np.arange(-8, 9)
+    squares = np.arange(_SQUARES + 1)
+    rows, cols = squares // 6, squares % 6
+    on_board = squares < _SQUARES
+    in_river = ((cols == 1) | (cols == 4)) & (rows >= 2) & (rows <= 4) & on_board
+    red_traps = _square_flags([(0, 2), (0, 4), (1, 3)])
+    blue_traps = _square_flags([(6, 1), (6, 3), (5, 2)])
+
+    a = values[:, None, None, None]
+    b = values[None, None, :, None]
+    rank_a, rank_b = np.abs(a), np.abs(b)
+    river_a = in_river[None, :, None, None]
+    river_b = in_river[None, None, None, :]
+    rules = np.where((rank_a == 1) & (rank_b == 1), river_a == river_b,
+                     np.where((rank_a == 1) & (rank_b == 8), ~river_a, base[rank_a, rank_b]))
+    # Uma peça numa armadilha adversária pode ser comida por qualquer peça
+    in_enemy_trap = ((b > 0) & red_traps[None, None, None, :]) | ((b < 0) & blue_traps[None, None, None, :])
+    opponents = a * b < 0
+    return opponents & (in_enemy_trap | rules) & on_board[None, :, None, None] & on_board[None, None, None, :]
+
+
+_CAPTURES = _capture_rules()
+
+
+def score_moves(model, moves: list, piece_values: dict, winning_capture_bonus: float) -> np.ndarray:
+    """Pontua todas as jogadas de um nó para ordenação numa só passagem
+
+    Dá as mesmas pontuações que Engine.evaluate_move, mas calcula as características de
+    todas as jogadas de uma vez, com índices NumPy sobre as casas de partida e de chegada:
+    entrada e aproximação à toca adversária, segurança nas armadilhas, ameaças a peças
+    valiosas e aliados à volta. Só as capturas (troca estática e caminho até à toca a partir
+    da casa da peça capturada) são avaliadas uma a uma.
+
+    Args:
+        model (Model): modelo do jogo, com o tabuleiro do nó
+        moves (list): jogadas (start, end)
+        piece_values (dict): valor de cada rank, para a troca estática
+        winning_capture_bonus (float): bónus das capturas com troca favorável
+
+    Returns:
+        ndarray: pontuação de cada jogada, com a toca e as armadilhas de model.turn (como evaluate_move,
+                 mesmo quando as jogadas são do outro jogador)
+    """
+    board = model.game_board
+    turn = model.turn
+    count = len(moves)
+    if count == 0:
+        return np.zeros(0)
+    coords = np.array(moves, dtype=np.intp).reshape(count, 4)
+    starts = coords[:, 0] * 6 + coords[:, 1]
+    ends = coords[:, 2] * 6 + coords[:, 3]
+    flat = np.zeros(_SQUARES + 1, dtype=np.intp)  # A última entrada é fora do tabuleiro
+    flat[:_SQUARES] = board.ravel()
+    pieces = flat[starts]
+    ranks = np.abs(pieces)
+    piece_index = pieces + 8
+
+    # Vizinhas das casas de chegada no tabuleiro atual, com as capturas possíveis em cada sentido
+    neighbour_squares = _NEIGHBOURS[ends]
+    neighbours = flat[neighbour_squares]
+    relation = neighbours * pieces[:, None]  # Positivo para aliadas, negativo para adversárias
+    allies = relation > 0
+    enemies = relation < 0
+    attacked = _CAPTURES[neighbours + 8, neighbour_squares, piece_index[:, None], starts[:, None]]  # A vizinha come a peça movida
+    threatened = _CAPTURES[piece_index[:, None], starts[:, None], neighbours + 8, neighbour_squares]  # A peça movida come a vizinha
+
+    # Entrada na toca adversária e armadilhas à sua volta, pelo turno do modelo (model.turn); na
+    # simulação da jogada a casa de partida fica vazia
+    near_den = _DEN_NEIGHBOURS[turn][ends]
+    turn_enemies = neighbours < 0 if turn == 0 else neighbours > 0
+    near_den_unsafe = (turn_enemies & attacked & (neighbour_squares != starts[:, None])).any(axis=1)
+    best = (ends == _TARGET_DEN[turn]) | (near_den & ~near_den_unsafe)
+    scores = near_den * 50.0
+
+    # Capturas: caminho até à toca a partir da casa de chegada (pela peça capturada) e troca estática
+    ring = _DEN_RING[turn]
+    for k in np.flatnonzero((flat[ends] != 0) & ~best).tolist():
+        start, end = moves[k]
+        if ring[ends[k]]:
+            for dr, dc in _DIRECTIONS.tolist():
+                neighbour = (end[0] + dr, end[1] + dc)
+                if neighbour in _DEN_NEIGHBOUR_POSITIONS[turn] and model.is_valid_move(end, neighbour):
+                    scores[k] += 500
+                    break
+        exchange = static_exchange(model, (start, end), piece_values)
+        if exchange > 0:
+            scores[k] += winning_capture_bonus + exchange * 2.0
+        else:
+            scores[k] += exchange * 2.0
+
+    # Aproximação à toca adversária (com os mapas de distância do tabuleiro atual) e centro
+    mask = int((np.abs(board[_RIVER_ROWS, _RIVER_COLS]) == 1) @ _RIVER_BITS)
+    scores += _DISTANCE_SCORES[mask, _MAP_OF_PIECE[piece_index], starts, ends]
+
+    # Peças valiosas: segurança na casa de chegada, aliados à volta e, para o elefante, inimigos à volta
+    ally_count = allies.sum(axis=1)
+    scores += ~(enemies & attacked).any(axis=1) * _SAFE_BONUS[ranks] + ally_count * _ALLY_BONUS[ranks]
+    enemy_count = (enemies * _ENEMY_WEIGHT[neighbours + 8]).sum(axis=1)
+    scores -= ((ranks == 8) & (enemy_count > ally_count)) * (enemy_count - ally_count) * 25
+
+    # Ameaças a peças valiosas adversárias
+    scores += 8 * (enemies & _VALUABLE[neighbours + 8] & threatened).sum(axis=1)
+
+    scores[best] = float('inf')
+    return scores
@@ -0,0 +1,80 @@
+class RepetitionTracker:
+    """Histórico limitado de posições, indexado por chaves de Zobrist
+
+    Guarda as últimas capacity posições num buffer circular e o número de ocorrências de
+    cada chave num dicionário. Inserir, consultar e expirar a posição mais antiga são
+    operações de tempo constante.
+    """
+
+    def __init__(self, capacity: int = 20, threshold: int = 3) -> None:
+        """Inicia o histórico vazio
+
+        Args:
+            capacity (int): número de posições guardadas
+            threshold (int): número de ocorrências a partir do qual uma posição conta como repetida
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.keys = [0] * capacity
+        self.start = 0          # Índice da posição mais antiga no buffer
+        self.size = 0
+        self.counts = {}        # Chave -> ocorrências dentro do buffer
+        self.repeated = 0       # Chaves com pelo menos threshold ocorrências
+
+    def push(self, key: int) -> int:
+        """Acrescenta uma posição, expirando a mais antiga se o buffer estiver cheio
+
+        Args:
+            key (int): chave de Zobrist da posição
+
+        Returns:
+            int: ocorrências da posição no histórico, incluindo esta
+        """
+        if self.size == self.capacity:
+            self._expire()
+        self.keys[(self.start + self.size) % self.capacity] = key
+        self.size += 1
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        if count == self.threshold:
+            self.repeated += 1
+        return count
+
+    def _expire(self) -> None:
+        """Remove a posição mais antiga"""
+        key = self.keys[self.start]
+        self.start = (self.start + 1) % self.capacity
+        self.size -= 1
+        count = self.counts[key]
+        if count == self.threshold:
+            self.repeated -= 1
+        if count == 1:
+            del self.counts[key]
+        else:
+            self.counts[key] = count - 1
+
+    def count(self, key: int) -> int:
+        """Número de ocorrências de uma posição no histórico"""
+        return self.counts.get(key, 0)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.counts
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        """Percorre as chaves da mais antiga para a mais recente"""
+        for k in range(self.size):
+            yield self.keys[(self.start + k) % self.capacity]
+
+    def has_repetition(self) -> bool:
+        """Verifica se alguma posição do histórico atingiu o limite de repetições"""
+        return self.repeated > 0
+
+    def clear(self) -> None:
+        """Esvazia o histórico"""
+        self.start = 0
+        self.size = 0
+        self.counts.clear()
+        self.repeated = 0
@@ -0,0 +1,49 @@
+import time
+
+
+class Scheduler:
+    """Ações adiadas servidas pelo loop de frames, em vez de pausas que bloqueiam
+
+    Cada ação fica associada a um nome; agendar outra com o mesmo nome substitui a
+    anterior. O controlador chama update uma vez por frame, que executa as ações cujo
+    tempo já chegou, pela ordem em que vencem.
+
+    Args:
+        clock (callable, optional): relógio em segundos. Por omissão usa time.perf_counter
+    """
+    def __init__(self, clock=time.perf_counter) -> None:
+        self.clock = clock
+        self.actions = {}  # Nome -> (instante em que vence, ação)
+
+    def schedule(self, delay: float, action, name: str) -> None:
+        """Agenda uma ação para daqui a delay segundos, substituindo a que tiver o mesmo nome
+
+        Args:
+            delay (float): atraso em segundos (0 executa no próximo update)
+            action (callable): função sem argumentos
+            name (str): nome da ação
+        """
+        self.actions[name] = (self.clock() + delay, action)
+
+    def cancel(self, name: str) -> None:
+        """Cancela a ação com este nome, se estiver agendada"""
+        self.actions.pop(name, None)
+
+    def clear(self) -> None:
+        """Cancela todas as ações"""
+        self.actions.clear()
+
+    def is_pending(self, name: str) -> bool:
+        """Se a ação com este nome está agendada e ainda não foi executada"""
+        return name in self.actions
+
+    def update(self) -> None:
+        """Executa as ações vencidas; as que elas agendarem ficam para o próximo update"""
+        now = self.clock()
+        due = sorted((when, name) for name, (when, _) in self.actions.items() if when <= now)
+        for when, name in due:
+            entry = self.actions.get(name)
+            if entry is None or entry[0] != when:
+                continue  # Cancelada ou substituída por uma ação anterior
+            del self.actions[name]
+            entry[1]()
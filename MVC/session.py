@@ -0,0 +1,257 @@
+import argparse
+import time
+from MVC.engine import create_engine
+from MVC.model import Model
+
+
+def think(ai) -> tuple:
+    """Pede a uma IA a jogada para a posição do seu modelo
+
+    Além da melhor jogada, calcula logo a alternativa quando há um movimento proibido ou um
+    ciclo (ver GameSession.resolve_ai_move) e a resposta prevista do adversário.
+
+    Args:
+        ai: Instância de Engine, MCTSAI ou RandomAI
+
+    Returns:
+        tuple: (melhor jogada, jogada alternativa ou None, resposta prevista ou None)
+    """
+    best_move = ai.get_best_move()
+    alternative = None
+    if ai.model.forbidden_move or ai.model.cycle_detected:
+        alternative = ai.get_alternative_move()
+    ponder_move = ai.get_ponder_move(best_move) if best_move else None
+    return (best_move, alternative, ponder_move)
+
+
+class GameSession:
+    """Partida sem interface: modelo, IAs, aplicação das jogadas e regras de fim de jogo
+
+    Não desenha nem lê eventos do pygame. Quem a usa (o Controller, ferramentas em lote,
+    testes) subscreve os eventos da partida:
+
+    - MOVE {'start', 'end', 'turn'}: jogada aplicada, por quem a fez
+    - TURN {'turn'}: passou a ser a vez de outro jogador
+    - WIN {'winner'}: 'Azul' ou 'Vermelho' venceu
+    - DRAW {'reason'}: empate por limite de meias-jogadas ('max_plies') ou falta de jogadas ('no_moves')
+    - RESET {}: a partida recomeçou
+
+    Args:
+        blue_ai (tuple/str, optional): IA do azul ("random" ou (tipo, nível)); None para um humano
+        red_ai (tuple/str, optional): IA do vermelho, como blue_ai
+        seed (int, optional): semente das IAs aleatórias
+        max_plies (int, optional): meias-jogadas a partir das quais a partida é empate (None sem limite)
+        break_cycles (bool): aplica as regras de repetição do modo IAxIA às jogadas das IAs (ver
+                             resolve_ai_move); sem elas, as IAs jogam sempre a melhor jogada
+    """
+    MOVE = 'move'
+    TURN = 'turn'
+    WIN = 'win'
+    DRAW = 'draw'
+    RESET = 'reset'
+
+    def __init__(self, blue_ai=None, red_ai=None, seed: int = None, max_plies: int = None,
+                 break_cycles: bool = False) -> None:
+        self.model = Model()
+        self.ais = (self.create_ai(blue_ai, seed), self.create_ai(red_ai, seed))  # Pelo turno; None é um humano
+        self.max_plies = max_plies
+        self.break_cycles = break_cycles
+        self.listeners = []
+        self.plies = 0          # Meias-jogadas da partida atual
+        self.finished = False
+        self.winner = None      # 'Azul', 'Vermelho' ou None (empate ou partida por acabar)
+
+    def create_ai(self, ai_config, seed: int = None):
+        """Cria a IA de um jogador a partir da sua configuração
+
+        Args:
+            ai_config (tuple/str): "random", (tipo, profundidade ou simulações), ou None para um humano
+            seed (int, optional): semente da IA aleatória
+
+        Returns:
+            Engine/MCTSAI/RandomAI: instância da IA, ou None
+        """
+        if ai_config is None:
+            return None
+        if ai_config == "random":
+            return create_engine(self.model, "random", seed=seed)
+        ai_type, level = ai_config
+        # Tipos desconhecidos dão a IA aleatória
+        return create_engine(self.model, ai_type, level, seed=seed)
+
+    def subscribe(self, listener) -> None:
+        """Regista uma função listener(evento, dados) chamada a cada evento da partida"""
+        self.listeners.append(listener)
+
+    def emit(self, event: str, **data) -> None:
+        """Envia um evento a todos os subscritores"""
+        for listener in self.listeners:
+            listener(event, data)
+
+    @property
+    def current_ai(self):
+        """IA do jogador a jogar, ou None se for um humano"""
+        return self.ais[self.model.turn]
+
+    def is_ai_turn(self) -> bool:
+        """Se o jogador a jogar é uma IA"""
+        return self.current_ai is not None
+
+    def resolve_ai_move(self, best_move: tuple, alternative_move: tuple) -> tuple:
+        """Aplica as regras de repetição à jogada escolhida por uma IA
+
+        Com break_cycles, o movimento proibido por repetição é trocado pela alternativa e,
+        com um ciclo detetado entre os dois jogadores, a alternativa é sempre forçada (e o
+        ciclo é dado como resolvido). Sem break_cycles a melhor jogada é jogada tal como está.
+
+        Args:
+            best_move (tuple): melhor jogada da IA, ou None
+            alternative_move (tuple): jogada alternativa da IA, ou None
+
+        Returns:
+            tuple: jogada a aplicar, ou None se não houver nenhuma permitida
+        """
+        move = best_move
+        if move is None or not self.break_cycles:
+            return move
+        if self.model.forbidden_move and move == self.model.forbidden_move:
+            move = alternative_move
+            if move is None:
+                return None
+        if self.model.cycle_detected:
+            if alternative_move is None:
+                return None
+            move = alternative_move
+            self.model.cycle_detected = False
+        return move
+
+    def apply_move(self, start: tuple, end: tuple) -> bool:
+        """Aplica uma jogada do jogador a jogar e as regras de fim de jogo
+
+        Args:
+            start (tuple): casa de partida
+            end (tuple): casa de chegada
+
+        Returns:
+            bool: True se a partida terminou com esta jogada
+        """
+        turn = self.model.turn
+        self.model.perform_move(start, end)  # Deteta também as repetições e os ciclos
+        self.plies += 1
+        self.emit(self.MOVE, start=start, end=end, turn=turn)
+
+        is_win, winner = self.model.is_win()
+        if is_win:
+            self.finished = True
+            self.winner = winner
+            self.emit(self.WIN, winner=winner)
+            return True
+
+        self.model.switch_turn()
+        self.emit(self.TURN, turn=self.model.turn)
+        if self.max_plies is not None and self.plies >= self.max_plies:
+            self.draw('max_plies')
+            return True
+        return False
+
+    def draw(self, reason: str) -> None:
+        """Termina a partida empatada
+
+        Args:
+            reason (str): 'max_plies', 'no_moves' ou outro motivo dado por quem a termina
+        """
+        self.finished = True
+        self.winner = None
+        self.emit(self.DRAW, reason=reason)
+
+    def apply_ai_result(self, result: tuple) -> bool:
+        """Aplica o resultado de think (da própria IA ou de um processo da IA)
+
+        Args:
+            result (tuple): (melhor jogada, jogada alternativa, resposta prevista)
+
+        Returns:
+            bool: True se a partida terminou
+        """
+        move = self.resolve_ai_move(result[0], result[1])
+        if move is None:
+            self.draw('no_moves')
+            return True
+        return self.apply_move(*move)
+
+    def play_ai_move(self) -> bool:
+        """Faz a IA do jogador a jogar pensar e jogar, no próprio processo
+
+        Returns:
+            bool: True se a partida terminou
+        """
+        return self.apply_ai_result(think(self.current_ai))
+
+    def play(self) -> str:
+        """Joga a partida até ao fim entre as duas IAs
+
+        Returns:
+            str: 'Azul', 'Vermelho' ou None para um empate
+        """
+        if None in self.ais:
+            raise ValueError("play só joga partidas entre duas IAs")
+        while not self.finished:
+            self.play_ai_move()
+        return self.winner
+
+    def reset(self) -> None:
+        """Recomeça a partida com as mesmas IAs"""
+        self.model.reset()
+        self.plies = 0
+        self.finished = False
+        self.winner = None
+        self.emit(self.RESET)
+
+
+def play_games(blue_ai, red_ai, games: int, max_plies: int = 200, seed: int = None, verbose: bool = True) -> dict:
+    """Joga várias partidas entre duas IAs, sem interface
+
+    Args:
+        blue_ai (tuple/str): IA do azul ("random" ou (tipo, nível))
+        red_ai (tuple/str): IA do vermelho
+        games (int): número de partidas
+        max_plies (int): meias-jogadas a partir das quais a partida é empate
+        seed (int, optional): semente das IAs aleatórias
+        verbose (bool): imprime o resultado de cada partida
+
+    Returns:
+        dict: {'Azul': vitórias, 'Vermelho': vitórias, None: empates}
+    """
+    session = GameSession(blue_ai, red_ai, seed, max_plies, break_cycles=True)
+    results = {'Azul': 0, 'Vermelho': 0, None: 0}
+    for game in range(games):
+        session.reset()
+        winner = session.play()
+        results[winner] += 1
+        if verbose:
+            print(f"jogo {game + 1}/{games}: {winner or 'empate'} em {session.plies} meias-jogadas")
+    return results
+
+
+def _parse_ai(text: str):
+    """Lê uma IA da linha de comandos: 'random' ou 'tipo:nível', por exemplo 'minimax:3'"""
+    if text == 'random':
+        return 'random'
+    ai_type, level = text.split(':')
+    return (ai_type, int(level))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Joga partidas entre duas IAs sem interface')
+    parser.add_argument('blue', help="IA do azul: 'random' ou 'tipo:nível' (ex.: minimax:3, mcts:1000)")
+    parser.add_argument('red', help='IA do vermelho, no mesmo formato')
+    parser.add_argument('--games', type=int, default=10, help='número de partidas')
+    parser.add_argument('--max-plies', type=int, default=200, help='meias-jogadas até a partida ser empate')
+    parser.add_argument('--seed', type=int, default=None, help='semente das IAs aleatórias')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals = play_games(_parse_ai(args.blue), _parse_ai(args.red), args.games, args.max_plies, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"Azul {totals['Azul']}, Vermelho {totals['Vermelho']}, empates {totals[None]} "
+          f"em {elapsed:.1f} s ({args.games / elapsed * 60:.1f} jogos por minuto)")
@@ -0,0 +1,224 @@
+import numpy as np
+
+
+# Número de prova "infinito" (mantém a aritmética em inteiros)
+INFINITY = 10 ** 9
+
+
+def is_den_race(board: np.ndarray, max_distance: int = 3) -> bool:
+    """Verifica se alguma peça está a max_distance casas (Manhattan) ou menos da toca adversária
+
+    Args:
+        board (ndarray): tabuleiro do jogo
+        max_distance (int): distância a partir da qual a corrida é considerada
+
+    Returns:
+        bool: True se há uma corrida para o covil em curso
+    """
+    blue = np.argwhere(board > 0)
+    red = np.argwhere(board < 0)
+    if len(blue) and (np.abs(blue[:, 0] - 0) + np.abs(blue[:, 1] - 3)).min() <= max_distance:
+        return True
+    if len(red) and (np.abs(red[:, 0] - 6) + np.abs(red[:, 1] - 2)).min() <= max_distance:
+        return True
+    return False
+
+
+class _PNNode:
+    """Nó da árvore de prova"""
+    __slots__ = ('move', 'captured', 'parent', 'children', 'proof', 'disproof', 'is_or')
+
+    def __init__(self, move, captured, parent, is_or: bool) -> None:
+        self.move = move            # Jogada que levou a este nó
+        self.captured = captured    # Peça capturada pela jogada (para desfazer)
+        self.parent = parent
+        self.children = None        # None enquanto o nó não for expandido
+        self.proof = 1
+        self.disproof = 1
+        self.is_or = is_or          # Nó OU: joga o atacante; nó E: joga o defensor
+
+
+class ProofNumberSolver:
+    """Resolve corridas para o covil com pesquisa por números de prova (PNS)
+
+    Prova ou refuta uma vitória forçada dentro de um horizonte de meias-jogadas e de um
+    orçamento de nós expandidos. As posições provadas ficam guardadas numa cache indexada
+    pela posição e pelo jogador a jogar, partilhada entre chamadas e esvaziada quando passa
+    de cache_limit entradas.
+    """
+    WIN = 'win'          # O jogador a jogar tem vitória forçada
+    LOSS = 'loss'        # O jogador a jogar perde contra qualquer defesa
+    UNKNOWN = 'unknown'  # Nada foi provado dentro do orçamento
+
+    def __init__(self, model, node_budget: int = 3000, max_plies: int = 7, cache_limit: int = 100000) -> None:
+        """Inicia o solver
+
+        Args:
+            model (Model): modelo do jogo (o tabuleiro é alterado e reposto durante a pesquisa)
+            node_budget (int): número máximo de nós expandidos por chamada a solve
+            max_plies (int): horizonte da prova em meias-jogadas
+            cache_limit (int): número máximo de posições provadas guardadas entre chamadas
+        """
+        self.model = model
+        self.node_budget = node_budget
+        self.max_plies = max_plies
+        self.cache_limit = cache_limit
+        self.cache = {}  # (tabuleiro, jogador a jogar) -> (resultado, jogada vencedora)
+        self.nodes = 0   # Nós expandidos na última chamada
+
+    def solve(self, node_budget: int = None) -> tuple:
+        """Tenta resolver a posição atual para o jogador a jogar
+
+        Args:
+            node_budget (int, optional): orçamento de nós. Por omissão usa self.node_budget
+
+        Returns:
+            tuple(str, tuple): (WIN, jogada vencedora), (LOSS, None) ou (UNKNOWN, None)
+        """
+        budget = node_budget or self.node_budget
+        turn = self.model.turn
+        self.nodes = 0
+        if len(self.cache) > self.cache_limit:
+            self.cache.clear()  # Cada chamada acrescenta no máximo algumas entradas por nó expandido
+        key = (self.model.game_board.tobytes(), turn)
+        if key in self.cache:
+            return self.cache[key]
+
+        # Primeiro procura uma vitória do jogador a jogar, depois uma vitória do adversário
+        move = self._prove(turn, True, budget)
+        if move is not None:
+            return (self.WIN, move)
+        if self.nodes < budget and self._prove(1 - turn, False, budget) is not None:
+            return (self.LOSS, None)
+        return (self.UNKNOWN, None)
+
+    def _prove(self, attacker: int, root_is_or: bool, budget: int):
+        """Pesquisa por números de prova para uma vitória do atacante
+
+        Args:
+            attacker (int): 0 (Azul) ou 1 (Vermelho)
+            root_is_or (bool): True se o atacante joga na raiz
+            budget (int): orçamento total de nós expandidos
+
+        Returns:
+            tuple | bool | None: jogada vencedora (raiz OU) ou True (raiz E) se provado; None caso contrário
+        """
+        root = _PNNode(None, 0, None, root_is_or)
+        self._expand(root, attacker, 0)
+        self.nodes += 1
+
+        while root.proof != 0 and root.disproof != 0 and self.nodes < budget:
+            # Desce até ao nó mais promissor, fazendo as jogadas pelo caminho
+            node = root
+            depth = 0
+            while node.children:
+                if node.is_or:
+                    node = min(node.children, key=lambda child: child.proof)
+                else:
+                    node = min(node.children, key=lambda child: child.disproof)
+                self._make(node)
+                depth += 1
+
+            self._expand(node, attacker, depth)
+            self.nodes += 1
+
+            # Atualiza os antepassados e desfaz as jogadas
+            while node.parent is not None:
+                self._unmake(node)
+                node = node.parent
+                self._update(node, attacker)
+
+        if root.proof != 0:
+            return None
+        if root_is_or:
+            return next(child.move for child in root.children if child.proof == 0)
+        return True
+
+    def _expand(self, node: _PNNode, attacker: int, depth: int) -> None:
+        """Gera os filhos de um nó e inicializa os seus números de prova"""
+        side = attacker if node.is_or else 1 - attacker
+        node.children = []
+        for start, end in self._generate_moves(side):
+            captured = self.model.game_board[end[0], end[1]]
+            child = _PNNode((start, end), captured, node, not node.is_or)
+            self._make(child)
+            self._evaluate_leaf(child, attacker, depth + 1)
+            self._unmake(child)
+            node.children.append(child)
+            # Um filho provado num nó OU (ou refutado num nó E) decide o nó de imediato
+            if (node.is_or and child.proof == 0) or (not node.is_or and child.disproof == 0):
+                break
+
+        self._update(node, attacker)
+
+    def _evaluate_leaf(self, node: _PNNode, attacker: int, depth: int) -> None:
+        """Atribui números de prova a um nó novo a partir das regras, da cache e do horizonte"""
+        is_win, winner = self.model.is_win()
+        if is_win:
+            attacker_won = winner == ('Azul' if attacker == 0 else 'Vermelho')
+            node.proof, node.disproof = (0, INFINITY) if attacker_won else (INFINITY, 0)
+            node.children = []
+            return
+
+        side = attacker if node.is_or else 1 - attacker
+        cached = self.cache.get((self.model.game_board.tobytes(), side))
+        if cached is not None:
+            side_wins = cached[0] == self.WIN
+            attacker_won = side_wins == (side == attacker)
+            node.proof, node.disproof = (0, INFINITY) if attacker_won else (INFINITY, 0)
+            node.children = []
+            return
+
+        if depth >= self.max_plies:
+            # Para lá do horizonte nada fica provado
+            node.proof, node.disproof = INFINITY, 0
+            node.children = []
+
+    def _update(self, node: _PNNode, attacker: int) -> None:
+        """Recalcula os números de prova de um nó expandido e guarda na cache se ficou provado"""
+        if not node.children:
+            if node.proof != 0:
+                # Sem jogadas possíveis: não há vitória forçada a provar
+                node.proof, node.disproof = INFINITY, 0
+            return
+
+        if node.is_or:
+            node.proof = min(child.proof for child in node.children)
+            node.disproof = min(INFINITY, sum(child.disproof for child in node.children))
+        else:
+            node.proof = min(INFINITY, sum(child.proof for child in node.children))
+            node.disproof = min(child.disproof for child in node.children)
+
+        if node.proof == 0:
+            # Vitória provada: o atacante ganha num nó OU, o defensor perde num nó E
+            side = attacker if node.is_or else 1 - attacker
+            key = (self.model.game_board.tobytes(), side)
+            if node.is_or:
+                move = next(child.move for child in node.children if child.proof == 0)
+                self.cache[key] = (self.WIN, move)
+            else:
+                self.cache[key] = (self.LOSS, None)
+
+        if (node.proof == 0 or node.disproof == 0) and node.parent is not None:
+            node.children = []  # Liberta a subárvore resolvida
+
+    def _generate_moves(self, side: int) -> list:
+        """Gera todas as jogadas legais do jogador indicado"""
+        moves = []
+        board = self.model.game_board
+        for i in range(7):
+            for j in range(6):
+                piece = board[i, j]
+                if (side == 0 and piece > 0) or (side == 1 and piece < 0):
+                    possible_moves = self.model.get_possible_moves((i, j))
+                    if possible_moves:
+                        moves.extend(((i, j), move) for move in possible_moves)
+        return moves
+
+    def _make(self, node: _PNNode) -> None:
+        """Executa no tabuleiro a jogada que leva ao nó"""
+        self.model.make_move(*node.move)
+
+    def _unmake(self, node: _PNNode) -> None:
+        """Desfaz no tabuleiro a jogada que leva ao nó"""
+        self.model.unmake_move(node.move[0], node.move[1], node.captured)
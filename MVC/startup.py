@@ -0,0 +1,63 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos das regras e das IAs, que não devem importar o pygame (ver assets/board.py)
+ENGINE_MODULES = ['MVC.model', 'MVC.engine', 'MVC.session']
+
+# Corre num interpretador novo: mede a importação e verifica se o pygame foi carregado
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{'ms': (time.perf_counter() - start) * 1000, 'pygame': 'pygame' in sys.modules}}))
+"""
+
+
+def measure_import(module: str, runs: int = 5) -> dict:
+    """Mede o tempo de importação de um módulo, cada vez num interpretador novo
+
+    Args:
+        module (str): nome do módulo, por exemplo 'MVC.engine'
+        runs (int): número de medições
+
+    Returns:
+        dict: {'best': ms, 'median': ms, 'pygame': se o pygame foi importado}
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    times = []
+    pygame = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module)], cwd=ROOT, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result['ms'])
+        pygame = pygame or result['pygame']
+    return {'best': min(times), 'median': statistics.median(times), 'pygame': pygame}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mede o arranque dos módulos das regras e das IAs, sem interface')
+    parser.add_argument('modules', nargs='*', default=ENGINE_MODULES, help='módulos a importar')
+    parser.add_argument('--runs', type=int, default=5, help='medições por módulo')
+    parser.add_argument('--limit', type=float, default=None, help='mediana máxima em ms; acima dela termina com erro')
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        result = measure_import(module, args.runs)
+        notes = []
+        if result['pygame']:
+            notes.append('importa o pygame')
+        if args.limit is not None and result['median'] > args.limit:
+            notes.append(f'acima de {args.limit:.0f} ms')
+        failed = failed or bool(notes)
+        print(f"{module}: mediana {result['median']:.1f} ms, melhor {result['best']:.1f} ms"
+              + (f" ({', '.join(notes)})" if notes else ''))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,371 @@
+import argparse
+import array
+import itertools
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from MVC.model import Model
+
+
+# Diretório das tabelas de finais (um ficheiro por assinatura de material)
+DEFAULT_TABLEBASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'tablebases')
+
+SQUARES = 42  # 7 linhas x 6 colunas
+
+# Cabeçalho: assinatura, versão e número de peças
+_MAGIC = b'JCTB'
+_VERSION = 1
+_HEADER = struct.Struct('<4sII')
+
+# Codificação de cada posição num byte: 0 empate, 255 posição inválida, d + 1 para um resultado
+# em d meias-jogadas. O vencedor faz sempre a última jogada, por isso d ímpar é vitória do
+# jogador a jogar e d par é derrota (d = 0: a posição já está perdida).
+DRAW = 0
+INVALID = 255
+_MAX_DISTANCE = 252  # Distâncias maiores são truncadas, mantendo a paridade (ver encode_result)
+
+_RIVER = {(i, j) for i in (2, 3, 4) for j in (1, 4)}
+_DENS = {0: (6, 2), 1: (0, 3)}  # Toca própria de cada jogador
+
+
+def signature_of(board: np.ndarray) -> tuple:
+    """Assinatura de material de um tabuleiro: ranks azuis e vermelhos por ordem decrescente
+
+    Args:
+        board (ndarray): tabuleiro do jogo
+
+    Returns:
+        tuple(tuple, tuple): (ranks azuis, ranks vermelhos)
+    """
+    blue = tuple(sorted((int(piece) for piece in board[board > 0]), reverse=True))
+    red = tuple(sorted((int(-piece) for piece in board[board < 0]), reverse=True))
+    return (blue, red)
+
+
+def signature_name(blue: tuple, red: tuple) -> str:
+    """Nome do ficheiro de uma assinatura, por exemplo '87v1' (elefante e leão contra rato)"""
+    return ''.join(map(str, blue)) + 'v' + ''.join(map(str, red))
+
+
+def encode_result(won: bool, distance: int) -> int:
+    """Codifica um resultado decidido em distance meias-jogadas
+
+    As distâncias acima de _MAX_DISTANCE ficam na maior distância com a mesma paridade
+    (ímpar para as vitórias, par para as derrotas), para o resultado não mudar.
+    """
+    if distance > _MAX_DISTANCE:
+        distance = _MAX_DISTANCE - 1 if won else _MAX_DISTANCE
+    return distance + 1
+
+
+def decode_result(value: int) -> tuple:
+    """Descodifica um byte da tabela
+
+    Returns:
+        tuple(str, int): (Tablebase.WIN | LOSS | DRAW, distância em meias-jogadas), ou None se inválida
+    """
+    if value == INVALID:
+        return None
+    if value == DRAW:
+        return (Tablebase.DRAW, 0)
+    distance = value - 1
+    return (Tablebase.WIN if distance % 2 else Tablebase.LOSS, distance)
+
+
+def _pieces(blue: tuple, red: tuple) -> list:
+    """Peças com sinal, na ordem canónica usada no índice"""
+    return list(blue) + [-rank for rank in red]
+
+
+def _index(squares: list, turn: int) -> int:
+    """Índice de uma posição: jogador a jogar e casas das peças em base 42"""
+    index = 0
+    for square in reversed(squares):
+        index = index * SQUARES + square
+    return turn * SQUARES ** len(squares) + index
+
+
+class Tablebase:
+    """Consulta das tabelas de finais através de mmap
+
+    Cada assinatura tem um ficheiro com um byte por posição (ver encode_result), indexado
+    pelo jogador a jogar e pelas casas das peças na ordem de signature_of.
+    """
+    WIN = 'win'
+    LOSS = 'loss'
+    DRAW = 'draw'
+
+    def __init__(self, directory: str = DEFAULT_TABLEBASE_DIR, max_pieces: int = 4) -> None:
+        """Prepara a consulta; cada ficheiro só é aberto na primeira vez que é necessário
+
+        Args:
+            directory (str): diretório das tabelas
+            max_pieces (int): número máximo de peças das tabelas
+        """
+        self.directory = directory
+        self.max_pieces = max_pieces
+        self._tables = {}  # Nome da assinatura -> vetor uint8 (None se o ficheiro não existe)
+
+    def _table(self, blue: tuple, red: tuple):
+        """Devolve a tabela de uma assinatura, mapeando o ficheiro na primeira utilização"""
+        name = signature_name(blue, red)
+        if name not in self._tables:
+            self._tables[name] = None
+            path = os.path.join(self.directory, name + '.tb')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, count = _HEADER.unpack_from(data, 0)
+                if magic == _MAGIC and version == _VERSION and count == len(blue) + len(red):
+                    self._tables[name] = np.frombuffer(data, dtype=np.uint8, offset=_HEADER.size)
+        return self._tables[name]
+
+    def probe(self, board: np.ndarray, turn: int):
+        """Resultado exato de uma posição, do ponto de vista do jogador a jogar
+
+        Args:
+            board (ndarray): tabuleiro do jogo
+            turn (int): jogador a jogar
+
+        Returns:
+            tuple(str, int): (WIN | LOSS | DRAW, distância em meias-jogadas), ou None se não houver tabela
+        """
+        if np.count_nonzero(board) > self.max_pieces:
+            return None
+        blue, red = signature_of(board)
+        if not blue or not red:
+            return None
+        table = self._table(blue, red)
+        if table is None:
+            return None
+
+        squares = []
+        for piece in _pieces(blue, red):
+            i, j = np.argwhere(board == piece)[0]
+            squares.append(int(i) * 6 + int(j))
+        return decode_result(int(table[_index(squares, turn)]))
+
+    def best_move(self, model, excluded: tuple = None):
+        """Escolhe a jogada ótima segundo as tabelas: a vitória mais rápida, um empate ou a derrota mais lenta
+
+        Args:
+            model (Model): modelo do jogo
+            excluded (tuple, optional): jogada a evitar (movimento proibido)
+
+        Returns:
+            tuple: jogada (start, end), ou None se a posição não estiver coberta pelas tabelas
+        """
+        board = model.game_board
+        turn = model.turn
+        if np.count_nonzero(board) > self.max_pieces or self.probe(board, turn) is None:
+            return None
+
+        best = None
+        best_rank = None
+        for i, j in np.argwhere(board > 0 if turn == 0 else board < 0):
+            start = (int(i), int(j))
+            for end in model.get_possible_moves(start) or []:
+                if (start, end) == excluded:
+                    continue
+                captured = model.make_move(start, end)
+                is_win, winner = model.is_win()
+                if is_win:
+                    outcome = (self.LOSS, 0) if winner == ('Azul' if turn == 0 else 'Vermelho') else (self.WIN, 0)
+                else:
+                    outcome = self.probe(board, 1 - turn)
+                model.unmake_move(start, end, captured)
+                if outcome is None:
+                    continue
+
+                # Ordem de preferência do ponto de vista de quem joga (resultado do adversário)
+                result, distance = outcome
+                if result == self.LOSS:
+                    rank = (2, -distance)
+                elif result == self.DRAW:
+                    rank = (1, 0)
+                else:
+                    rank = (0, distance)
+                if best_rank is None or rank > best_rank:
+                    best, best_rank = (start, end), rank
+        return best
+
+
+def _solve_signature(job: tuple) -> tuple:
+    """Resolve uma assinatura por análise retrógrada e grava o ficheiro (executado num processo filho)
+
+    As capturas levam a assinaturas com menos peças, que já têm de estar resolvidas no diretório.
+
+    Args:
+        job (tuple): (ranks azuis, ranks vermelhos, diretório)
+
+    Returns:
+        tuple(str, dict): nome da assinatura e contagem de vitórias, derrotas e empates
+    """
+    blue, red, directory = job
+    pieces = _pieces(blue, red)
+    count = len(pieces)
+    size = SQUARES ** count
+    lower = Tablebase(directory, count - 1)
+    model = Model()
+
+    values = np.full(2 * size, INVALID, dtype=np.uint8)
+    resolved = np.zeros(2 * size, dtype=bool)
+    external_win = np.full(2 * size, np.iinfo(np.int32).max, dtype=np.int32)  # Vitória via captura
+    external_loss = np.zeros(2 * size, dtype=np.int32)                        # Derrota mais lenta via captura
+    external_draw = np.zeros(2 * size, dtype=bool)                            # Captura que leva a empate
+    edge_from = array.array('q')
+    edge_to = array.array('q')
+    buckets = {}  # Distância -> lista de (posição, ganha)
+
+    # Geração das jogadas de todas as posições (análise para a frente)
+    for squares in itertools.product(range(SQUARES), repeat=count):
+        if len(set(squares)) < count:
+            continue
+        board = np.zeros((7, 6), dtype=int)
+        valid = True
+        for piece, square in zip(pieces, squares):
+            pos = divmod(square, 6)
+            # Nenhuma peça na própria toca; só o rato entra no rio
+            if pos == _DENS[0 if piece > 0 else 1] or (abs(piece) != 1 and pos in _RIVER):
+                valid = False
+                break
+            board[pos] = piece
+        if not valid:
+            continue
+
+        squares = list(squares)
+        model.set_board(board)
+        for turn in (0, 1):
+            index = _index(squares, turn)
+            model.turn = turn
+            is_win, winner = model.is_win()
+            if is_win:
+                if winner != ('Azul' if turn == 0 else 'Vermelho'):
+                    values[index] = DRAW
+                    buckets.setdefault(0, []).append((index, False))
+                continue  # Vitória de quem vai jogar: inalcançável
+            values[index] = DRAW
+
+            for k, piece in enumerate(pieces):
+                if (piece > 0) != (turn == 0):
+                    continue
+                start = divmod(squares[k], 6)
+                for end in model.get_possible_moves(start) or []:
+                    captured = board[end[0], end[1]]
+                    if captured == 0:
+                        moved = squares.copy()
+                        moved[k] = end[0] * 6 + end[1]
+                        edge_from.append(index)
+                        edge_to.append(_index(moved, 1 - turn))
+                        continue
+
+                    # Captura: o resultado vem da tabela com menos peças
+                    board[end[0], end[1]] = piece
+                    board[start[0], start[1]] = 0
+                    if not (board < 0).any() or not (board > 0).any():
+                        outcome = (Tablebase.LOSS, 0)
+                    else:
+                        outcome = lower.probe(board, 1 - turn)
+                    board[start[0], start[1]] = piece
+                    board[end[0], end[1]] = captured
+
+                    if outcome is None or outcome[0] == Tablebase.DRAW:
+                        external_draw[index] = True
+                    elif outcome[0] == Tablebase.LOSS:
+                        external_win[index] = min(external_win[index], outcome[1] + 1)
+                    else:
+                        external_loss[index] = max(external_loss[index], outcome[1] + 1)
+
+    # Grafo inverso das jogadas sem captura
+    edge_from = np.frombuffer(edge_from, dtype=np.int64)
+    edge_to = np.frombuffer(edge_to, dtype=np.int64)
+    order = np.argsort(edge_to, kind='stable')
+    predecessors = edge_from[order]
+    offsets = np.searchsorted(edge_to[order], np.arange(2 * size + 1))
+    remaining = np.bincount(edge_from, minlength=2 * size).astype(np.int32)
+
+    # Sementes: vitórias por captura e posições sem jogadas internas que perdem em todas as capturas
+    has_moves = remaining > 0
+    for index in np.flatnonzero(external_win < np.iinfo(np.int32).max):
+        buckets.setdefault(int(external_win[index]), []).append((int(index), True))
+    for index in np.flatnonzero((values == DRAW) & ~has_moves & (external_loss > 0)
+                                & ~external_draw & (external_win == np.iinfo(np.int32).max)):
+        buckets.setdefault(int(external_loss[index]), []).append((int(index), False))
+
+    # Propagação por distâncias crescentes: a vitória mais rápida e a derrota mais lenta
+    distance = 0
+    while buckets:
+        for index, won in buckets.pop(distance, []):
+            if resolved[index]:
+                continue
+            resolved[index] = True
+            values[index] = encode_result(won, distance)
+            for parent in predecessors[offsets[index]:offsets[index + 1]]:
+                if resolved[parent]:
+                    continue
+                if not won:
+                    buckets.setdefault(distance + 1, []).append((int(parent), True))
+                    continue
+                remaining[parent] -= 1
+                external_loss[parent] = max(external_loss[parent], distance + 1)
+                if remaining[parent] == 0 and not external_draw[parent] \
+                        and external_win[parent] == np.iinfo(np.int32).max:
+                    buckets.setdefault(int(external_loss[parent]), []).append((int(parent), False))
+        distance += 1
+
+    name = signature_name(blue, red)
+    with open(os.path.join(directory, name + '.tb'), 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, count))
+        f.write(values.tobytes())
+
+    decided = values[(values != DRAW) & (values != INVALID)] - 1
+    stats = {'wins': int((decided % 2 == 1).sum()), 'losses': int((decided % 2 == 0).sum()),
+             'draws': int((values == DRAW).sum())}
+    return name, stats
+
+
+def signatures(piece_count: int) -> list:
+    """Todas as assinaturas com piece_count peças e pelo menos uma peça de cada jogador"""
+    result = []
+    for blue_count in range(1, piece_count):
+        for blue in itertools.combinations(range(8, 0, -1), blue_count):
+            for red in itertools.combinations(range(8, 0, -1), piece_count - blue_count):
+                result.append((blue, red))
+    return result
+
+
+def generate(max_pieces: int = 3, directory: str = DEFAULT_TABLEBASE_DIR, processes: int = None, verbose: bool = True) -> None:
+    """Gera as tabelas de 2 até max_pieces peças, por número crescente de peças
+
+    As assinaturas com o mesmo número de peças são independentes e resolvidas em paralelo;
+    as tabelas já existentes são mantidas, o que permite retomar uma geração interrompida.
+
+    Args:
+        max_pieces (int): número máximo de peças
+        directory (str): diretório de saída
+        processes (int, optional): número de processos (por omissão, um por núcleo)
+        verbose (bool): imprime o progresso
+    """
+    os.makedirs(directory, exist_ok=True)
+    for piece_count in range(2, max_pieces + 1):
+        jobs = [(blue, red, directory) for blue, red in signatures(piece_count)
+                if not os.path.exists(os.path.join(directory, signature_name(blue, red) + '.tb'))]
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for name, stats in executor.map(_solve_signature, jobs):
+                if verbose:
+                    print(f"{name}: {stats['wins']} vitórias, {stats['losses']} derrotas, {stats['draws']} empates")
+        if verbose:
+            print(f"{piece_count} peças: {len(jobs)} tabelas em {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera as tabelas de finais por análise retrógrada')
+    parser.add_argument('--pieces', type=int, default=3, help='número máximo de peças (2 a 4)')
+    parser.add_argument('--processes', type=int, default=None, help='número de processos')
+    parser.add_argument('--output', default=DEFAULT_TABLEBASE_DIR, help='diretório de saída')
+    args = parser.parse_args()
+    generate(args.pieces, args.output, args.processes)
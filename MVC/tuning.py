@@ -0,0 +1,242 @@
+import argparse
+import copy
+import random
+import time
+import numpy as np
+from MVC.distance import CLASS_OF_RANK, DISTANCE_MAPS, RIVER_SQUARES
+from MVC.engine import AI, NegamaxAI
+from MVC.evaluation import DEFAULT_WEIGHTS_PATH, DEN_BONUS_LIMITS, load_weights, save_weights
+from MVC.model import Model
+
+
+# Registo de uma posição nos ficheiros de jogos: tabuleiro e resultado do jogo (1 vitória vermelha, -1 azul, 0 empate)
+RECORD = np.dtype([('board', np.int8, (7, 6)), ('result', np.int8)])
+
+# Pesos afinados, pela ordem das colunas da matriz de características
+FEATURES = ([('piece_values', rank) for rank in range(1, 9)] + [('proximity', None)]
+            + [('den_bonuses', k) for k in range(len(DEN_BONUS_LIMITS))] + [('race', None)])
+
+_RIVER_ROWS = np.array([row for row, _ in RIVER_SQUARES])
+_RIVER_COLS = np.array([col for _, col in RIVER_SQUARES])
+_RIVER_BITS = 1 << np.arange(len(RIVER_SQUARES))
+_CLASS_OF_INDEX = np.array([CLASS_OF_RANK[abs(piece)] for piece in range(-8, 9)])  # Índice: peça + 8
+_ROWS = np.arange(7)[None, :, None]
+_COLS = np.arange(6)[None, None, :]
+
+
+def features(boards: np.ndarray) -> np.ndarray:
+    """Matriz de características da avaliação, linear nos pesos
+
+    A avaliação de um tabuleiro (do ponto de vista do vermelho) é o produto da sua linha
+    pelo vetor de pesos (ver weights_to_vector). Posições terminais não são suportadas.
+
+    Args:
+        boards (ndarray): tabuleiros empilhados, forma (N, 7, 6)
+
+    Returns:
+        ndarray: matriz (N, len(FEATURES))
+    """
+    boards = np.asarray(boards, dtype=np.intp)
+    masks = (np.abs(boards[:, _RIVER_ROWS, _RIVER_COLS]) == 1) @ _RIVER_BITS
+    sides = (boards < 0).astype(np.intp)
+    distances = DISTANCE_MAPS[sides, masks[:, None, None], _CLASS_OF_INDEX[boards + 8], _ROWS, _COLS]
+    sign = np.sign(-boards)  # +1 para as peças vermelhas, -1 para as azuis
+    ranks = np.abs(boards)
+
+    columns = [(sign * (ranks == rank)).sum(axis=(1, 2)) for rank in range(1, 9)]
+    columns.append((sign * (8 - distances)).sum(axis=(1, 2)))
+    lower = -1
+    for limit in DEN_BONUS_LIMITS:
+        columns.append((sign * ((distances > lower) & (distances <= limit))).sum(axis=(1, 2)))
+        lower = limit
+    closest_blue = np.where(boards > 0, distances, np.iinfo(np.int16).max).min(axis=(1, 2))
+    closest_red = np.where(boards < 0, distances, np.iinfo(np.int16).max).min(axis=(1, 2))
+    columns.append(closest_blue.astype(np.int64) - closest_red)
+    return np.stack(columns, axis=1).astype(np.float64)
+
+
+def weights_to_vector(weights: dict) -> np.ndarray:
+    """Converte os pesos da avaliação no vetor alinhado com FEATURES"""
+    vector = []
+    for name, index in FEATURES:
+        vector.append(weights[name] if index is None else weights[name][index])
+    return np.array(vector, dtype=np.float64)
+
+
+def vector_to_weights(vector: np.ndarray, base: dict) -> dict:
+    """Converte um vetor alinhado com FEATURES nos pesos da avaliação, partindo de base"""
+    weights = copy.deepcopy(base)
+    for (name, index), value in zip(FEATURES, vector.tolist()):
+        value = round(value, 2)
+        if index is None:
+            weights[name] = value
+        else:
+            weights[name][index] = value
+    return weights
+
+
+def iterate_chunks(paths: list, chunk_size: int = 65536):
+    """Lê as posições dos ficheiros de jogos aos blocos, sem os carregar inteiros
+
+    Args:
+        paths (list[str]): ficheiros escritos por generate_games
+        chunk_size (int): número máximo de posições por bloco
+
+    Yields:
+        tuple(ndarray, ndarray): tabuleiros (N, 7, 6) e resultados em [0, 1] do ponto de vista do vermelho
+    """
+    for path in paths:
+        with open(path, 'rb') as f:
+            while True:
+                records = np.fromfile(f, dtype=RECORD, count=chunk_size)
+                if len(records) == 0:
+                    break
+                yield records['board'], (records['result'].astype(np.float64) + 1) / 2
+
+
+def generate_games(path: str, games: int, depth: int = 2, random_plies: int = 8, max_plies: int = 200,
+                   seed: int = None, verbose: bool = True) -> int:
+    """Joga partidas entre as IAs e acrescenta as posições, com o resultado final, a path
+
+    As primeiras random_plies meias-jogadas de cada partida são aleatórias, para variar as
+    posições; as partidas que chegam a max_plies contam como empate.
+
+    Returns:
+        int: número de posições gravadas
+    """
+    rng = random.Random(seed)
+    model = Model()
+    engines = (AI(model, depth), NegamaxAI(model, depth))
+    for engine in engines:
+        engine.book = None  # O livro repetiria sempre as mesmas aberturas
+    written = 0
+    with open(path, 'ab') as f:
+        for game in range(games):
+            model.reset()
+            boards = []
+            result = 0
+            for ply in range(max_plies):
+                if ply < random_plies:
+                    moves = [((i, j), end) for i in range(7) for j in range(6)
+                             if model.game_board[i, j] != 0 and (model.game_board[i, j] < 0) == (model.turn == 1)
+                             for end in model.get_possible_moves((i, j))]
+                    move = rng.choice(moves) if moves else None
+                else:
+                    move = engines[model.turn].get_best_move()
+                if move is None:
+                    break
+                model.perform_move(*move)
+                is_win, winner = model.is_win()
+                if is_win:
+                    result = 1 if winner == 'Vermelho' else -1
+                    break
+                model.switch_turn()
+                boards.append(model.game_board.copy())
+
+            records = np.zeros(len(boards), dtype=RECORD)
+            if boards:
+                records['board'] = np.array(boards)
+            records['result'] = result
+            records.tofile(f)
+            written += len(records)
+            if verbose:
+                print(f"jogo {game + 1}/{games}: {len(boards)} posições, resultado {result}")
+    return written
+
+
+def _loss_and_gradient(matrix: np.ndarray, results: np.ndarray, vector: np.ndarray, scale: float) -> tuple:
+    """Erro quadrático da previsão logística de um bloco e o seu gradiente em relação aos pesos"""
+    predictions = 1 / (1 + np.exp(-np.clip(scale * (matrix @ vector), -500, 500)))
+    errors = predictions - results
+    loss = float(np.mean(errors ** 2))
+    gradient = matrix.T @ (2 * errors * predictions * (1 - predictions) * scale) / len(results)
+    return loss, gradient
+
+
+def fit_scale(paths: list, vector: np.ndarray, chunk_size: int = 65536, candidates=None) -> float:
+    """Escolhe a escala da logística que melhor prevê os resultados com os pesos atuais"""
+    candidates = candidates if candidates is not None else np.geomspace(1e-4, 1e-1, 31)
+    totals = np.zeros(len(candidates))
+    count = 0
+    for boards, results in iterate_chunks(paths, chunk_size):
+        evaluations = features(boards) @ vector
+        for k, scale in enumerate(candidates):
+            predictions = 1 / (1 + np.exp(-np.clip(scale * evaluations, -500, 500)))
+            totals[k] += np.sum((predictions - results) ** 2)
+        count += len(results)
+    return float(candidates[int(np.argmin(totals))]) if count else float(candidates[0])
+
+
+def tune(paths: list, weights: dict = None, epochs: int = 10, chunk_size: int = 4096, learning_rate: float = 0.5,
+         scale: float = None, verbose: bool = True) -> dict:
+    """Afina os pesos da avaliação minimizando o erro da previsão logística dos resultados (método Texel)
+
+    Cada bloco de posições dá um passo de Adam; os dados são relidos do disco em cada época.
+
+    Args:
+        paths (list[str]): ficheiros escritos por generate_games
+        weights (dict, optional): pesos iniciais. Por omissão usa os atuais
+        epochs (int): passagens completas pelos dados
+        chunk_size (int): posições por passo
+        learning_rate (float): passo de Adam, em unidades de avaliação
+        scale (float, optional): escala da logística. Por omissão é escolhida com fit_scale
+        verbose (bool): imprime o erro de cada época
+
+    Returns:
+        dict: pesos afinados
+    """
+    weights = weights or load_weights()
+    vector = weights_to_vector(weights)
+    scale = scale or fit_scale(paths, vector)
+    if verbose:
+        print(f"escala da logística: {scale:.6f}")
+
+    first_moment = np.zeros_like(vector)
+    second_moment = np.zeros_like(vector)
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-8
+    step = 0
+    for epoch in range(epochs):
+        total_loss = 0.0
+        count = 0
+        for boards, results in iterate_chunks(paths, chunk_size):
+            loss, gradient = _loss_and_gradient(features(boards), results, vector, scale)
+            step += 1
+            first_moment = beta1 * first_moment + (1 - beta1) * gradient
+            second_moment = beta2 * second_moment + (1 - beta2) * gradient ** 2
+            corrected_first = first_moment / (1 - beta1 ** step)
+            corrected_second = second_moment / (1 - beta2 ** step)
+            vector = vector - learning_rate * corrected_first / (np.sqrt(corrected_second) + epsilon)
+            total_loss += loss * len(results)
+            count += len(results)
+        if verbose and count:
+            print(f"época {epoch + 1}/{epochs}: erro {total_loss / count:.5f}")
+    return vector_to_weights(vector, weights)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Afina os pesos da avaliação a partir de jogos entre as IAs')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generate_parser = commands.add_parser('generate', help='joga partidas e grava as posições')
+    generate_parser.add_argument('output', help='ficheiro de jogos (as posições são acrescentadas)')
+    generate_parser.add_argument('--games', type=int, default=100, help='número de partidas')
+    generate_parser.add_argument('--depth', type=int, default=2, help='profundidade das IAs')
+    generate_parser.add_argument('--random-plies', type=int, default=8, help='meias-jogadas aleatórias no início')
+    generate_parser.add_argument('--seed', type=int, default=None, help='semente das jogadas aleatórias')
+
+    tune_parser = commands.add_parser('tune', help='afina os pesos com os ficheiros de jogos')
+    tune_parser.add_argument('inputs', nargs='+', help='ficheiros de jogos')
+    tune_parser.add_argument('--epochs', type=int, default=10, help='passagens pelos dados')
+    tune_parser.add_argument('--chunk', type=int, default=4096, help='posições por passo')
+    tune_parser.add_argument('--learning-rate', type=float, default=0.5, help='passo de Adam')
+    tune_parser.add_argument('--output', default=DEFAULT_WEIGHTS_PATH, help='ficheiro de pesos')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'generate':
+        count = generate_games(args.output, args.games, args.depth, args.random_plies, seed=args.seed)
+        print(f"{count} posições gravadas em {args.output} em {time.perf_counter() - start:.1f} s")
+    else:
+        tuned = tune(args.inputs, epochs=args.epochs, chunk_size=args.chunk, learning_rate=args.learning_rate)
+        save_weights(args.output, tuned)
+        print(f"pesos gravados em {args.output} em {time.perf_counter() - start:.1f} s")
@@ -38,6 +38,9 @@ class View:
                                    border_radius=50, text='Parar', font=Consts.button_font)
         self.resume_button: Button = Button("#4CAF50", 120, 30, 120, 55,
                                    border_radius=50, text='Retomar', font=Consts.button_font)
+        # Botão de velocidade do modo IAxIA, no lugar do botão Guardar
+        self.speed_button: Button = Button("#2196F3", 1000 - 150, 30, 110, 55,
+                                   border_radius=50, text='1x', font=Consts.button_font)
         self.is_paused = False
         self.show_resume_button = False  # Nova variável para controlar a exibição do botão resume
         self.is_aixai = False  # Flag para controlar se está no modo IAxIA
@@ -90,6 +93,7 @@ class View:
             elif not self.is_paused:
                 self.stop_button.draw(self.display)
                 self.show_resume_button = False  # Esconde o botão resume quando não está pausado
+            self.speed_button.draw(self.display)
 
         # Desenha o tabuleiro
         width = Consts.COLS * Consts.BLOCK_SIZE + (Consts.COLS - 1) * Consts.GAP    # Largura do tabuleiro real, NÃO DO ECRÃ
@@ -233,18 +237,32 @@ class View:
         lion_y = 550 - 120
         self.display.blit(self.lion_image, (lion_x, lion_y))
 
+    def draw_aixai_stats(self, lines: list[str]) -> None:
+        """Desenha as estatísticas do modo IAxIA à direita do tabuleiro
+
+        Args:
+            lines (list[str]): linhas de texto a desenhar
+        """
+        for i, line in enumerate(lines):
+            text = Consts.text_font.render(line, True, Consts.TEXT_COLOR)
+            self.display.blit(text, (690, 110 + i * 32))
+
     def draw_win_message(self, player) -> None:
-        """Desenha o jogador vencedor no ecrã
+        """Desenha o jogador vencedor no ecrã, ou o empate
 
         Args:
-            player (str): Cor do jogador vencedor
+            player (str): Cor do jogador vencedor, ou None para um empate
         """
-        color = (37, 154, 232) if player == "Azul" else (232, 60, 37)       # Escolhe a cor do jogador vencedor
+        if player is None:
+            color = (120, 120, 120)     # Empate: diálogo cinzento
+        else:
+            color = (37, 154, 232) if player == "Azul" else (232, 60, 37)       # Escolhe a cor do jogador vencedor
         length = 475        # Tamanho do diálogo
         pg.draw.rect(self.display, color, ((500 - (length / 2), 275 - (length / 2)), (length, length)), border_radius = 25)     # Desenha o fundo da mensagem
         
         # Desenha a mensagem de vitória
-        message = Consts.message_font.render(f'Jogador {player} venceu!', True, (245, 245, 245))    # Renderiza o conteúdo da mensagem
+        text = 'Empate!' if player is None else f'Jogador {player} venceu!'
+        message = Consts.message_font.render(text, True, (245, 245, 245))    # Renderiza o conteúdo da mensagem
         message_rect = message.get_rect(center=(500, 150))      # Define a posição da mensagem
         self.display.blit(message, message_rect)        # Desenha o conteúdo da mensagem
         
@@ -293,6 +311,8 @@ class View:
                                    border_radius=50, text='Stop', font=Consts.button_font)
         self.resume_button: Button = Button("#4CAF50", 120, 30, 90, 55,
                                    border_radius=50, text='Resume', font=Consts.button_font)
+        self.speed_button: Button = Button("#2196F3", 1000 - 150, 30, 110, 55,
+                                   border_radius=50, text='1x', font=Consts.button_font)
         self.is_paused = False
         self.show_resume_button = False
         self.is_aixai = False
@@ -0,0 +1,129 @@
+import multiprocessing
+import signal
+from MVC.engine import create_engine
+from MVC.model import Model
+from MVC.session import think
+
+
+def _worker_loop(connection, engine_type: str, level, seed: int) -> None:
+    """Ciclo do processo da IA: recebe posições, pesquisa e devolve as jogadas
+
+    O motor é criado uma vez e mantido entre pedidos, com as suas tabelas e caches. Cada
+    pedido traz uma cópia do modelo do jogo, copiada para o modelo do motor; a resposta é
+    a de think (MVC/session.py): a melhor jogada, a alternativa para os movimentos
+    proibidos e os ciclos, para o controlador não ter de pesquisar, e a resposta prevista
+    do adversário (para pensar no tempo dele).
+    """
+    # O pygame do processo pai trata SIGTERM como um evento de saída; aqui o sinal deve terminar o processo
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    model = Model()
+    ai = create_engine(model, engine_type, level, seed)
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return  # O processo pai fechou o canal
+        request_id, snapshot = message
+        vars(model).update(vars(snapshot))  # O motor guarda referências para este modelo
+        connection.send((request_id,) + think(ai))
+
+
+class EngineWorker:
+    """IA a pesquisar num processo separado, sem bloquear a interface
+
+    O controlador faz um pedido com request, consulta o resultado com poll em cada frame e
+    pode cancelar a pesquisa a qualquer momento com cancel. Cancelar uma pesquisa ainda a
+    decorrer termina o processo, por isso demora poucos milissegundos seja qual for a
+    profundidade; o processo é recriado no pedido seguinte. Os resultados de pedidos
+    anteriores são ignorados.
+
+    Args:
+        engine_type (str): tipo da IA, como em create_engine
+        level (int/str, optional): profundidade, número de simulações ou dificuldade
+        seed (int, optional): semente da IA aleatória
+    """
+    def __init__(self, engine_type: str, level=None, seed: int = None) -> None:
+        self.engine_type = engine_type
+        self.level = level
+        self.seed = seed
+        self.process = None
+        self.connection = None
+        self.request_id = 0
+        self.pending = None  # Identificador do pedido em curso, ou None
+
+    @property
+    def searching(self) -> bool:
+        """Se há uma pesquisa em curso cujo resultado ainda não foi lido"""
+        return self.pending is not None
+
+    def _start(self) -> None:
+        """Cria o processo da IA e o canal de comunicação com ele"""
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_loop,
+                                               args=(child_connection, self.engine_type, self.level, self.seed),
+                                               daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def request(self, model: Model) -> None:
+        """Pede a melhor jogada para a posição atual do modelo, cancelando o pedido anterior
+
+        Args:
+            model (Model): modelo do jogo; é enviada uma cópia, por isso pode continuar a ser usado
+        """
+        if self.pending is not None:
+            self.cancel()
+        if self.process is None or not self.process.is_alive():
+            self._start()
+        self.request_id += 1
+        self.pending = self.request_id
+        self.connection.send((self.request_id, model))
+
+    def poll(self, timeout: float = 0):
+        """Lê o resultado do pedido em curso, sem bloquear
+
+        Args:
+            timeout (float): tempo máximo em segundos à espera do resultado (0 não espera)
+
+        Returns:
+            tuple/None: (melhor jogada, jogada alternativa ou None, resposta prevista do adversário ou None),
+                        ou None se ainda não houver resultado
+        """
+        if self.pending is None or self.connection is None:
+            return None
+        try:
+            if timeout > 0 and not self.connection.poll(timeout):
+                return None
+            while self.connection.poll():
+                request_id, best_move, alternative, ponder_move = self.connection.recv()
+                if request_id == self.pending:
+                    self.pending = None
+                    return (best_move, alternative, ponder_move)
+        except (EOFError, OSError):
+            # O processo terminou inesperadamente: o próximo pedido cria outro
+            self._stop_process()
+            self.pending = None
+            return (None, None, None)
+        return None
+
+    def cancel(self) -> None:
+        """Cancela o pedido em curso; o processo só é terminado se ainda estiver a pesquisar"""
+        if self.pending is not None and self.poll() is None:
+            self._stop_process()
+        self.pending = None
+
+    def close(self) -> None:
+        """Termina o processo da IA"""
+        self.pending = None
+        self._stop_process()
+
+    def _stop_process(self) -> None:
+        """Termina o processo e fecha o canal"""
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()  # O processo não guarda nada que precise de ser fechado
+            self.process.join(timeout=0.05)
+            self.process = None
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,45 @@
+import numpy as np
+
+
+# Tabela fixa de chaves de Zobrist: uma chave de 64 bits por (peça, linha, coluna).
+# A semente é fixa para que as chaves sejam iguais entre execuções (livro de aberturas, tabelas em disco).
+_rng = np.random.default_rng(0x4A554E474C45)
+ZOBRIST_PIECES = _rng.integers(0, 2 ** 63, size=(17, 7, 6), dtype=np.int64).tolist()  # Índice: peça + 8
+ZOBRIST_RED_TO_MOVE = int(_rng.integers(0, 2 ** 63, dtype=np.int64))
+
+
+def zobrist_hash(board: np.ndarray, turn: int) -> int:
+    """Calcula de raiz a chave de Zobrist de uma posição
+
+    Args:
+        board (ndarray): tabuleiro do jogo
+        turn (int): jogador a jogar (0 Azul, 1 Vermelho)
+
+    Returns:
+        int: chave de 64 bits
+    """
+    key = ZOBRIST_RED_TO_MOVE if turn == 1 else 0
+    for (i, j), piece in np.ndenumerate(board):
+        if piece != 0:
+            key ^= ZOBRIST_PIECES[piece + 8][i][j]
+    return key
+
+
+def zobrist_move(key: int, board: np.ndarray, start: tuple, end: tuple) -> int:
+    """Atualiza uma chave de Zobrist com uma jogada, antes de a jogada ser feita no tabuleiro
+
+    Args:
+        key (int): chave da posição atual
+        board (ndarray): tabuleiro antes da jogada
+        start (tuple): posição de partida
+        end (tuple): posição de chegada
+
+    Returns:
+        int: chave da posição depois da jogada, com o outro jogador a jogar
+    """
+    piece = board[start[0], start[1]]
+    captured = board[end[0], end[1]]
+    key ^= ZOBRIST_PIECES[piece + 8][start[0]][start[1]] ^ ZOBRIST_PIECES[piece + 8][end[0]][end[1]] ^ ZOBRIST_RED_TO_MOVE
+    if captured != 0:
+        key ^= ZOBRIST_PIECES[captured + 8][end[0]][end[1]]
+    return key
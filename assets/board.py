@@ -0,0 +1,10 @@
+class BoardConsts:
+    """Constantes do tabuleiro usadas pelas regras e pelas IAs
+
+    Não importa o pygame, para o modelo e os motores poderem ser importados (processos das
+    IAs, ferramentas em linha de comandos) sem iniciar o SDL nem ler as fontes.
+    """
+    ROWS = 7
+    COLS = 6
+
+    DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
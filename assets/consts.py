@@ -1,18 +1,37 @@
 import pygame as pg
 import os
+from assets.board import BoardConsts
 
-class Consts:
-    pg.init()
+
+class _LazyFonts(type):
+    """Carrega cada fonte de Consts na primeira vez que é usada, em vez de ao importar o módulo"""
+    # Nome do atributo -> (ficheiro, tamanho)
+    FONTS = {
+        'button_font': ('button_font.ttf', 30),
+        'main_title_font': ('main_title_font.ttf', 50),
+        'sub_title_font': ('sub_title_font.ttf', 30),
+        'message_font': ('main_title_font.ttf', 35),
+        'label_font': ('main_title_font.ttf', 15),
+        'text_font': ('text_font.ttf', 24),
+    }
+
+    def __getattr__(cls, name):
+        if name not in _LazyFonts.FONTS:
+            raise AttributeError(name)
+        if not pg.font.get_init():
+            pg.font.init()
+        filename, size = _LazyFonts.FONTS[name]
+        font = pg.font.Font(os.path.join(cls.current_dir, filename), size)
+        setattr(cls, name, font)  # As próximas leituras já não passam por aqui
+        return font
+
+
+class Consts(BoardConsts, metaclass=_LazyFonts):
     # Obtém o diretório atual do arquivo
     current_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Caminhos das fontes
-    button_font = pg.font.Font(os.path.join(current_dir, 'button_font.ttf'), 30)
-    main_title_font = pg.font.Font(os.path.join(current_dir, 'main_title_font.ttf'), 50)
-    sub_title_font = pg.font.Font(os.path.join(current_dir, 'sub_title_font.ttf'), 30)
-    message_font = pg.font.Font(os.path.join(current_dir, 'main_title_font.ttf'), 35)
-    label_font = pg.font.Font(os.path.join(current_dir, 'main_title_font.ttf'), 15)
-    text_font = pg.font.Font(os.path.join(current_dir, 'text_font.ttf'), 24)
+    # As fontes (button_font, main_title_font, sub_title_font, message_font, label_font e
+    # text_font) são carregadas por _LazyFonts no primeiro uso
 
     # Dimensões da janela
     WINDOW_WIDTH = 1000
@@ -29,11 +48,8 @@ class Consts:
     trap_color = (173, 52, 62)
     den_color = (242, 175, 41)
 
-    ROWS = 7
-    COLS = 6
+    # ROWS, COLS e DIRECTIONS vêm de BoardConsts
     BLOCK_SIZE = 50
     GAP = 5
 
     FPS = 60
-
-    DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
\ No newline at end of file
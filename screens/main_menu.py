@@ -128,7 +128,6 @@ class MainMenu:
                 elif ev_type == pg.MOUSEBUTTONDOWN:     # if event was mouse button down, handle press
                     if self.buttons[0].is_over(pos):    # Handle press on PvP Button
                         pg.display.quit()
-                        time.sleep(0.2)
                         game = Controller(False)
                         
                     elif self.buttons[1].is_over(pos):  # Handle press on PvE Button
@@ -168,7 +167,10 @@ class MainMenu:
         self.negamax_button = Button("#2196F3", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 2, 
                                    button_width, button_height, border_radius=15, text="Negamax", 
                                    font=Consts.button_font)
-        self.back_button = Button("#808080", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 3, 
+        self.mcts_button = Button("#9C27B0", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 3, 
+                                   button_width, button_height, border_radius=15, text="MCTS", 
+                                   font=Consts.button_font)
+        self.back_button = Button("#808080", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 4, 
                                  button_width, button_height, border_radius=15, text="Voltar", 
                                  font=Consts.button_font)
         
@@ -176,6 +178,7 @@ class MainMenu:
         self.random_button.draw(self.display)
         self.minimax_button.draw(self.display)
         self.negamax_button.draw(self.display)
+        self.mcts_button.draw(self.display)
         self.back_button.draw(self.display)
         
         # Desenha a imagem do leão no canto inferior direito
@@ -265,6 +268,46 @@ class MainMenu:
         
         pg.display.flip()
         
+    def draw_mcts_difficulty_menu(self):
+        """Desenha o menu de seleção de dificuldade do MCTS"""
+        self.display.fill(Consts.BACKGROUND_COLOR)
+        
+        # Título
+        title = Consts.main_title_font.render("Selecione a Dificuldade", True, Consts.TEXT_COLOR)
+        title_rect = title.get_rect(center=(Consts.WINDOW_WIDTH/2, 100))
+        self.display.blit(title, title_rect)
+        
+        # Botões centralizados
+        button_width = 200
+        button_height = 60
+        button_spacing = 20
+        start_y = 150
+        
+        self.easy_button = Button("#4CAF50", Consts.WINDOW_WIDTH/2 - button_width/2, start_y, button_width, button_height, 
+                                   border_radius=15, text="Fácil", font=Consts.button_font)
+        self.medium_button = Button("#FFA500", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + button_height + button_spacing, 
+                                   button_width, button_height, border_radius=15, text="Médio", 
+                                   font=Consts.button_font)
+        self.hard_button = Button("#f44336", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 2, 
+                                   button_width, button_height, border_radius=15, text="Difícil", 
+                                   font=Consts.button_font)
+        self.back_button = Button("#808080", Consts.WINDOW_WIDTH/2 - button_width/2, start_y + (button_height + button_spacing) * 3, 
+                                 button_width, button_height, border_radius=15, text="Voltar", 
+                                 font=Consts.button_font)
+        
+        # Desenha os botões
+        self.easy_button.draw(self.display)
+        self.medium_button.draw(self.display)
+        self.hard_button.draw(self.display)
+        self.back_button.draw(self.display)
+        
+        # Desenha a imagem do leão no canto inferior direito
+        lion_x = Consts.WINDOW_WIDTH - 120
+        lion_y = Consts.WINDOW_HEIGHT - 120
+        self.display.blit(self.lion_image, (lion_x, lion_y))
+        
+        pg.display.flip()
+        
     def ai_selection_loop(self):
         """Loop do menu de seleção de IA"""
         while True:
@@ -288,6 +331,9 @@ class MainMenu:
                     elif self.negamax_button.is_over(mouse_pos):
                         self.negamax_difficulty_loop()
                         return
+                    elif self.mcts_button.is_over(mouse_pos):
+                        self.mcts_difficulty_loop()
+                        return
                     elif self.back_button.is_over(mouse_pos):
                         # Limpa a tela e redesenha o menu principal
                         self.display.fill(Consts.BACKGROUND_COLOR)
@@ -360,6 +406,36 @@ class MainMenu:
                         
             self.clock.tick(60)
 
+    def mcts_difficulty_loop(self):
+        """Loop do menu de seleção de dificuldade do MCTS"""
+        while True:
+            self.draw_mcts_difficulty_menu()
+            
+            for event in pg.event.get():
+                if event.type == pg.QUIT:
+                    pg.quit()
+                    sys.exit()
+                    
+                if event.type == pg.MOUSEBUTTONDOWN:
+                    mouse_pos = pg.mouse.get_pos()
+                    
+                    # Verifica clique nos botões
+                    if self.easy_button.is_over(mouse_pos):
+                        game = Controller(True, "mcts", 300)  # Fácil - 300 simulações
+                        return
+                    elif self.medium_button.is_over(mouse_pos):
+                        game = Controller(True, "mcts", 1000)  # Médio - 1000 simulações
+                        return
+                    elif self.hard_button.is_over(mouse_pos):
+                        game = Controller(True, "mcts", 3000)  # Difícil - 3000 simulações
+                        return
+                    elif self.back_button.is_over(mouse_pos):
+                        # Volta para o menu de seleção de IA
+                        self.ai_selection_loop()
+                        return
+                        
+            self.clock.tick(60)
+
     def draw_ai_vs_ai_selection_menu(self, player_color):
         """Desenha o menu de seleção de IA para IAxIA"""
         self.display.fill(Consts.BACKGROUND_COLOR)
@@ -370,18 +446,20 @@ class MainMenu:
         title_rect = title.get_rect(center=(Consts.WINDOW_WIDTH/2, 100))
         self.display.blit(title, title_rect)
         
-        # Botões organizados em duas colunas
+        # Botões organizados em três colunas
         button_width = 200
         button_height = 60
         button_spacing = 20
         start_y = 150
         
         # Posições para coluna esquerda
-        left_x = Consts.WINDOW_WIDTH/2 - button_width - button_spacing/2
+        left_x = Consts.WINDOW_WIDTH/2 - button_width * 1.5 - button_spacing
+        # Posições para coluna central
+        right_x = Consts.WINDOW_WIDTH/2 - button_width/2
         # Posições para coluna direita
-        right_x = Consts.WINDOW_WIDTH/2 + button_spacing/2
+        mcts_x = Consts.WINDOW_WIDTH/2 + button_width/2 + button_spacing
         
-        # Criação dos botões (organizados em duas colunas)
+        # Criação dos botões (organizados em três colunas)
         # Coluna esquerda
         self.random_button = Button("#DCDCDC", left_x, start_y, button_width, button_height, 
                                     border_radius=15, text="Aleatório", font=Consts.button_font)
@@ -406,7 +484,18 @@ class MainMenu:
                                    button_width, button_height, border_radius=15, text="Negamax 5", 
                                    font=Consts.button_font)
         
-        # Botão voltar na coluna direita
+        # Coluna do MCTS
+        self.mcts1_button = Button("#9C27B0", mcts_x, start_y, 
+                                   button_width, button_height, border_radius=15, text="MCTS 300", 
+                                   font=Consts.button_font)
+        self.mcts2_button = Button("#9C27B0", mcts_x, start_y + button_height + button_spacing, 
+                                   button_width, button_height, border_radius=15, text="MCTS 1000", 
+                                   font=Consts.button_font)
+        self.mcts3_button = Button("#9C27B0", mcts_x, start_y + (button_height + button_spacing) * 2, 
+                                   button_width, button_height, border_radius=15, text="MCTS 3000", 
+                                   font=Consts.button_font)
+        
+        # Botão voltar na coluna central
         self.back_button = Button("#808080", right_x, start_y + (button_height + button_spacing) * 3, 
                                  button_width, button_height, border_radius=15, text="Voltar", 
                                  font=Consts.button_font)
@@ -419,6 +508,9 @@ class MainMenu:
         self.negamax2_button.draw(self.display)
         self.negamax3_button.draw(self.display)
         self.negamax4_button.draw(self.display)
+        self.mcts1_button.draw(self.display)
+        self.mcts2_button.draw(self.display)
+        self.mcts3_button.draw(self.display)
         self.back_button.draw(self.display)
         
         # Desenha a imagem do leão no canto inferior direito
@@ -471,6 +563,12 @@ class MainMenu:
                         return ("negamax", 4)
                     elif self.negamax4_button.is_over(mouse_pos):
                         return ("negamax", 5)
+                    elif self.mcts1_button.is_over(mouse_pos):
+                        return ("mcts", 300)
+                    elif self.mcts2_button.is_over(mouse_pos):
+                        return ("mcts", 1000)
+                    elif self.mcts3_button.is_over(mouse_pos):
+                        return ("mcts", 3000)
                     elif self.back_button.is_over(mouse_pos):
                         # Limpa a tela e redesenha o menu principal
                         self.display.fill(Consts.BACKGROUND_COLOR)
@@ -491,7 +589,6 @@ class MainMenu:
         
         # Fecha a tela atual
         pg.display.quit()
-        time.sleep(0.2)
         
         try:
             # Carrega o jogo salvo
@@ -0,0 +1,39 @@
+from MVC.engine import AI
+from MVC.material import MaterialTable, sample_signature
+from MVC.model import Model
+
+
+def _engine_with_material_entry(scale, outcome):
+    """Motor com uma tabela de material que só conhece a assinatura da posição inicial"""
+    model = Model()
+    engine = AI(model, 2)
+    engine.material_table = MaterialTable(None)
+    engine.material_table.update({model.material: (scale, outcome)})
+    return model, engine
+
+
+def test_evaluate_board_cache_hit_keeps_material_scale():
+    model, engine = _engine_with_material_entry(0.5, None)
+    model.perform_move((6, 0), (5, 0))  # Posição com avaliação diferente de zero
+
+    first = engine.evaluate_board()
+    second = engine.evaluate_board()  # Vem da cache de avaliações
+
+    assert first == second
+    assert first == engine.evaluation.evaluate(model.game_board) * 0.5
+
+
+def test_evaluate_board_cache_hit_keeps_known_draw():
+    model, engine = _engine_with_material_entry(1.0, MaterialTable.DRAW)
+
+    first = engine.evaluate_board()
+    second = engine.evaluate_board()
+
+    assert first == second == engine.draw_score(True)
+
+
+def test_sampled_material_entries_do_not_end_search():
+    scale, outcome = sample_signature((8,), (1,), samples=4, depth=1, max_plies=10, seed=1)
+
+    assert outcome is None
+    assert 0.0 <= scale <= 1.0
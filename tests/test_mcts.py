@@ -0,0 +1,29 @@
+from MVC.mcts import MCTSAI
+from MVC.model import Model
+
+
+def test_reused_root_excludes_forbidden_move():
+    model = Model()
+    ai = MCTSAI(model, iterations=400, seed=1)
+    ai.book = None
+    ai.tablebase = None
+
+    # Pesquisa e joga a jogada escolhida e a resposta mais explorada, para a árvore ser reaproveitada
+    move = ai.get_best_move()
+    reply = ai.get_ponder_move(move)
+    child = next(node for node in ai.root.children if node.move == move)
+    grandchild = next(node for node in child.children if node.move == reply)
+    for played in (move, reply):
+        model.perform_move(*played)
+        model.switch_turn()
+
+    # A jogada mais explorada do nó reaproveitado passa a ser o movimento proibido
+    forbidden = max(grandchild.children, key=lambda node: node.visits).move
+    model.forbidden_move = forbidden
+    model.cycle_detected = True
+
+    best = ai.get_best_move()
+
+    assert ai.root is grandchild
+    assert best != forbidden
+    assert forbidden not in ai.root_statistics()
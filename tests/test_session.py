@@ -0,0 +1,64 @@
+from MVC.session import GameSession
+
+
+def _red_moves(model):
+    """Jogadas possíveis do vermelho na posição do modelo"""
+    return [((i, j), end) for i in range(7) for j in range(6) if model.game_board[i, j] < 0
+            for end in model.get_possible_moves((i, j))]
+
+
+def _pve_session_in_cycle():
+    """Sessão PvE (humano azul, IA vermelha) na vez da IA, com um ciclo detetado"""
+    session = GameSession(None, ("minimax", 2))
+    session.model.turn = 1
+    session.model.cycle_detected = True
+    return session
+
+
+def test_pve_plays_best_move_when_cycle_detected():
+    session = _pve_session_in_cycle()
+    best, alternative = _red_moves(session.model)[:2]
+
+    finished = session.apply_ai_result((best, alternative, None))
+
+    assert not finished
+    assert session.model.last_move_coords == best
+    assert session.model.turn == 0
+
+
+def test_pve_without_alternative_does_not_end_game():
+    session = _pve_session_in_cycle()
+    best = _red_moves(session.model)[0]
+
+    assert not session.apply_ai_result((best, None, None))
+    assert not session.finished
+    assert session.model.last_move_coords == best
+
+
+def test_pve_engine_move_from_cycle_position():
+    session = _pve_session_in_cycle()
+
+    assert not session.play_ai_move()
+    assert session.model.last_move_coords in _red_moves(_pve_session_in_cycle().model)
+    assert session.model.turn == 0
+
+
+def test_aixai_forces_alternative_in_cycle():
+    session = GameSession(("minimax", 2), ("minimax", 2), break_cycles=True)
+    session.model.turn = 1
+    session.model.cycle_detected = True
+    best, alternative = _red_moves(session.model)[:2]
+
+    session.apply_ai_result((best, alternative, None))
+
+    assert session.model.last_move_coords == alternative
+
+
+def test_aixai_cycle_without_alternative_is_draw():
+    session = GameSession(("minimax", 2), ("minimax", 2), break_cycles=True)
+    session.model.turn = 1
+    session.model.cycle_detected = True
+    best = _red_moves(session.model)[0]
+
+    assert session.apply_ai_result((best, None, None))
+    assert session.finished and session.winner is None
@@ -0,0 +1,18 @@
+from MVC.tablebase import Tablebase, decode_result, encode_result
+
+
+def test_encode_decode_round_trip():
+    for distance in range(1, 252, 2):
+        assert decode_result(encode_result(True, distance)) == (Tablebase.WIN, distance)
+    for distance in range(0, 253, 2):
+        assert decode_result(encode_result(False, distance)) == (Tablebase.LOSS, distance)
+
+
+def test_long_distances_keep_the_result():
+    for distance in (253, 299, 300, 1001):
+        won = distance % 2 == 1
+        result, decoded = decode_result(encode_result(won, distance))
+        assert result == (Tablebase.WIN if won else Tablebase.LOSS)
+        assert decoded <= distance
+    assert decode_result(encode_result(True, 300)) == (Tablebase.WIN, 251)
+    assert decode_result(encode_result(False, 300)) == (Tablebase.LOSS, 252)